@@ -0,0 +1,458 @@
+"""
+Benchmarks for parsing API responses into models
+
+Uses synthetic payloads shaped like real API responses, so no API connection is required. Run using
+
+    poetry run python dev/benchmark.py [rows]
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from easyverein import EasyvereinAPI, MemoryCache, SQLiteCache
+from easyverein.core.responses import page_adapter
+from easyverein.core.serializer import loads
+from easyverein.models import Booking, Invoice, Member
+from easyverein.models.query import parse_query, query_model
+from easyverein.models.slim import to_slim
+from easyverein.modules.mixins.helper import parse_models, parse_raw
+from pydantic import BaseModel
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+
+BASE_URL = "https://easyverein.com/api/v2.0"
+
+
+def contact_details_payload(i: int) -> dict[str, Any]:
+    return {
+        "id": 10_000 + i,
+        "org": f"{BASE_URL}/organization/1",
+        "_isCompany": False,
+        "salutation": "Frau" if i % 2 else "Herr",
+        "firstName": f"First {i}",
+        "familyName": f"Family {i}",
+        "dateOfBirth": "1990-01-31",
+        "privateEmail": f"member{i}@example.com",
+        "primaryEmail": f"member{i}@example.com",
+        "_preferredEmailField": 1,
+        "preferredCommunicationWay": 0,
+        "companyName": "",
+        "mobilePhone": "+49 170 0000000",
+        "street": "Hauptstraße 1",
+        "city": "Berlin",
+        "zip": "10115",
+        "country": "Deutschland",
+        "balance": 12.5,
+        "iban": "DE02120300000000202051",
+        "bic": "BYLADEM1001",
+        "sepaMandate": f"M-{i}",
+        "sepaDate": "2020-05-01",
+        "methodOfPayment": 1,
+    }
+
+
+def member_payload(i: int) -> dict[str, Any]:
+    return {
+        "id": i + 1,
+        "org": f"{BASE_URL}/organization/1",
+        "joinDate": "2020-01-01",
+        "resignationDate": None,
+        "_isChairman": False,
+        "_chairmanPermissionGroup": "",
+        "membershipNumber": str(i),
+        "contactDetails": contact_details_payload(i),
+        "_paymentStartDate": "2020-01-01",
+        "paymentAmount": 60.0,
+        "paymentIntervallMonths": 12,
+        "useBalanceForMembershipFee": False,
+        "_isApplication": False,
+        "signatureText": "",
+        "relatedMembers": [],
+        "sepaMandateFile": "",
+        "integrationLsbSport": [],
+        "integrationDosbSport": [],
+        "customFields": [f"{BASE_URL}/member/{i + 1}/custom-fields/{i * 3 + n}" for n in range(3)],
+        "memberGroups": [f"{BASE_URL}/member/{i + 1}/member-groups/{i * 2 + n}" for n in range(2)],
+    }
+
+
+def invoice_payload(i: int) -> dict[str, Any]:
+    return {
+        "id": i + 1,
+        "org": f"{BASE_URL}/organization/1",
+        "gross": True,
+        "date": "2024-03-01",
+        "dateItHappend": "2024-02-28",
+        "invNumber": f"2024-{i:05d}",
+        "receiver": f"First {i} Family {i}\nHauptstraße 1\n10115 Berlin",
+        "description": "Membership fee",
+        "totalPrice": 60.0,
+        "tax": 0.0,
+        "taxRate": 0.0,
+        "relatedAddress": f"{BASE_URL}/contact-details/{10_000 + i}",
+        "kind": "membership",
+        "selectionAcc": f"{BASE_URL}/billing-account/1",
+        "refNumber": f"RF{i}",
+        "paymentDifference": 0.0,
+        "isDraft": False,
+        "isReceipt": False,
+        "isTemplate": False,
+        "isRequest": True,
+        "payedFromUser": f"{BASE_URL}/member/{i + 1}",
+        "callStateDelayDays": 0,
+        "accnumber": 0,
+        "relatedBookings": [f"{BASE_URL}/booking/{i + 1}"],
+        "invoiceItems": [f"{BASE_URL}/invoice-item/{i * 2 + n}" for n in range(2)],
+    }
+
+
+def booking_payload(i: int) -> dict[str, Any]:
+    return {
+        "id": i + 1,
+        "org": f"{BASE_URL}/organization/1",
+        "amount": 60.0,
+        "bankAccount": f"{BASE_URL}/bank-account/1",
+        "billingAccount": f"{BASE_URL}/billing-account/1",
+        "description": f"Membership fee {i}",
+        "date": "2024-03-01T12:00:00",
+        "receiver": f"First {i} Family {i}",
+        "billingId": f"2024-{i:05d}",
+        "blocked": False,
+        "paymentDifference": 0.0,
+        "counterpartIban": "DE02120300000000202051",
+        "counterpartBic": "BYLADEM1001",
+        "twingleDonation": False,
+        "bookingProject": "",
+        "sphere": 1,
+        "relatedInvoice": [f"{BASE_URL}/invoice/{i + 1}"],
+    }
+
+
+PAYLOADS: dict[type[BaseModel], Callable[[int], dict[str, Any]]] = {
+    Member: member_payload,
+    Invoice: invoice_payload,
+    Booking: booking_payload,
+}
+
+
+def measure(func: Callable[[], Any], number: int = 5) -> float:
+    """
+    Returns the best time of `number` runs in seconds
+    """
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def memory_overhead(func: Callable[[], Any]) -> int:
+    """
+    Returns the memory allocated temporarily while running `func` in bytes, that is the peak memory usage
+    minus the memory still held by the result
+    """
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - current
+
+
+def benchmark_parse_models(rows: int) -> None:
+    print(f"parse_models, {rows} rows")
+    print(f"{'model':<10}{'per item':>12}{'batched':>12}{'speedup':>10}")
+    for model, payload in PAYLOADS.items():
+        data = [payload(i) for i in range(rows)]
+
+        per_item = measure(lambda: [model.model_validate(d) for d in data])
+        batched = measure(lambda: parse_models(data, model))
+
+        print(f"{model.__name__:<10}{per_item * 1000:>10.1f}ms{batched * 1000:>10.1f}ms{per_item / batched:>9.2f}x")
+
+
+def benchmark_raw_validation(rows: int) -> None:
+    print(f"Decoding and validating response pages of 100 rows, {rows} rows in total")
+    print(f"{'model':<10}{'via dicts':>12}{'raw bytes':>12}{'speedup':>10}{'temp dicts':>12}{'temp raw':>10}")
+    for model, payload in PAYLOADS.items():
+        pages = [
+            json.dumps(
+                {"count": rows, "next": None, "results": [payload(i) for i in range(start, start + 100)]}
+            ).encode()
+            for start in range(0, rows, 100)
+        ]
+        adapter = page_adapter(model)
+
+        def via_dicts() -> list[Any]:
+            return [parse_models(loads(page)["results"], model) for page in pages]
+
+        def raw() -> list[Any]:
+            return [adapter.validate_json(page).results for page in pages]
+
+        dicts_time, raw_time = measure(via_dicts), measure(raw)
+        dicts_peak, raw_peak = memory_overhead(via_dicts), memory_overhead(raw)
+
+        print(
+            f"{model.__name__:<10}{dicts_time * 1000:>10.1f}ms{raw_time * 1000:>10.1f}ms{dicts_time / raw_time:>9.2f}x"
+            f"{dicts_peak / 2**20:>10.1f}MB{raw_peak / 2**20:>8.1f}MB"
+        )
+
+
+def benchmark_trusted(rows: int) -> None:
+    print(f"Validated, trusted and raw results, {rows} rows")
+    print(f"{'model':<10}{'validated':>12}{'trusted':>12}{'speedup':>10}{'raw':>12}{'speedup':>10}")
+    for model, payload in PAYLOADS.items():
+        data = [payload(i) for i in range(rows)]
+
+        validated = measure(lambda: parse_models(data, model))
+        trusted = measure(lambda: parse_models(data, model, trusted=True))
+        raw = measure(lambda: parse_raw(data, model))
+
+        print(
+            f"{model.__name__:<10}{validated * 1000:>10.1f}ms{trusted * 1000:>10.1f}ms{validated / trusted:>9.2f}x"
+            f"{raw * 1000:>10.1f}ms{validated / raw:>9.2f}x"
+        )
+
+
+def retained_memory(func: Callable[[], Any]) -> int:
+    """
+    Returns the memory held by the result of `func` in bytes
+    """
+    tracemalloc.start()
+    result = func()  # noqa: F841
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def benchmark_slim(rows: int) -> None:
+    print(f"Memory held by {rows} objects with all fields and with a query of 5 fields")
+    print(f"{'model':<10}{'models':>10}{'slim':>10}{'saving':>8}{'5 fields':>10}{'slim':>10}{'saving':>8}")
+    for model, payload in PAYLOADS.items():
+        data = [payload(i) for i in range(rows)]
+        queried = [{key: row[key] for key in list(row)[:5]} for row in data]
+
+        line = f"{model.__name__:<10}"
+        for rows_data in (data, queried):
+            full = retained_memory(lambda: parse_models(rows_data, model))  # noqa: B023
+            slim = retained_memory(lambda: [to_slim(m) for m in parse_models(rows_data, model)])  # noqa: B023
+            line += f"{full / 2**20:>8.1f}MB{slim / 2**20:>8.1f}MB{full / slim:>7.1f}x"
+        print(line)
+
+
+QUERIES: dict[type[BaseModel], str] = {
+    Member: "{id,membershipNumber,joinDate,_isChairman}",
+    Invoice: "{id,invNumber,totalPrice,date}",
+    Booking: "{id,amount,date,receiver}",
+}
+
+
+def benchmark_query(rows: int) -> None:
+    print(f"Validating response pages of 100 rows for a narrow query, {rows} rows in total")
+    print(f"{'model':<10}{'full model':>12}{'query model':>13}{'speedup':>10}  query")
+    for model, payload in PAYLOADS.items():
+        query = QUERIES[model]
+        fields = [name for name, _ in parse_query(query) or ()]
+        data = [{key: row[key] for key in fields} for row in (payload(i) for i in range(rows))]
+        pages = [
+            json.dumps({"count": rows, "next": None, "results": data[start : start + 100]}).encode()
+            for start in range(0, rows, 100)
+        ]
+        full_adapter, query_adapter = page_adapter(model), page_adapter(query_model(model, query))
+
+        full = measure(lambda: [full_adapter.validate_json(page) for page in pages])  # noqa: B023
+        narrow = measure(lambda: [query_adapter.validate_json(page) for page in pages])  # noqa: B023
+
+        print(f"{model.__name__:<10}{full * 1000:>10.1f}ms{narrow * 1000:>11.1f}ms{full / narrow:>9.2f}x  {query}")
+
+
+INVOICE_REFERENCES = {"id", "org", "relatedAddress", "selectionAcc", "payedFromUser", "relatedBookings", "invoiceItems"}
+
+
+def reference_payloads(rows: int) -> dict[type[BaseModel], list[dict[str, Any]]]:
+    """
+    Objects consisting mostly of references, like the ones returned for queries without nested objects
+    """
+    members = [
+        {
+            "id": i + 1,
+            "org": f"{BASE_URL}/organization/1",
+            "contactDetails": f"{BASE_URL}/contact-details/{10_000 + i}",
+            "relatedMembers": [f"{BASE_URL}/member/{i + 2}"],
+            "customFields": [f"{BASE_URL}/member/{i + 1}/custom-fields/{i * 3 + n}" for n in range(3)],
+            "memberGroups": [f"{BASE_URL}/member/{i + 1}/member-groups/{i * 2 + n}" for n in range(2)],
+        }
+        for i in range(rows)
+    ]
+    invoices = [
+        {key: value for key, value in invoice_payload(i).items() if key in INVOICE_REFERENCES} for i in range(rows)
+    ]
+    return {Member: members, Invoice: invoices}
+
+
+def benchmark_references(rows: int) -> None:
+    print(f"Validating response pages of 100 rows, {rows} rows in total")
+    print(f"{'model':<10}{'full objects':>14}{'references':>12}")
+    references = reference_payloads(rows)
+    for model in references:
+        line = f"{model.__name__:<10}"
+        for data in ([PAYLOADS[model](i) for i in range(rows)], references[model]):
+            pages = [
+                json.dumps({"count": rows, "next": None, "results": data[start : start + 100]}).encode()
+                for start in range(0, rows, 100)
+            ]
+            adapter = page_adapter(model)
+            elapsed = measure(lambda: [adapter.validate_json(page) for page in pages])  # noqa: B023
+            line += f"{elapsed * 1000:>12.1f}ms"
+        print(line)
+
+
+class LocalAdapter(BaseAdapter):
+    """
+    Answers every request with the same body without touching the network, so only the client is measured
+    """
+
+    def __init__(self, body: bytes, etag: str | None = None):
+        super().__init__()
+        self.body = body
+        self.etag = etag
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        response = Response()
+        response.status_code = 200
+        response._content = self.body
+        if self.etag:
+            response.headers["ETag"] = self.etag
+            if request.headers.get("If-None-Match") == self.etag:
+                response.status_code = 304
+                response._content = b""
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def benchmark_cache(calls: int = 10_000) -> None:
+    print(f"get_by_id of a single member, {calls} calls, served locally without network")
+    session = Session()
+    session.mount("https://", LocalAdapter(json.dumps(member_payload(1)).encode()))
+    with tempfile.TemporaryDirectory() as directory:
+        caches = (("no cache", None), ("memory hit", MemoryCache()), ("sqlite hit", SQLiteCache(f"{directory}/c.db")))
+        for name, cache in caches:
+            api = EasyvereinAPI("token", session=session, cache=cache, log_requests=False)
+            api.member.get_by_id(1)
+            elapsed = measure(lambda: [api.member.get_by_id(1) for _ in range(calls)], number=3)  # noqa: B023
+            print(f"{name:<12}{elapsed / calls * 1_000_000:>8.1f}µs per call")
+            if isinstance(cache, SQLiteCache):
+                cache.close()
+
+
+def benchmark_polling(size: int = 100, polls: int = 50) -> None:
+    print(f"Polling get_all of {size} unchanged members, {polls} polls, served locally without network")
+    body = json.dumps({"count": size, "next": None, "results": [member_payload(i) for i in range(size)]}).encode()
+    variants = (
+        ("plain", LocalAdapter(body), False),
+        ("same body", LocalAdapter(body), True),
+        ("304", LocalAdapter(body, etag='"v1"'), True),
+    )
+    for name, adapter, conditional in variants:
+        session = Session()
+        session.mount("https://", adapter)
+        api = EasyvereinAPI("token", session=session, conditional_requests=conditional, log_requests=False)
+        api.member.get_all(limit_per_page=size)
+        elapsed = measure(lambda: [api.member.get_all(limit_per_page=size) for _ in range(polls)], number=3)  # noqa: B023
+        print(f"{name:<12}{elapsed / polls * 1000:>8.2f}ms per poll")
+
+
+class SlowAdapter(LocalAdapter):
+    """
+    Like `LocalAdapter`, but simulates the network latency of a real request and counts the requests sent
+    """
+
+    def __init__(self, body: bytes, latency: float):
+        super().__init__(body)
+        self.latency = latency
+        self.sent = 0
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        self.sent += 1
+        time.sleep(self.latency)
+        return super().send(request, *args, **kwargs)
+
+
+def benchmark_coalescing(threads: int = 20, latency: float = 0.05) -> None:
+    print(f"Burst of {threads} threads reading the same member, {latency * 1000:.0f}ms simulated latency")
+    body = json.dumps(member_payload(1)).encode()
+    for coalesce in (False, True):
+        adapter = SlowAdapter(body, latency)
+        session = Session()
+        session.mount("https://", adapter)
+        api = EasyvereinAPI("token", session=session, coalesce_reads=coalesce, log_requests=False)
+        barrier = threading.Barrier(threads)
+
+        def read() -> None:
+            barrier.wait()
+            api.member.get_by_id(1)  # noqa: B023
+
+        workers = [threading.Thread(target=read) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        name = "coalesced" if coalesce else "plain"
+        print(f"{name:<12}{adapter.sent:>4} requests{elapsed * 1000:>8.1f}ms")
+
+
+STARTUP_STEPS = {
+    "import easyverein": "import easyverein",
+    "create client": "easyverein.EasyvereinAPI('token')",
+    "first validation": "easyverein.models.Member.model_validate({'id': 1, 'contactDetails': {'id': 2}})",
+}
+
+
+def benchmark_startup(runs: int = 15) -> None:
+    """
+    Measures the cold start in fresh interpreters. The dependencies are imported before starting the clock, so
+    only the time spent in this library is measured.
+    """
+    print(f"Cold start, median of {runs} fresh interpreters")
+    lines = ["import pydantic, requests, orjson", "from time import perf_counter"]
+    for step, code in STARTUP_STEPS.items():
+        lines += ["start = perf_counter()", code, f"print({step!r}, perf_counter() - start)"]
+    timings: dict[str, list[float]] = {step: [] for step in STARTUP_STEPS}
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", "\n".join(lines)], capture_output=True, text=True, check=True)
+        for line in output.stdout.splitlines():
+            step, elapsed = line.rsplit(" ", 1)
+            timings[step].append(float(elapsed))
+    for step, samples in timings.items():
+        print(f"{step:<20}{statistics.median(samples) * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    benchmark_parse_models(rows)
+    print()
+    benchmark_raw_validation(rows)
+    print()
+    benchmark_trusted(rows)
+    print()
+    benchmark_slim(rows)
+    print()
+    benchmark_query(rows)
+    print()
+    benchmark_references(rows)
+    print()
+    benchmark_cache()
+    print()
+    benchmark_polling()
+    print()
+    benchmark_coalescing()
+    print()
+    benchmark_startup()
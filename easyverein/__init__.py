@@ -6,9 +6,15 @@ __version__ = "2.5.0"
 
 # Export EasyVerein API directly
 from .api import EasyvereinAPI  # noqa: F401
+from .async_api import AsyncEasyvereinAPI  # noqa: F401
+from .core.cache import CacheStats, MemoryCache, ResponseCache, SQLiteCache  # noqa: F401
 from .core.exceptions import (  # noqa: F401
     EasyvereinAPIException,
     EasyvereinAPINotFoundException,
+    EasyvereinAPITimeoutException,
     EasyvereinAPITooManyRetriesException,
 )
+from .core.rate_limit import TokenBucket  # noqa: F401
 from .core.responses import BearerToken
+from .core.retry import RetryPolicy  # noqa: F401
+from .core.types import Ref  # noqa: F401
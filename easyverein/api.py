@@ -3,10 +3,17 @@ Main EasyVerein API class
 """
 
 import logging
-from typing import Callable, cast
+from contextlib import AbstractContextManager
+from typing import Any, Callable, cast
 
-from .core.client import EasyvereinClient
+import requests
+
+from .core.cache import ResponseCache
+from .core.client import DEFAULT_TIMEOUT, EasyvereinClient
+from .core.deadline import deadline
+from .core.rate_limit import TokenBucket
 from .core.responses import BearerToken
+from .core.retry import RetryPolicy
 from .modules.billing_account import BillingAccountMixin
 from .modules.booking import BookingMixin
 from .modules.contact_details import ContactDetailsMixin
@@ -16,6 +23,7 @@ from .modules.invoice_item import InvoiceItemMixin
 from .modules.member import MemberMixin
 from .modules.member_group import MemberGroupMixin
 from .modules.mixins.helper import parse_models
+from .modules.reference_data import ReferenceData
 
 SUPPORTED_API_VERSIONS = ["v2.0"]
 
@@ -30,9 +38,58 @@ class EasyvereinAPI:
         auto_retry=False,
         token_refresh_callback: Callable[[BearerToken], None] | Callable[[], None] | None = None,
         auto_refresh_token: bool = False,
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limit: float | TokenBucket | None = None,
+        rate_limit_burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float | None, float | None] | None = DEFAULT_TIMEOUT,
+        log_requests: bool = True,
+        trusted_reads: bool = False,
+        cache: ResponseCache | None = None,
+        reference_data_ttl: float = 300.0,
+        conditional_requests: bool = False,
+        coalesce_reads: bool = False,
     ):
         """
-        Constructor setting API key and logger. Test
+        Constructor setting API key and logger.
+
+        Connections are pooled and kept alive in a `requests.Session`. The pool can be sized using
+        `pool_connections` (number of hosts to keep pools for) and `pool_maxsize` (connections kept per host),
+        `pool_block` makes requests wait for a free connection instead of opening additional ones. Alternatively
+        a preconfigured `session` can be passed, which is then used as-is.
+
+        Setting `rate_limit` (requests per second, `rate_limit_burst` requests at once) enables a client side
+        token bucket shared by all endpoints, which delays requests before the API would reject them. A
+        `TokenBucket` instance can be passed instead to share one limiter between several clients.
+
+        Transient errors (429, 502, 503, 504 and connection errors) are retried according to `retry_policy`.
+        Setting `auto_retry` without a policy uses the default `RetryPolicy`.
+
+        Every request is sent with `timeout`, either seconds or a `(connect, read)` tuple. The default waits
+        10 seconds for a connection and 60 seconds for data, `None` disables timeouts. Use `deadline` to limit
+        the total time of an operation spanning several requests.
+
+        Setting `log_requests` to `False` drops all debug and info messages logged per request, which is useful
+        for high-volume batch jobs. Warnings and errors are still logged.
+
+        Setting `trusted_reads` makes `get`, `get_all` and `iter_all` of all endpoints skip validation and build
+        the returned models directly from the API response. Can be overridden per call using `trusted`.
+
+        Passing a `cache`, e.g. a `MemoryCache`, serves repeated `get` and `get_by_id` calls from the cache while
+        its entries are valid. Writes to an endpoint invalidate all cached responses of that endpoint.
+
+        Custom fields and member groups used by helpers like `ensure_set` and `add_to_group` are loaded once
+        into `reference_data` and reloaded after `reference_data_ttl` seconds.
+
+        Setting `conditional_requests` sends reads with the `If-None-Match` and `If-Modified-Since` headers of the
+        previous response to the same URL. Unmodified (304) and byte-for-byte unchanged responses are not decoded
+        again, but return the models of the previous call, which makes polling `get_all` much cheaper.
+
+        Setting `coalesce_reads` lets identical `get` and `get_by_id` calls running at the same time, e.g. in
+        several threads, share a single request. All callers receive the same model instances.
         """
 
         super().__init__()
@@ -54,19 +111,68 @@ class EasyvereinAPI:
         if (auto_refresh_token or token_refresh_callback) and api_version != "v2.0":
             raise ValueError("Token refresh is only supported in API version v2.0")
 
+        # Requests of all endpoints share a single rate limiter
+        if isinstance(rate_limit, TokenBucket):
+            rate_limiter: TokenBucket | None = rate_limit
+        else:
+            rate_limiter = TokenBucket(rate_limit, rate_limit_burst) if rate_limit else None
+
         self.token_refresh_callback = token_refresh_callback
         self.auto_refresh_token = auto_refresh_token
-        self.c = EasyvereinClient(api_key, api_version, base_url, self.logger, self, auto_retry)
+        self.c = EasyvereinClient(
+            api_key,
+            api_version,
+            base_url,
+            self.logger,
+            self,
+            auto_retry,
+            session=session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            trusted_reads=trusted_reads,
+            cache=cache,
+            conditional_requests=conditional_requests,
+            coalesce_reads=coalesce_reads,
+            log_requests=log_requests,
+        )
 
         # Add methods
-        self.booking = BookingMixin(self.c, self.logger)
-        self.billing_account = BillingAccountMixin(self.c, self.logger)
-        self.contact_details = ContactDetailsMixin(self.c, self.logger)
-        self.custom_field = CustomFieldMixin(self.c, self.logger)
-        self.invoice = InvoiceMixin(self.c, self.logger)
-        self.invoice_item = InvoiceItemMixin(self.c, self.logger)
-        self.member = MemberMixin(self.c, self.logger)
-        self.member_group = MemberGroupMixin(self.c, self.logger)
+        self.booking = BookingMixin(self.c, self.c.logger)
+        self.billing_account = BillingAccountMixin(self.c, self.c.logger)
+        self.contact_details = ContactDetailsMixin(self.c, self.c.logger)
+        self.custom_field = CustomFieldMixin(self.c, self.c.logger)
+        self.invoice = InvoiceMixin(self.c, self.c.logger)
+        self.invoice_item = InvoiceItemMixin(self.c, self.c.logger)
+        self.member = MemberMixin(self.c, self.c.logger)
+        self.member_group = MemberGroupMixin(self.c, self.c.logger)
+
+        # Custom fields and member groups, loaded once and shared by helpers like `ensure_set` and `add_to_group`
+        self.reference_data = ReferenceData(self, reference_data_ttl)
+        self.c.write_listeners.append(self.reference_data.invalidate)
+
+    def close(self) -> None:
+        """
+        Closes the connection pool of the underlying client
+        """
+        self.c.close()
+
+    def __enter__(self) -> "EasyvereinAPI":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def deadline(seconds: float) -> AbstractContextManager[None]:
+        """
+        Limits the total time of all API calls made inside the `with` block, including retries, pagination and
+        helpers performing several requests. Raises `EasyvereinAPITimeoutException` once the time is up.
+        """
+        return deadline(seconds)
 
     def handle_token_refresh(self):
         """
@@ -86,7 +192,7 @@ class EasyvereinAPI:
             self.logger.error("Refresh token is only available for API v2.0")
             raise ValueError("Refresh token is only available for API v2.0")
 
-        response = self.c.fetch_one(self.c.get_url("/refresh-token"))
+        response = self.c.fetch_one(self.c.get_url("/refresh-token"), cache=False)
         token = parse_models(response.result, BearerToken)
         if not token:
             self.logger.error(f"Error refreshing token: {response.result}")
@@ -0,0 +1,196 @@
+"""
+Asynchronous EasyVerein API class
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, cast
+
+from .api import SUPPORTED_API_VERSIONS
+from .core.async_client import AsyncEasyvereinClient
+from .core.cache import ResponseCache
+from .core.client import DEFAULT_TIMEOUT
+from .core.deadline import deadline
+from .core.rate_limit import TokenBucket
+from .core.responses import BearerToken
+from .core.retry import RetryPolicy
+from .modules.billing_account import AsyncBillingAccountMixin
+from .modules.booking import AsyncBookingMixin
+from .modules.contact_details import AsyncContactDetailsMixin
+from .modules.custom_field import AsyncCustomFieldMixin
+from .modules.invoice import AsyncInvoiceMixin
+from .modules.invoice_item import AsyncInvoiceItemMixin
+from .modules.member import AsyncMemberMixin
+from .modules.member_group import AsyncMemberGroupMixin
+from .modules.mixins.helper import parse_models
+from .modules.reference_data import AsyncReferenceData
+
+if TYPE_CHECKING:
+    import httpx
+
+TokenRefreshCallback = (
+    Callable[[BearerToken], None]
+    | Callable[[], None]
+    | Callable[[BearerToken], Awaitable[None]]
+    | Callable[[], Awaitable[None]]
+)
+
+
+class AsyncEasyvereinAPI:
+    """
+    Asynchronous variant of `EasyvereinAPI`, exposing the same endpoints with awaitable methods.
+
+    Requires the optional `httpx` dependency, install it using `pip install python-easyverein[async]`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key,
+        api_version="v2.0",
+        base_url: str = "https://easyverein.com/api/",
+        logger: logging.Logger | None = None,
+        auto_retry=False,
+        token_refresh_callback: TokenRefreshCallback | None = None,
+        auto_refresh_token: bool = False,
+        http_client: httpx.AsyncClient | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        rate_limit: float | TokenBucket | None = None,
+        rate_limit_burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float | None, float | None] | None = DEFAULT_TIMEOUT,
+        log_requests: bool = True,
+        trusted_reads: bool = False,
+        cache: ResponseCache | None = None,
+        reference_data_ttl: float = 300.0,
+        conditional_requests: bool = False,
+        coalesce_reads: bool = False,
+    ):
+        """
+        Constructor setting API key and logger.
+
+        Connections are pooled by an `httpx.AsyncClient`, sized by `max_connections` and
+        `max_keepalive_connections`. Alternatively a preconfigured `http_client` can be passed, which is then
+        used as-is. The token refresh callback may be a regular function or a coroutine function.
+
+        See `EasyvereinAPI` for the `rate_limit`, `rate_limit_burst`, `retry_policy`, `timeout`, `log_requests`,
+        `trusted_reads`, `cache`, `reference_data_ttl`, `conditional_requests` and `coalesce_reads` parameters.
+        """
+
+        super().__init__()
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = logging.getLogger("easyverein")
+
+        # Check parameters
+        if api_version not in SUPPORTED_API_VERSIONS:
+            self.logger.error(
+                f"API version {api_version} is not supported. Supported versions are {SUPPORTED_API_VERSIONS}"
+            )
+            raise ValueError(
+                f"API version {api_version} is not supported. Supported versions are {SUPPORTED_API_VERSIONS}"
+            )
+
+        if (auto_refresh_token or token_refresh_callback) and api_version != "v2.0":
+            raise ValueError("Token refresh is only supported in API version v2.0")
+
+        # Requests of all endpoints share a single rate limiter
+        if isinstance(rate_limit, TokenBucket):
+            rate_limiter: TokenBucket | None = rate_limit
+        else:
+            rate_limiter = TokenBucket(rate_limit, rate_limit_burst) if rate_limit else None
+
+        self.token_refresh_callback = token_refresh_callback
+        self.auto_refresh_token = auto_refresh_token
+        self.c = AsyncEasyvereinClient(
+            api_key,
+            api_version,
+            base_url,
+            self.logger,
+            self,
+            auto_retry,
+            http_client=http_client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            trusted_reads=trusted_reads,
+            cache=cache,
+            conditional_requests=conditional_requests,
+            coalesce_reads=coalesce_reads,
+            log_requests=log_requests,
+        )
+
+        # Add methods
+        self.booking = AsyncBookingMixin(self.c, self.c.logger)
+        self.billing_account = AsyncBillingAccountMixin(self.c, self.c.logger)
+        self.contact_details = AsyncContactDetailsMixin(self.c, self.c.logger)
+        self.custom_field = AsyncCustomFieldMixin(self.c, self.c.logger)
+        self.invoice = AsyncInvoiceMixin(self.c, self.c.logger)
+        self.invoice_item = AsyncInvoiceItemMixin(self.c, self.c.logger)
+        self.member = AsyncMemberMixin(self.c, self.c.logger)
+        self.member_group = AsyncMemberGroupMixin(self.c, self.c.logger)
+
+        # Custom fields and member groups, loaded once and shared by helpers like `ensure_set` and `add_to_group`
+        self.reference_data = AsyncReferenceData(self, reference_data_ttl)
+        self.c.write_listeners.append(self.reference_data.invalidate)
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool of the underlying client
+        """
+        await self.c.close()
+
+    async def __aenter__(self) -> AsyncEasyvereinAPI:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @staticmethod
+    def deadline(seconds: float) -> AbstractContextManager[None]:
+        """
+        Limits the total time of all API calls made inside the `with` block, including retries, pagination and
+        helpers performing several requests. Raises `EasyvereinAPITimeoutException` once the time is up.
+        """
+        return deadline(seconds)
+
+    async def handle_token_refresh(self):
+        """
+        This method is called by the client if a token refresh is required according to the API response.
+
+        Without automatic token refresh, the callback is invoked without arguments.
+        """
+
+        if self.token_refresh_callback:
+            self.logger.info("Notifying token refresh callback to refresh token")
+            callback = cast(Callable[..., Any], self.token_refresh_callback)
+            result = callback(await self.refresh_token()) if self.auto_refresh_token else callback()
+            if inspect.isawaitable(result):
+                await result
+
+    async def refresh_token(self) -> BearerToken:
+        """
+        Refreshes the bearer token (only valid for API v2.0)
+        """
+
+        if not self.c.api_version == "v2.0":
+            self.logger.error("Refresh token is only available for API v2.0")
+            raise ValueError("Refresh token is only available for API v2.0")
+
+        response = await self.c.fetch_one(self.c.get_url("/refresh-token"), cache=False)
+        token = parse_models(response.result, BearerToken)
+        if not token:
+            self.logger.error(f"Error refreshing token: {response.result}")
+            raise ValueError(f"Error refreshing token: {response.result}")
+
+        # update client instance to use the new token
+        token = cast(BearerToken, token)
+        self.c.api_key = token.Bearer
+        return token
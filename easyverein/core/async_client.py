@@ -0,0 +1,503 @@
+"""
+Asynchronous counterpart of the EasyVerein API client
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from io import BufferedReader
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from .cache import ResponseCache
+from .client import DEFAULT_TIMEOUT, BaseEasyvereinClient, LazyPayload
+from .exceptions import (
+    EasyvereinAPIException,
+    EasyvereinAPINotFoundException,
+)
+from .rate_limit import TokenBucket
+from .responses import ResponseSchema, object_adapter, page_adapter
+from .retry import RetryPolicy
+from .serializer import dumps
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ..async_api import AsyncEasyvereinAPI
+
+
+class AsyncEasyvereinClient(BaseEasyvereinClient):
+    """
+    Class encapsulating common function used by all asynchronous API methods.
+
+    Uses a pooled `httpx.AsyncClient`, so many requests can be in flight on a single event loop. httpx is only
+    imported once a client is created, so importing the library stays cheap for synchronous use.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key,
+        api_version,
+        base_url,
+        logger: logging.Logger,
+        instance: AsyncEasyvereinAPI,
+        auto_retry=False,
+        http_client: httpx.AsyncClient | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        rate_limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float | None, float | None] | None = DEFAULT_TIMEOUT,
+        trusted_reads: bool = False,
+        cache: ResponseCache | None = None,
+        conditional_requests: bool = False,
+        coalesce_reads: bool = False,
+        log_requests: bool = True,
+    ):
+        """
+        Constructor setting API key and logger.
+
+        If no `http_client` is given, one is created with the given connection limits. A client passed in
+        by the caller is used as-is and not closed by this class.
+
+        If a `rate_limiter` is given, every request takes a token from it before being sent. Failed requests
+        are retried according to `retry_policy`, or the default `RetryPolicy` if only `auto_retry` is set.
+
+        `timeout` is applied to every request, either as a single value or as a `(connect, read)` tuple.
+        Inside a `deadline` block it is shortened to the time left.
+
+        `trusted_reads` is the default for the `trusted` parameter of the read methods of all endpoints.
+
+        If a `cache` is given, the responses of `fetch` and `fetch_one` are served from it while they are valid.
+
+        If `conditional_requests` is set, GET requests are sent with the `ETag` and `Last-Modified` validators of
+        the previous response to the same URL, and bodies equal to the previous one are not decoded again.
+
+        If `coalesce_reads` is set, identical requests of `fetch` and `fetch_one` running at the same time share a
+        single request and its result.
+
+        Setting `log_requests` to `False` drops the debug and info messages logged for every request.
+        """
+        try:
+            import httpx
+        except ImportError:  # pragma: no cover
+            raise ImportError(
+                "The asynchronous client requires httpx. Install it using `pip install python-easyverein[async]`."
+            ) from None
+
+        self.transport_exceptions = (httpx.TransportError,)
+        self.timeout_exceptions = (httpx.TimeoutException,)
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections, max_keepalive_connections=max_keepalive_connections
+                )
+            )
+        self.http_client = http_client
+        self.api_instance = instance
+
+        super().__init__(
+            api_key,
+            api_version,
+            base_url,
+            logger,
+            auto_retry,
+            rate_limiter,
+            retry_policy,
+            timeout,
+            trusted_reads,
+            cache,
+            conditional_requests,
+            coalesce_reads,
+            log_requests,
+        )
+
+    def _set_auth_header(self, value: str) -> None:
+        self.http_client.headers["Authorization"] = value
+
+    async def close(self) -> None:
+        """
+        Closes the underlying HTTP client and its connection pool. Clients passed in by the caller are left open.
+        """
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> AsyncEasyvereinClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _do_request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        binary: bool = False,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        files: dict[str, BufferedReader] | None = None,
+        adapter: TypeAdapter[Any] | None = None,
+        cache: bool = False,
+        conditional: bool = True,
+    ) -> tuple[int, dict[str, Any] | httpx.Response | Any | None]:
+        """
+        Helper method that performs an actual call against the API, catching the most common errors
+
+        If an `adapter` is given, successful responses are validated straight from the raw response bytes. If
+        `cache` is set, the response is served from and stored in the response cache of the client. Unless
+        `conditional` is turned off, GET requests are sent as conditional requests if these are enabled.
+        """
+        conditional = conditional and method == "get" and not binary
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Performing %s request to %s", method, url)
+            if data:
+                self.logger.debug("Request data: %s", LazyPayload(data))
+            if headers:
+                self.logger.debug("Provided request headers: %s", headers)
+
+        if cache:
+            cached = self._cached_response(url, adapter)
+            if cached is not None:
+                return cached
+
+        known, headers = self._conditional_headers(method, url, headers, conditional)
+
+        try:
+            res = await self._send(method, url, data, headers, files)
+        except self.timeout_exceptions as e:
+            raise self._timed_out(method, url, e) from e
+        finally:
+            # Whether a write succeeded or not, cached responses of its endpoint may be outdated now
+            self._invalidate_cache(method, url)
+
+        if conditional:
+            status_code, content, validators = self._revalidate(url, known, res.status_code, res.headers, res.content)
+        else:
+            status_code, content, validators = res.status_code, res.content, None
+
+        if cache:
+            self._cache_response(url, status_code, content)
+
+        if self._token_refresh_needed(res.headers):
+            self.logger.info("Token refresh required")
+            await self.api_instance.handle_token_refresh()
+
+        if status_code == 404:
+            self.logger.warning("Request returned status code 404, resource not found")
+            raise EasyvereinAPINotFoundException("Requested resource not found")
+
+        # In some cases (for example on 204 delete) the response is empty
+        if content == b"":
+            return status_code, None
+
+        # If content is supposed to be binary, return the entire response to maintain headers
+        if binary:
+            return status_code, res
+
+        return self._decode_content(status_code, content, adapter, validators)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        files: dict[str, BufferedReader] | None,
+    ) -> httpx.Response:
+        """
+        Sends a request, retrying transient errors according to the retry policy
+        """
+        # Encode the body once, instead of on every attempt
+        body = dumps(data) if data else None
+        if body is not None:
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if attempt > 1 and files:
+                for v in files.values():
+                    v.seek(0)  # reset file seek, as it has been moved by the previous call
+
+            if self.rate_limiter:
+                waited = await self.rate_limiter.acquire_async()
+                if waited:
+                    self.logger.debug("Rate limiter delayed request by %.3f seconds", waited)
+
+            timeout = self._request_timeout()
+            if isinstance(timeout, tuple):
+                import httpx
+
+                # httpx uses the read timeout for writing and acquiring a pooled connection as well
+                request_timeout: float | httpx.Timeout | None = httpx.Timeout(timeout[1], connect=timeout[0])
+            else:
+                request_timeout = timeout
+
+            try:
+                res = await self.http_client.request(
+                    method.upper(), url, headers=headers, content=body, files=files, timeout=request_timeout
+                )
+            except self._retry_exceptions() as e:
+                delay = self._retry_delay(method, attempt, None, None)
+                if delay is None:
+                    raise
+                self.logger.warning("Request failed with %r, retrying in %.1f seconds (attempt %d)", e, delay, attempt)
+                await asyncio.sleep(delay)
+                continue
+
+            self.logger.debug("Request returned status code %d", res.status_code)
+
+            if self._is_transient(res.status_code):
+                retry_after = self._parse_retry_after(res.headers)
+                delay = self._retry_delay(method, attempt, res.status_code, retry_after)
+                if delay is not None:
+                    self.logger.warning(
+                        "Request returned status code %d, retrying in %.1f seconds (attempt %d)",
+                        res.status_code,
+                        delay,
+                        attempt,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if res.status_code == 429:
+                    raise self._too_many_requests(retry_after)
+
+            return res
+
+    async def create(
+        self,
+        url,
+        data: BaseModel,
+        status_code: int = 201,
+    ) -> ResponseSchema:
+        """
+        Method to create an object in the API
+        """
+        return self._handle_response(
+            await self._do_request(
+                "post",
+                url,
+                data=data.model_dump(exclude_none=True, exclude_unset=True, by_alias=True),
+            ),
+            status_code,
+        )
+
+    async def delete(self, url, status_code: int = 204):
+        """
+        Method to delete an object in the API
+        """
+        return self._handle_response(await self._do_request("delete", url), expected_status_code=status_code)
+
+    async def update(self, url, data: BaseModel, status_code: int = 200, exclude_none: bool = True) -> ResponseSchema:
+        """
+        Method to update an object in the API
+        """
+        return self._handle_response(
+            await self._do_request(
+                "patch",
+                url,
+                data=data.model_dump(exclude_none=exclude_none, exclude_unset=True, by_alias=True),
+            ),
+            expected_status_code=status_code,
+        )
+
+    async def bulk_create(self, url, data: Sequence[BaseModel], status_code: int = 201) -> ResponseSchema:
+        """
+        Method to create multiple objects in the API
+        """
+        return self._handle_response(
+            await self._do_request(
+                "post",
+                url,
+                data={"entries": [d.model_dump(exclude_none=True, exclude_unset=True, by_alias=True) for d in data]},
+            ),
+            expected_status_code=status_code,
+        )
+
+    async def bulk_update(
+        self, url, data: Sequence[BaseModel], status_code: int = 200, exclude_none: bool = True
+    ) -> ResponseSchema:
+        """
+        Method to update multiple objects in the API
+        """
+        return self._handle_response(
+            await self._do_request(
+                "patch",
+                url,
+                data={
+                    "entries": [
+                        d.model_dump(exclude_none=exclude_none, exclude_unset=True, by_alias=True) for d in data
+                    ]
+                },
+            ),
+            expected_status_code=status_code,
+        )
+
+    async def upload(
+        self,
+        url: str,
+        field_name: str,
+        file: Path,
+        status_code: int = 200,
+    ) -> ResponseSchema:
+        """
+        This method uploads a file to a certain endpoint.
+
+        Only tested with invoices so far
+        """
+        # Check that path is a file and it exists
+        if not file.exists() or not file.is_file():
+            self.logger.error("File does not exist or is not a file.")
+            raise FileNotFoundError("File does not exist")
+
+        headers = {"Content-Disposition": f'name="file"; filename="{file.name}"'}
+
+        with open(file, "rb") as f:
+            return self._handle_response(
+                await self._do_request(
+                    "patch",
+                    url,
+                    headers=headers,
+                    files={field_name: f},
+                ),
+                status_code,
+            )
+
+    async def _fetch(
+        self, url: str, adapter: TypeAdapter[Any] | None, cache: bool = True
+    ) -> tuple[int, dict[str, Any] | httpx.Response | Any | None]:
+        """
+        Sends a GET request served from the response cache, sharing identical requests in flight if enabled
+
+        If `cache` is turned off, the request is sent on its own, bypassing the response cache, conditional requests
+        and the sharing of identical requests.
+        """
+        if not cache:
+            return await self._do_request("get", url, adapter=adapter, conditional=False)
+        if self.single_flight is None:
+            return await self._do_request("get", url, adapter=adapter, cache=True)
+        return await self.single_flight.do_async(
+            (url, adapter), lambda: self._do_request("get", url, adapter=adapter, cache=True)
+        )
+
+    async def fetch(self, url, model: type[BaseModel] | None = None, cache: bool = True) -> ResponseSchema:
+        """
+        Helper method that fetches a result from an API call
+
+        If the `model` of the results is given, a paginated response is validated straight from the raw
+        response, and the result holds model instances instead of dicts.
+
+        Responses are served from the response cache of the client unless `cache` is turned off, which also skips
+        conditional requests and the sharing of identical requests in flight.
+
+        Only supports GET endpoints
+        """
+        res = await self._fetch(url, page_adapter(model) if model else None, cache)
+        return self._handle_response(res, 200)
+
+    async def fetch_file(self, url: str) -> tuple[bytes, httpx.Headers]:
+        """
+        Helper method that fetches a file from the API including the authentication header
+
+        Returns the raw bytes object and the entire header for further processing
+        """
+        import httpx
+
+        status_code, res = await self._do_request("get", url, binary=True)
+
+        # Response needs to be a Response object
+        if not isinstance(res, httpx.Response):
+            self.logger.error("Request to download file failed with unexpected response")
+            raise EasyvereinAPIException("Request to download file failed with unexpected response")
+
+        # Check if status code is 200
+        if status_code != 200:
+            self.logger.error(f"Request to download file failed with unexpected status code {status_code}")
+            raise EasyvereinAPIException(f"Request to download file failed with unexpected status code {status_code}")
+
+        return res.content, res.headers
+
+    async def fetch_one(self, url, model: type[BaseModel] | None = None, cache: bool = True) -> ResponseSchema:
+        """
+        Helper method that fetches a result from an API call
+
+        If the `model` of the result is given, the object is validated straight from the raw response.
+
+        Responses are served from the response cache of the client unless `cache` is turned off, which also skips
+        conditional requests and the sharing of identical requests in flight.
+
+        Only supports GET endpoints
+        """
+        res = await self._fetch(url, object_adapter(model) if model else None, cache)
+        return self._single_result(self._handle_response(res, 200), model)
+
+    async def fetch_paginated(self, url, max_workers: int = 1, model: type[BaseModel] | None = None) -> ResponseSchema:
+        """
+        Helper method that fetches all pages of a paginated API call
+
+        If `max_workers` is larger than one and the API returned the total count (`showCount`), the remaining
+        pages are computed from the first page and fetched concurrently, with at most `max_workers` requests
+        in flight. Pages are returned in order in both cases.
+
+        Only supports GET endpoints
+        """
+        resources = []
+
+        if max_workers > 1:
+            page = await self._fetch_page(url, model)
+            resources.extend(page["results"])
+            page_urls = self._remaining_page_urls(url, page)
+            url = page["next"]
+
+            if page_urls:
+                self.logger.debug("Fetching %d remaining pages with %d workers", len(page_urls), max_workers)
+                semaphore = asyncio.Semaphore(max_workers)
+
+                async def fetch_page(page_url: str) -> dict[str, Any]:
+                    async with semaphore:
+                        return await self._fetch_page(page_url, model)
+
+                for page in await asyncio.gather(*(fetch_page(page_url) for page_url in page_urls)):
+                    resources.extend(page["results"])
+
+                # Continue with the regular pagination in case objects were added in the meantime
+                url = page["next"]
+
+        async for results in self.iter_paginated(url, model):
+            resources.extend(results)
+
+        # All pages have been checked for status code 200 already
+        return self._handle_response((200, resources), 200)
+
+    async def iter_paginated(
+        self, url: str | None, model: type[BaseModel] | None = None, conditional: bool = True
+    ) -> AsyncIterator[list[Any]]:
+        """
+        Async generator following the `next` links of a paginated API call, yielding the results of one page
+        at a time. The next page is only requested once the previous one has been consumed. Unless `conditional`
+        is turned off, the pages are remembered for conditional requests, if these are enabled.
+
+        Only supports GET endpoints
+        """
+        while url is not None:
+            page = await self._fetch_page(url, model, conditional)
+            url = page["next"]
+            yield page["results"]
+
+    async def _fetch_page(
+        self, url: str, model: type[BaseModel] | None = None, conditional: bool = True
+    ) -> dict[str, Any]:
+        """
+        Fetches and checks a single page of a paginated API call
+        """
+        self.logger.debug("Fetching paginated API at %s", url)
+
+        status_code, result = await self._do_request(
+            "get", url, adapter=page_adapter(model) if model else None, conditional=conditional
+        )
+        return self._check_page(url, status_code, result)
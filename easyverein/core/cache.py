@@ -0,0 +1,371 @@
+"""
+Client side caching of API responses
+"""
+
+import abc
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+# Matches the endpoint following the API version of a URL, like `member` in `.../api/v2.0/member/1?query=...`.
+# Objects in the recycle bin belong to the endpoint they were deleted from.
+_SCOPE = re.compile(r"/v[\d.]+/(?:wastebasket/)?([^/?#]+)")
+
+
+def cache_scope(url: str) -> str:
+    """
+    Returns the scope of a cached response, which is the endpoint the URL belongs to. Writes to an endpoint
+    invalidate all cached responses of the same scope.
+    """
+    match = _SCOPE.search(url)
+    return match.group(1) if match else url
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing the effectiveness of a response cache
+    """
+
+    hits: int = 0
+    """Lookups answered from the cache"""
+    misses: int = 0
+    """Lookups that had to be sent to the API, including expired entries"""
+    evictions: int = 0
+    """Entries dropped because they expired or the cache was full"""
+    invalidations: int = 0
+    """Entries dropped because their endpoint was written to"""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of lookups answered from the cache, between 0 and 1
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache(abc.ABC):
+    """
+    Base class of caches holding the raw bodies of successful GET responses, keyed by the full request URL
+    including the query and all filters.
+
+    Each entry belongs to a scope, the endpoint of its URL. Whenever the client sends a write request to an
+    endpoint, all entries of its scope are invalidated. Implementations have to be thread-safe and keep `stats`
+    up to date.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abc.abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the cached body for `key`, or None if there is no valid entry
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, content: bytes, scope: str) -> None:
+        """
+        Stores the body of a response in the cache
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, scope: str) -> None:
+        """
+        Drops all entries of the given scope
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Drops all entries
+        """
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-memory response cache. Entries expire `ttl` seconds after they have been stored. If more than
+    `max_entries` responses are cached, the least recently used ones are dropped.
+
+    A single instance is shared by all endpoints of a client. It can also be shared between clients using the same
+    API key, but never between clients of different organizations.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        """
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl: Number of seconds a response is served from the cache
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least one")
+        if ttl <= 0:
+            raise ValueError("ttl must be larger than zero")
+
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Maps keys to the expiry time, scope and body of the response, least recently used first
+        self._entries: OrderedDict[str, tuple[float, str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[2]
+
+    def set(self, key: str, content: bytes, scope: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, scope, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[1] == scope]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Response cache stored in a local SQLite database, which can be shared by multiple processes on the same
+    machine. Bodies are stored compressed. Entries expire `ttl` seconds after they have been stored, and if more
+    than `max_entries` responses are cached, the least recently used ones are dropped.
+
+    Like `MemoryCache`, a database must never be shared between clients of different organizations. `stats` only
+    count the lookups of the current process.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_entries: int = 10_000,
+        ttl: float = 3600.0,
+        compression_level: int = 6,
+    ):
+        """
+        Args:
+            path: Path of the database file, which is created if it doesn't exist
+            max_entries: Maximum number of cached responses
+            ttl: Number of seconds a response is served from the cache
+            compression_level: zlib compression level of stored bodies, from 0 (none) to 9 (smallest)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least one")
+        if ttl <= 0:
+            raise ValueError("ttl must be larger than zero")
+
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        # Other processes may hold a write lock for a short time, so wait for it instead of failing right away
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, scope TEXT NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL, "
+                "content BLOB NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> bytes | None:
+        # Wall clock time is used, as monotonic clocks are not comparable between processes
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT expires, content FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            if row[0] <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+            self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+        return zlib.decompress(row[1])
+
+    def set(self, key: str, content: bytes, scope: str) -> None:
+        now = time.time()
+        content = zlib.compress(content, self.compression_level)
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, scope, expires, accessed, content) VALUES (?, ?, ?, ?, ?)",
+                    (key, scope, now + self.ttl, now, content),
+                )
+                expired = self._connection.execute("DELETE FROM responses WHERE expires <= ?", (now,)).rowcount
+                excess = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                        (excess,),
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self.stats.evictions += expired + max(excess, 0)
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock:
+            self.stats.invalidations += self._connection.execute(
+                "DELETE FROM responses WHERE scope = ?", (scope,)
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Closes the database connection. The cached responses are kept on disk.
+        """
+        with self._lock:
+            self._connection.close()
+
+
+class Validators:
+    """
+    What is known about the last response to a GET request: its validators, a digest of its body and the results
+    it has been decoded to
+    """
+
+    __slots__ = ("scope", "etag", "last_modified", "digest", "size", "content", "decoded")
+
+    def __init__(self, scope: str, etag: str | None, last_modified: str | None, content: bytes):
+        self.scope = scope
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = content_digest(content)
+        self.size = len(content)
+        # The body is only needed to answer a 304 response, which requires a validator
+        self.content = content if etag or last_modified else None
+        # Maps the adapter used to decode the body to the decoded result
+        self.decoded: dict[Any, tuple[int, Any]] = {}
+
+    def headers(self) -> dict[str, str]:
+        """
+        Returns the headers turning a GET request into a conditional one
+        """
+        headers = {}
+        if self.content is not None and self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.content is not None and self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def content_digest(content: bytes) -> bytes:
+    """
+    Returns a digest identifying a response body
+    """
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ValidatorStore:
+    """
+    Thread-safe store of the validators (`ETag`, `Last-Modified`) and content digests of the last response to each
+    GET URL, used for conditional requests. If more than `max_entries` URLs are known, or their bodies take up more
+    than `max_bytes` in total, the least recently used ones are dropped. The size of the bodies also bounds the
+    results they are decoded to, which are kept alongside.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least one")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least one")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Validators] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Validators | None:
+        """
+        Returns what is known about the last response to `url`
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url: str, headers: Any, content: bytes) -> Validators:
+        """
+        Records a successful response to `url`. If its body is unchanged since the last response, the known entry
+        including its decoded results is kept and only its validators are updated.
+        """
+        entry = Validators(cache_scope(url), headers.get("ETag"), headers.get("Last-Modified"), content)
+        with self._lock:
+            known = self._entries.pop(url, None)
+            if known is not None:
+                self._size -= known.size
+                if known.digest == entry.digest:
+                    known.etag, known.last_modified, known.content = entry.etag, entry.last_modified, entry.content
+                    entry = known
+            self._entries[url] = entry
+            self._size += entry.size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._size -= self._entries.popitem(last=False)[1].size
+        return entry
+
+    def invalidate(self, scope: str) -> None:
+        """
+        Drops all entries of the given scope
+        """
+        with self._lock:
+            for url in [url for url, entry in self._entries.items() if entry.scope == scope]:
+                self._size -= self._entries.pop(url).size
+
+    def clear(self) -> None:
+        """
+        Drops all entries
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
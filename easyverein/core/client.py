@@ -4,56 +4,136 @@ Main EasyVerein API class
 
 from __future__ import annotations
 
+import abc
 import logging
+import math
+import re
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from io import BufferedReader
 from pathlib import Path
 from time import sleep
 from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 
+from .cache import ResponseCache, ValidatorStore, Validators, cache_scope
+from .deadline import remaining_time
 from .exceptions import (
     EasyvereinAPIException,
     EasyvereinAPINotFoundException,
+    EasyvereinAPITimeoutException,
     EasyvereinAPITooManyRetriesException,
 )
-from .responses import ResponseSchema
+from .rate_limit import TokenBucket
+from .responses import Page, ResponseSchema, copy_result, object_adapter, page_adapter
+from .retry import RetryPolicy
+from .serializer import dumps, loads
+from .single_flight import SingleFlight
 
 if TYPE_CHECKING:
     from .. import EasyvereinAPI
 
+DEFAULT_RETRY_POLICY = RetryPolicy()
+DEFAULT_TIMEOUT = (10.0, 60.0)
+MAX_LOGGED_PAYLOAD = 2000
 
-class EasyvereinClient:
+
+class LazyPayload:
     """
-    Class encapsulating common function used by all API methods
+    Wraps a request or response payload for debug logging. The payload is only rendered if the log record is
+    actually emitted, and truncated to `MAX_LOGGED_PAYLOAD` characters to keep log lines readable.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        text = str(self.payload)
+        if len(text) > MAX_LOGGED_PAYLOAD:
+            return f"{text[:MAX_LOGGED_PAYLOAD]}... ({len(text)} characters in total)"
+        return text
+
+
+class RequestLogger(logging.LoggerAdapter):
+    """
+    Logs through the logger given to the client. If `log_requests` is off, the debug and info messages logged for
+    every request are dropped. The level, filters and handlers of the logger apply as usual.
     """
 
-    def __init__(
+    def __init__(self, logger: logging.Logger, log_requests: bool = True):
+        super().__init__(logger)
+        self.log_requests = log_requests
+
+    def isEnabledFor(self, level: int) -> bool:
+        if not self.log_requests and level < logging.WARNING:
+            return False
+        return self.logger.isEnabledFor(level)
+
+
+class BaseEasyvereinClient(abc.ABC):
+    """
+    Transport independent functionality shared by the synchronous and the asynchronous client
+    """
+
+    transport_exceptions: tuple[type[Exception], ...] = ()
+    timeout_exceptions: tuple[type[Exception], ...] = ()
+
+    def __init__(  # noqa: PLR0913
         self,
         api_key,
         api_version,
         base_url,
         logger: logging.Logger,
-        instance: EasyvereinAPI,
         auto_retry=False,
+        rate_limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float | None, float | None] | None = DEFAULT_TIMEOUT,
+        trusted_reads: bool = False,
+        cache: ResponseCache | None = None,
+        conditional_requests: bool = False,
+        coalesce_reads: bool = False,
+        log_requests: bool = True,
     ):
-        """
-        Constructor setting API key and logger
-        """
+        self.logger = RequestLogger(logger, log_requests)
         self.api_key = api_key
         self.base_url = base_url
         self.api_version = api_version
-        self.logger = logger
-        self.api_instance = instance
         self.auto_retry = auto_retry
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.trusted_reads = trusted_reads
+        self.cache = cache
+        self.validators = ValidatorStore() if conditional_requests else None
+        self.single_flight = SingleFlight() if coalesce_reads else None
+        # Called with the scope (see `cache_scope`) of every write request, e.g. to drop data loaded before
+        self.write_listeners: list[Callable[[str], None]] = []
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: str) -> None:
+        """
+        Stores the API key and sets the authorization header on the transport, so it is only built once
+        """
+        self._api_key = value
+        self._set_auth_header(f"Bearer {value}")
 
-    def _get_header(self):
+    @abc.abstractmethod
+    def _set_auth_header(self, value: str) -> None:
         """
-        Constructs a header for the API request
+        Sets the authorization header sent with every request by the underlying transport
         """
-        return {"Authorization": "Bearer " + self.api_key}
 
     def get_url(self, path: str, url_params: dict | None = None) -> str:
         """
@@ -63,23 +143,466 @@ class EasyvereinClient:
         :param url_params: additional path parameters to append
         """
         url = f"{self.base_url}{self.api_version}{path}"
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        self.logger.debug(f"Base URL is {url}")
+        if debug:
+            self.logger.debug("Base URL is %s", url)
 
         if url_params:
             for key, value in url_params.items():
                 if value in {None, ""}:
                     continue
-                self.logger.debug(f"Adding {key}={value} path parameter to URL")
+                if debug:
+                    self.logger.debug("Adding %s=%s path parameter to URL", key, value)
                 if "?" not in url:
                     url += f"?{key}={value}"
                 else:
                     url += f"&{key}={value}"
 
-        self.logger.debug(f"Final constructed URL is {url}")
+        if debug:
+            self.logger.debug("Final constructed URL is %s", url)
 
         return url
 
+    @property
+    def active_retry_policy(self) -> RetryPolicy | None:
+        """
+        The retry policy in use. Falls back to the default policy if only `auto_retry` is set
+        """
+        if self.retry_policy is None and self.auto_retry:
+            return DEFAULT_RETRY_POLICY
+        return self.retry_policy
+
+    def _parse_retry_after(self, headers: Mapping[str, str]) -> int | None:
+        """
+        Parses the Retry-After header of a response, returns None if the header is not present
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after is None:
+            return None
+
+        try:
+            retry_after_seconds = int(retry_after)
+        except ValueError:
+            self.logger.error("Unable to parse Retry-After header while handling 429 response code.")
+            self.logger.debug("Retry-After header: %s", retry_after)
+            retry_after_seconds = 0
+
+        # Hold back all other requests sharing the rate limiter, too
+        if self.rate_limiter and retry_after_seconds:
+            self.rate_limiter.pause(retry_after_seconds)
+
+        return retry_after_seconds
+
+    def _retry_delay(self, method: str, attempt: int, status_code: int | None, retry_after: int | None) -> float | None:
+        """
+        Returns the number of seconds to wait before retrying a failed request, or None if it should not be retried
+
+        Raises `EasyvereinAPITimeoutException` if the retry would not be sent before the current deadline.
+        """
+        policy = self.active_retry_policy
+        if policy is None or not policy.should_retry(method, attempt, status_code):
+            return None
+
+        delay = policy.delay(attempt, retry_after)
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            self.logger.warning("Retry in %.1f seconds would exceed the deadline, giving up", delay)
+            raise EasyvereinAPITimeoutException(
+                f"Deadline exceeded, {remaining:.1f} seconds left but retry would be sent in {delay:.1f} seconds"
+            )
+        return delay
+
+    def _request_timeout(self) -> float | tuple[float | None, float | None] | None:
+        """
+        Returns the (connect, read) timeout for the next request, shortened to the time left until the current
+        deadline. Raises `EasyvereinAPITimeoutException` if the deadline has already passed.
+        """
+        remaining = remaining_time()
+        if remaining is None:
+            return self.timeout
+        if self.timeout is None:
+            return remaining
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return (
+                remaining if connect is None else min(connect, remaining),
+                remaining if read is None else min(read, remaining),
+            )
+        return min(self.timeout, remaining)
+
+    def _timed_out(self, method: str, url: str, error: Exception) -> EasyvereinAPITimeoutException:
+        self.logger.error("%s request to %s timed out", method.upper(), url)
+        return EasyvereinAPITimeoutException(f"{method.upper()} request to {url} timed out: {error}")
+
+    def _is_transient(self, status_code: int) -> bool:
+        """
+        Whether a response with the given status code indicates a transient error
+        """
+        policy = self.active_retry_policy
+        return status_code == 429 or (policy is not None and status_code in policy.retry_status_codes)
+
+    def _retry_exceptions(self) -> tuple[type[Exception], ...]:
+        """
+        Exceptions of the HTTP library that are retried according to the retry policy
+        """
+        policy = self.active_retry_policy
+        if policy is None:
+            return ()
+        return policy.retry_exceptions if policy.retry_exceptions is not None else self.transport_exceptions
+
+    def _too_many_requests(self, retry_after: int | None) -> EasyvereinAPITooManyRetriesException:
+        retry_after = retry_after or 0
+        self.logger.warning("Request returned status code 429, too many requests. Wait %d seconds", retry_after)
+        return EasyvereinAPITooManyRetriesException(
+            f"Too many requests, please wait {retry_after} seconds and try again.",
+            retry_after=retry_after,
+        )
+
+    def _token_refresh_needed(self, headers: Mapping[str, str]) -> bool:
+        """
+        If API version is v2.0, check if token refresh is required
+        """
+        return self.api_version == "v2.0" and headers.get("tokenRefreshNeeded", "false") == "True"
+
+    def _validate_json(self, content: bytes, adapter: TypeAdapter[Any]) -> Any:
+        """
+        Validates a raw response body with the given adapter, without building intermediate dicts.
+
+        Returns None if the response does not match the adapter. The caller then decodes it as plain JSON, so
+        unexpected responses and validation errors are reported exactly as without an adapter.
+        """
+        try:
+            return adapter.validate_json(content)
+        except ValidationError as e:
+            self.logger.debug("Response could not be validated directly: %s", e)
+            return None
+
+    def _decode_content(
+        self,
+        status_code: int,
+        content: bytes,
+        adapter: TypeAdapter[Any] | None,
+        validators: Validators | None = None,
+    ) -> tuple[int, Any]:
+        """
+        Decodes a response body, validating successful responses with `adapter` if given
+
+        If the `validators` of the response are given and the same body has been validated with the same adapter
+        before, a copy of the previous result is returned instead of validating the body again. Copying the models
+        is considerably cheaper than validating them, and callers can't modify each other's results.
+        """
+        if validators is not None and adapter is not None:
+            decoded = validators.decoded.get(adapter)
+            if decoded is None:
+                decoded = validators.decoded[adapter] = self._decode_content(status_code, content, adapter)
+            else:
+                self.logger.debug("Response is unchanged, reusing the previous result")
+            return decoded[0], copy_result(decoded[1])
+
+        # Validate successful responses straight from the raw bytes, skipping the intermediate dicts
+        if adapter is not None and status_code == 200:
+            parsed = self._validate_json(content, adapter)
+            if parsed is not None:
+                return status_code, parsed
+
+        # Try to parse response as JSON and return it for further processing
+        try:
+            return status_code, loads(content)
+        except ValueError:
+            self.logger.error("Unable to parse response content as JSON")
+            self.logger.debug("Response content: %s", LazyPayload(content))
+            return status_code, None
+
+    def _cached_response(self, url: str, adapter: TypeAdapter[Any] | None) -> tuple[int, Any] | None:
+        """
+        Returns the decoded response to a GET request from the cache, or None if it is not cached
+        """
+        if self.cache is None:
+            return None
+        content = self.cache.get(url)
+        if content is None:
+            return None
+        self.logger.debug("Serving response to %s from cache", url)
+        return self._decode_content(200, content, adapter)
+
+    def _cache_response(self, url: str, status_code: int, content: bytes) -> None:
+        """
+        Stores the body of a successful response to a GET request in the cache
+        """
+        if self.cache is not None and status_code == 200 and content:
+            self.cache.set(url, content, cache_scope(url))
+
+    def _conditional_headers(
+        self, method: str, url: str, headers: dict[str, str] | None, conditional: bool
+    ) -> tuple[Validators | None, dict[str, str] | None]:
+        """
+        Returns what is known about the last response to a GET request, if conditional requests are enabled, and
+        the headers to send with the request
+        """
+        if self.validators is None or method != "get" or not conditional:
+            return None, headers
+        known = self.validators.get(url)
+        if known is None:
+            return None, headers
+        return known, {**known.headers(), **(headers or {})}
+
+    def _revalidate(
+        self, url: str, known: Validators | None, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> tuple[int, bytes, Validators | None]:
+        """
+        Turns a 304 response to a conditional request into the known response and records the validators of
+        successful responses. Returns the status code, body and validators of the response.
+        """
+        if known is not None and status_code == 304 and known.content is not None:
+            self.logger.debug("Response to %s has not been modified", url)
+            return 200, known.content, known
+        if self.validators is not None and status_code == 200 and content:
+            return status_code, content, self.validators.store(url, headers, content)
+        return status_code, content, None
+
+    def _invalidate_cache(self, method: str, url: str) -> None:
+        """
+        Drops all cached responses of the endpoint a write request was sent to and notifies the write listeners
+        """
+        if method == "get":
+            return
+        scope = cache_scope(url)
+        if self.cache is not None:
+            self.cache.invalidate(scope)
+        if self.validators is not None:
+            self.validators.invalidate(scope)
+        for listener in self.write_listeners:
+            listener(scope)
+
+    def _check_page(self, url: str, status_code: int, result: Any) -> dict[str, Any]:
+        """
+        Makes sure a single page of a paginated API call has been fetched successfully
+        """
+        if isinstance(result, Page):
+            return {"count": result.count, "next": result.next, "results": result.results}
+
+        if not isinstance(result, dict):
+            self.logger.error("Could not fetch paginated API %s, status code %d", url, status_code)
+            self.logger.debug("API response: %s", LazyPayload(result))
+            raise EasyvereinAPIException(
+                f"Could not fetch paginated API {url}, status code {status_code}. API response: {result}"
+            )
+
+        if not status_code == 200:
+            self.logger.error("Could not fetch paginated API %s, status code %d", url, status_code)
+            self.logger.debug("API response: %s", LazyPayload(result))
+            raise EasyvereinAPIException(
+                f"Could not fetch paginated API {url}, status code {status_code}. API response: {result}"
+            )
+
+        return result
+
+    def _remaining_page_urls(self, url: str, first_page: dict[str, Any]) -> list[str]:
+        """
+        Computes the URLs of all pages following the first one, based on the total count returned by the API
+        when `showCount` is set. Returns an empty list if the page range cannot be computed up front.
+        """
+        count = first_page.get("count")
+        results = first_page["results"]
+        if not first_page.get("next") or not isinstance(count, int) or not results:
+            return []
+
+        try:
+            page_size = int(parse_qs(urlsplit(url).query)["limit"][0])
+        except (KeyError, ValueError):
+            page_size = len(results)
+
+        # Make sure we don't end up with two page parameters
+        base_url = re.sub(r"([?&])page=\d+&?", r"\1", url).rstrip("?&")
+        separator = "&" if "?" in base_url else "?"
+
+        return [f"{base_url}{separator}page={page}" for page in range(2, math.ceil(count / page_size) + 1)]
+
+    def _single_result(self, reply: ResponseSchema, model: type[BaseModel] | None = None) -> ResponseSchema:
+        """
+        Reduces a reply to a single object, used when exactly one object was requested
+
+        If the `model` of the object is given, an object that was not validated straight from the raw response,
+        e.g. the first one of a list, is validated.
+        """
+        if isinstance(reply.result, list):
+            if len(reply.result) == 0:
+                reply.result = None
+                reply.count = 0
+                return reply
+
+            self.logger.warning("One object was requested, but multiple objects were returned. Returning first.")
+            self.logger.debug("In total %d objects where returned.", len(reply.result))
+            reply.result = reply.result[0]
+            reply.count = 1
+
+        if model is not None and isinstance(reply.result, dict):
+            reply.result = model.model_validate(reply.result)
+        return reply
+
+    def _handle_response(
+        self,
+        res: tuple[int, dict[str, Any] | list[dict[str, Any]] | Any | None],
+        expected_status_code=200,
+    ) -> ResponseSchema:
+        """
+        Helper method that handles API responses
+        """
+        status_code, data = res
+        if status_code != expected_status_code:
+            raise EasyvereinAPIException(f"API returned status code {status_code}. API response: {data}")
+        else:
+            self.logger.debug("API returned status code %d", status_code)
+
+        self.logger.debug("Received raw data: %s", LazyPayload(data))
+
+        if data is None:
+            return ResponseSchema(result=None, count=0, response_code=status_code)
+
+        # Responses validated straight from the raw bytes already hold model instances
+        if isinstance(data, Page):
+            return ResponseSchema(
+                result=data.results,
+                count=data.count or 0,
+                response_code=status_code,
+            )
+        elif isinstance(data, BaseModel):
+            return ResponseSchema(
+                result=data,
+                count=1,
+                response_code=status_code,
+            )
+
+        # if data is a list, parse each entry
+        # fetch_paginated returns a list of result entries instead of raw data, this is why this case is here.
+        if isinstance(data, list):
+            return ResponseSchema(
+                result=data,
+                count=len(data),
+                response_code=status_code,
+            )
+        elif isinstance(data, dict) and "results" in data:
+            return ResponseSchema(
+                result=data["results"],
+                count=data.get("count", 0),
+                response_code=status_code,
+            )
+        elif isinstance(data, dict):
+            # Return the single object
+            return ResponseSchema(
+                result=data,
+                count=1,
+                response_code=status_code,
+            )
+        else:
+            # Return the raw response object (requests or httpx, depending on the client)
+            return ResponseSchema(
+                result=None,
+                count=0,
+                response_code=status_code,
+                response=data,
+            )
+
+
+class EasyvereinClient(BaseEasyvereinClient):
+    """
+    Class encapsulating common function used by all API methods
+    """
+
+    transport_exceptions = (requests.ConnectionError, requests.Timeout)
+    timeout_exceptions = (requests.Timeout,)
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key,
+        api_version,
+        base_url,
+        logger: logging.Logger,
+        instance: EasyvereinAPI,
+        auto_retry=False,
+        session: requests.Session | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float | None, float | None] | None = DEFAULT_TIMEOUT,
+        trusted_reads: bool = False,
+        cache: ResponseCache | None = None,
+        conditional_requests: bool = False,
+        coalesce_reads: bool = False,
+        log_requests: bool = True,
+    ):
+        """
+        Constructor setting API key and logger.
+
+        All requests are sent through a single `requests.Session`, so TCP and TLS connections are kept alive
+        and reused between calls. If no session is given, one is created with an `HTTPAdapter` mounted for
+        `http://` and `https://` using the given pool settings. A session passed in by the caller is used as-is,
+        including any adapters already mounted on it.
+
+        If a `rate_limiter` is given, every request takes a token from it before being sent.
+
+        Failed requests are retried according to `retry_policy`. If no policy is given, `auto_retry` enables
+        the default `RetryPolicy`, otherwise requests are not retried at all.
+
+        `timeout` is passed to every request, either as a single value or as a `(connect, read)` tuple.
+        Inside a `deadline` block it is shortened to the time left.
+
+        `trusted_reads` is the default for the `trusted` parameter of the read methods of all endpoints.
+
+        If a `cache` is given, the responses of `fetch` and `fetch_one` are served from it while they are valid.
+
+        If `conditional_requests` is set, GET requests are sent with the `ETag` and `Last-Modified` validators of
+        the previous response to the same URL, and bodies equal to the previous one are not decoded again.
+
+        If `coalesce_reads` is set, identical requests of `fetch` and `fetch_one` running at the same time share a
+        single request and its result.
+
+        Setting `log_requests` to `False` drops the debug and info messages logged for every request.
+        """
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.api_instance = instance
+
+        super().__init__(
+            api_key,
+            api_version,
+            base_url,
+            logger,
+            auto_retry,
+            rate_limiter,
+            retry_policy,
+            timeout,
+            trusted_reads,
+            cache,
+            conditional_requests,
+            coalesce_reads,
+            log_requests,
+        )
+
+    def _set_auth_header(self, value: str) -> None:
+        self.session.headers["Authorization"] = value
+
+    def close(self) -> None:
+        """
+        Closes the underlying session and its connection pool. Sessions passed in by the caller are left open.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> EasyvereinClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def _do_request(  # noqa: PLR0913
         self,
         method: str,
@@ -88,84 +611,125 @@ class EasyvereinClient:
         data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
         files: dict[str, BufferedReader] | None = None,
-    ) -> tuple[int, dict[str, Any] | requests.Response | None]:
+        adapter: TypeAdapter[Any] | None = None,
+        cache: bool = False,
+        conditional: bool = True,
+    ) -> tuple[int, dict[str, Any] | requests.Response | Any | None]:
         """
         Helper method that performs an actual call against the API, catching the most common errors
+
+        If an `adapter` is given, successful responses are validated straight from the raw response bytes. If
+        `cache` is set, the response is served from and stored in the response cache of the client. Unless
+        `conditional` is turned off, GET requests are sent as conditional requests if these are enabled.
         """
-        self.logger.debug("Performing %s request to %s", method, url)
-        if data:
-            self.logger.debug("Request data: %s", data)
-        if headers:
-            self.logger.debug("Provided request headers: %s", headers)
+        conditional = conditional and method == "get" and not binary
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Performing %s request to %s", method, url)
+            if data:
+                self.logger.debug("Request data: %s", LazyPayload(data))
+            if headers:
+                self.logger.debug("Provided request headers: %s", headers)
 
-        # Merge auth header with custom headers
-        final_headers = self._get_header() | (headers or {})
+        if cache:
+            cached = self._cached_response(url, adapter)
+            if cached is not None:
+                return cached
 
-        self.logger.debug("Final request headers: %s", final_headers)
+        known, headers = self._conditional_headers(method, url, headers, conditional)
 
-        func = getattr(requests, method)
-        res: requests.Response
-        if data:
-            res = func(url, headers=final_headers, json=data, files=files or {})
+        try:
+            res = self._send(method, url, data, headers, files)
+        except self.timeout_exceptions as e:
+            raise self._timed_out(method, url, e) from e
+        finally:
+            # Whether a write succeeded or not, cached responses of its endpoint may be outdated now
+            self._invalidate_cache(method, url)
+
+        if conditional:
+            status_code, content, validators = self._revalidate(url, known, res.status_code, res.headers, res.content)
         else:
-            res = func(url, headers=final_headers, files=files)
+            status_code, content, validators = res.status_code, res.content, None
 
-        self.logger.debug("Request returned status code %d", res.status_code)
+        if cache:
+            self._cache_response(url, status_code, content)
 
-        if res.status_code == 429:
-            retry_after = res.headers["Retry-After"]
-
-            try:
-                retry_after = int(retry_after)
-            except ValueError:
-                self.logger.error("Unable to parse Retry-After header while handling 429 response code.")
-                self.logger.debug("Retry-After header: %s", retry_after)
-                retry_after = 0
-
-            self.logger.warning(
-                "Request returned status code 429, too many requests. Wait %d seconds",
-                retry_after,
-            )
-            if self.auto_retry:
-                self.logger.warning("Retrying after %d seconds sleep.", retry_after)
-                sleep(retry_after)
-                if files:
-                    for v in files.values():
-                        v.seek(0)  # reset file seek, as it has been moved by the previous call
-
-                return self._do_request(method, url, binary, data, headers, files)
-            else:
-                raise EasyvereinAPITooManyRetriesException(
-                    f"Too many requests, please wait {retry_after} seconds and try again.",
-                    retry_after=retry_after,
-                )
-
-        # If API version is v2.0, check if token refresh is required
-        if self.api_version == "v2.0" and res.headers.get("tokenRefreshNeeded", "false") == "True":
+        if self._token_refresh_needed(res.headers):
             self.logger.info("Token refresh required")
             self.api_instance.handle_token_refresh()
 
-        if res.status_code == 404:
+        if status_code == 404:
             self.logger.warning("Request returned status code 404, resource not found")
             raise EasyvereinAPINotFoundException("Requested resource not found")
 
         # In some cases (for example on 204 delete) the response is empty
-        if res.content == b"":
-            return res.status_code, None
+        if content == b"":
+            return status_code, None
 
         # If content is supposed to be binary, return the entire response to maintain headers
         if binary:
-            return res.status_code, res
+            return status_code, res
 
-        # Try to parse response as JSON and return it for further processing
-        try:
-            content = res.json()
-        except ValueError:
-            self.logger.error("Unable to parse response content as JSON")
-            self.logger.debug("Response content: %s", res.content)
-            content = None
+        return self._decode_content(status_code, content, adapter, validators)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        files: dict[str, BufferedReader] | None,
+    ) -> requests.Response:
+        """
+        Sends a request, retrying transient errors according to the retry policy
+        """
+        # Encode the body once, instead of on every attempt
+        body = dumps(data) if data else None
+        if body is not None:
+            headers = {"Content-Type": "application/json", **(headers or {})}
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if attempt > 1 and files:
+                for v in files.values():
+                    v.seek(0)  # reset file seek, as it has been moved by the previous call
+
+            if self.rate_limiter:
+                waited = self.rate_limiter.acquire()
+                if waited:
+                    self.logger.debug("Rate limiter delayed request by %.3f seconds", waited)
+
+            timeout = self._request_timeout()
+
+            # The auth header is set on the session, custom headers are merged in by requests
+            try:
+                res = self.session.request(method, url, headers=headers, data=body, files=files, timeout=timeout)
+            except self._retry_exceptions() as e:
+                delay = self._retry_delay(method, attempt, None, None)
+                if delay is None:
+                    raise
+                self.logger.warning("Request failed with %r, retrying in %.1f seconds (attempt %d)", e, delay, attempt)
+                sleep(delay)
+                continue
+
+            self.logger.debug("Request returned status code %d", res.status_code)
+
+            if self._is_transient(res.status_code):
+                retry_after = self._parse_retry_after(res.headers)
+                delay = self._retry_delay(method, attempt, res.status_code, retry_after)
+                if delay is not None:
+                    self.logger.warning(
+                        "Request returned status code %d, retrying in %.1f seconds (attempt %d)",
+                        res.status_code,
+                        delay,
+                        attempt,
+                    )
+                    sleep(delay)
+                    continue
+                if res.status_code == 429:
+                    raise self._too_many_requests(retry_after)
 
-        return res.status_code, content
+            return res
 
     def create(
         self,
@@ -204,7 +768,7 @@ class EasyvereinClient:
             expected_status_code=status_code,
         )
 
-    def bulk_create(self, url, data: list[BaseModel], status_code: int = 201) -> ResponseSchema:
+    def bulk_create(self, url, data: Sequence[BaseModel], status_code: int = 201) -> ResponseSchema:
         """
         Method to create multiple objects in the API
         """
@@ -218,7 +782,7 @@ class EasyvereinClient:
         )
 
     def bulk_update(
-        self, url, data: list[BaseModel], status_code: int = 200, exclude_none: bool = True
+        self, url, data: Sequence[BaseModel], status_code: int = 200, exclude_none: bool = True
     ) -> ResponseSchema:
         """
         Method to update multiple objects in the API
@@ -266,13 +830,34 @@ class EasyvereinClient:
             status_code,
         )
 
-    def fetch(self, url) -> ResponseSchema:
+    def _fetch(
+        self, url: str, adapter: TypeAdapter[Any] | None, cache: bool = True
+    ) -> tuple[int, dict[str, Any] | requests.Response | Any | None]:
+        """
+        Sends a GET request served from the response cache, sharing identical requests in flight if enabled
+
+        If `cache` is turned off, the request is sent on its own, bypassing the response cache, conditional requests
+        and the sharing of identical requests.
+        """
+        if not cache:
+            return self._do_request("get", url, adapter=adapter, conditional=False)
+        if self.single_flight is None:
+            return self._do_request("get", url, adapter=adapter, cache=True)
+        return self.single_flight.do((url, adapter), lambda: self._do_request("get", url, adapter=adapter, cache=True))
+
+    def fetch(self, url, model: type[BaseModel] | None = None, cache: bool = True) -> ResponseSchema:
         """
         Helper method that fetches a result from an API call
 
+        If the `model` of the results is given, a paginated response is validated straight from the raw
+        response, and the result holds model instances instead of dicts.
+
+        Responses are served from the response cache of the client unless `cache` is turned off, which also skips
+        conditional requests and the sharing of identical requests in flight.
+
         Only supports GET endpoints
         """
-        res = self._do_request("get", url)
+        res = self._fetch(url, page_adapter(model) if model else None, cache)
         return self._handle_response(res, 200)
 
     def fetch_file(self, url: str) -> tuple[bytes, CaseInsensitiveDict[str]]:
@@ -295,105 +880,80 @@ class EasyvereinClient:
 
         return res.content, res.headers
 
-    def fetch_one(self, url) -> ResponseSchema:
+    def fetch_one(self, url, model: type[BaseModel] | None = None, cache: bool = True) -> ResponseSchema:
         """
         Helper method that fetches a result from an API call
 
-        Only supports GET endpoints
-        """
-        reply = self.fetch(url)
-        if isinstance(reply.result, list):
-            if len(reply.result) == 0:
-                reply.result = None
-                reply.count = 0
-                return reply
+        If the `model` of the result is given, the object is validated straight from the raw response.
 
-            self.logger.warning("One object was requested, but multiple objects were returned. Returning first.")
-            self.logger.debug(f"In total {len(reply.result)} objects where returned.")
-            reply.result = reply.result[0]
-            reply.count = 1
-            return reply
+        Responses are served from the response cache of the client unless `cache` is turned off, which also skips
+        conditional requests and the sharing of identical requests in flight.
 
-        return reply
+        Only supports GET endpoints
+        """
+        res = self._fetch(url, object_adapter(model) if model else None, cache)
+        return self._single_result(self._handle_response(res, 200), model)
 
-    def fetch_paginated(self, url) -> ResponseSchema:
+    def fetch_paginated(self, url, max_workers: int = 1, model: type[BaseModel] | None = None) -> ResponseSchema:
         """
         Helper method that fetches all pages of a paginated API call
 
+        By default, pages are fetched one after another by following the `next` links. If `max_workers` is
+        larger than one and the API returned the total count (`showCount`), the remaining pages are computed
+        from the first page and fetched concurrently by a pool of `max_workers` threads. Pages are returned
+        in order in both cases.
+
         Only supports GET endpoints
         """
         resources = []
-        status_code: int = 0
 
-        while url is not None:
-            self.logger.debug("Fetching paginated API at %s", url)
-
-            status_code, result = self._do_request("get", url)
-
-            if not isinstance(result, dict):
-                self.logger.error("Could not fetch paginated API %s, status code %d", url, status_code)
-                self.logger.debug("API response: %s", result)
-                raise EasyvereinAPIException(
-                    f"Could not fetch paginated API {url}, status code {status_code}. API response: {result}"
-                )
-
-            if not status_code == 200:
-                self.logger.error("Could not fetch paginated API %s, status code %d", url, status_code)
-                self.logger.debug("API response: %s", result)
-                raise EasyvereinAPIException(
-                    f"Could not fetch paginated API {url}, status code {status_code}. API response: {result}"
-                )
+        if max_workers > 1:
+            page = self._fetch_page(url, model)
+            resources.extend(page["results"])
+            page_urls = self._remaining_page_urls(url, page)
+            url = page["next"]
+
+            if page_urls:
+                self.logger.debug("Fetching %d remaining pages with %d workers", len(page_urls), max_workers)
+                # Worker threads don't inherit context variables, run each page in a copy of the caller's context
+                # so the current deadline applies to them, too
+                contexts = [copy_context() for _ in page_urls]
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for page in executor.map(lambda ctx, u: ctx.run(self._fetch_page, u, model), contexts, page_urls):
+                        resources.extend(page["results"])
+
+                # Continue with the regular pagination in case objects were added in the meantime
+                url = page["next"]
+
+        for results in self.iter_paginated(url, model):
+            resources.extend(results)
+
+        # All pages have been checked for status code 200 already
+        return self._handle_response((200, resources), 200)
+
+    def iter_paginated(
+        self, url: str | None, model: type[BaseModel] | None = None, conditional: bool = True
+    ) -> Iterator[list[Any]]:
+        """
+        Generator following the `next` links of a paginated API call, yielding the results of one page at a time.
 
-            resources.extend(result["results"])
-            url = result["next"]
+        The next page is only requested once the previous one has been consumed. Unless `conditional` is turned
+        off, the pages are remembered for conditional requests, if these are enabled.
 
-        return self._handle_response((status_code, resources), 200)
+        Only supports GET endpoints
+        """
+        while url is not None:
+            page = self._fetch_page(url, model, conditional)
+            url = page["next"]
+            yield page["results"]
 
-    def _handle_response(
-        self,
-        res: tuple[int, dict[str, Any] | list[dict[str, Any]] | requests.Response | None],
-        expected_status_code=200,
-    ) -> ResponseSchema:
+    def _fetch_page(self, url: str, model: type[BaseModel] | None = None, conditional: bool = True) -> dict[str, Any]:
         """
-        Helper method that handles API responses
+        Fetches and checks a single page of a paginated API call
         """
-        status_code, data = res
-        if status_code != expected_status_code:
-            raise EasyvereinAPIException(f"API returned status code {status_code}. API response: {data}")
-        else:
-            self.logger.debug("API returned status code %d", status_code)
-
-        self.logger.debug("Received raw data: %s", data)
+        self.logger.debug("Fetching paginated API at %s", url)
 
-        if data is None:
-            return ResponseSchema(result=None, count=0, response_code=status_code)
-
-        # if data is a list, parse each entry
-        # fetch_paginated returns a list of result entries instead of raw data, this is why this case is here.
-        if isinstance(data, list):
-            return ResponseSchema(
-                result=data,
-                count=len(data),
-                response_code=status_code,
-            )
-        elif isinstance(data, dict) and "results" in data:
-            return ResponseSchema(
-                result=data["results"],
-                count=data.get("count", 0),
-                response_code=status_code,
-            )
-        elif isinstance(data, requests.Response):
-            # Return the raw response object
-            return ResponseSchema(
-                result=None,
-                count=0,
-                response_code=status_code,
-                response=data,
-            )
-        else:
-            # Return the single object
-            return ResponseSchema(
-                result=data,
-                count=1,
-                response_code=status_code,
-            )
+        status_code, result = self._do_request(
+            "get", url, adapter=page_adapter(model) if model else None, conditional=conditional
+        )
+        return self._check_page(url, status_code, result)
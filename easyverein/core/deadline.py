@@ -0,0 +1,52 @@
+"""
+Time budget shared by all requests of a single operation
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+from .exceptions import EasyvereinAPITimeoutException
+
+_deadline: ContextVar[float | None] = ContextVar("easyverein_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Context manager limiting the total time all API calls inside the block may take, including retries,
+    pagination and helpers performing several requests. Once the budget is used up, the next request raises
+    `EasyvereinAPITimeoutException` instead of being sent.
+
+    The deadline is stored in a context variable, so it applies to the current thread or asyncio task only.
+    Nested deadlines can only shorten the budget, never extend it.
+    """
+    if seconds < 0:
+        raise ValueError("Deadline must not be negative")
+
+    current = _deadline.get()
+    new = monotonic() + seconds
+    token = _deadline.set(new if current is None else min(current, new))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """
+    Returns the number of seconds left until the current deadline, or None if no deadline is set.
+
+    Raises `EasyvereinAPITimeoutException` if the deadline has already passed.
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+
+    remaining = current - monotonic()
+    if remaining <= 0:
+        raise EasyvereinAPITimeoutException("Deadline exceeded before the request could be sent")
+    return remaining
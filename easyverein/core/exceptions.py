@@ -28,3 +28,9 @@ class EasyvereinAPITooManyRetriesException(EasyvereinAPIException):
         self.retry_after = retry_after
 
     retry_after = 0
+
+
+class EasyvereinAPITimeoutException(EasyvereinAPIException, TimeoutError):
+    """
+    Exception if a request timed out or the deadline of an operation has been exceeded
+    """
@@ -1,6 +1,7 @@
 import logging
 from typing import Protocol, Type, TypeVar
 
+from .async_client import AsyncEasyvereinClient
 from .client import EasyvereinClient
 
 T = TypeVar("T", covariant=True)
@@ -9,7 +10,7 @@ T = TypeVar("T", covariant=True)
 # noinspection PyPropertyDefinition
 class EVClientProtocol(Protocol[T]):
     @property
-    def logger(self) -> logging.Logger: ...
+    def logger(self) -> logging.Logger | logging.LoggerAdapter: ...
 
     @property
     def c(self) -> EasyvereinClient: ...
@@ -19,3 +20,18 @@ class EVClientProtocol(Protocol[T]):
 
     @property
     def return_type(self) -> Type[T]: ...
+
+
+# noinspection PyPropertyDefinition
+class AsyncEVClientProtocol(Protocol[T]):
+    @property
+    def logger(self) -> logging.Logger | logging.LoggerAdapter: ...
+
+    @property
+    def c(self) -> AsyncEasyvereinClient: ...
+
+    @property
+    def endpoint_name(self) -> str: ...
+
+    @property
+    def return_type(self) -> Type[T]: ...
@@ -0,0 +1,85 @@
+"""
+Client side rate limiting
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the number of requests sent to the API.
+
+    The bucket holds up to `burst` tokens and is refilled with `rate` tokens per second. Every request takes
+    one token, if the bucket is empty the caller waits until a token becomes available. Waiting callers reserve
+    their token up front, so concurrent callers are spaced out evenly instead of waking up at the same time.
+
+    A single instance is shared by all endpoints of a client, and can also be shared between clients that use
+    the same API key.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Number of requests allowed per second on average
+            burst: Maximum number of requests that can be sent at once after a period of inactivity
+        """
+        if rate <= 0:
+            raise ValueError("rate must be larger than zero")
+        if burst < 1:
+            raise ValueError("burst must be at least one")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """
+        Adds the tokens generated since the last update. Must be called holding the lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token from the bucket and returns the number of seconds the caller has to wait before
+        the request may be sent.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """
+        Empties the bucket so no token becomes available for the given number of seconds, for example after
+        the API responded with 429 Too Many Requests.
+        """
+        with self._lock:
+            # Credit the time that passed before the pause first, so it isn't counted towards the pause later
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    def acquire(self) -> float:
+        """
+        Blocks until a request may be sent. Returns the time waited in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Waits without blocking the event loop until a request may be sent. Returns the time waited in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
@@ -1,18 +1,80 @@
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Annotated, Any, Generic, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from requests import Response
 
+T = TypeVar("T", bound=BaseModel)
 
-class ResponseSchema(BaseModel):
-    result: dict[str, Any] | list[dict[str, Any]] | None = None
+
+@dataclass(slots=True, kw_only=True)
+class ResponseSchema:
+    """
+    Envelope passing API results from the client to the endpoint mixins.
+
+    This is deliberately a plain dataclass instead of a Pydantic model: the results are validated by
+    `parse_models` anyway, validating them here as well would walk every row of large responses twice.
+    If the client already validated the response into models, `result` holds the model instances.
+    """
+
+    result: dict[str, Any] | list[dict[str, Any]] | BaseModel | list[BaseModel] | None = None
     count: int | None = None
     response_code: int
-    response: Response | None = None
+    response: Response | Any | None = None
     token_refresh_required: bool = False
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+class Page(BaseModel, Generic[T]):
+    """
+    A single page of a paginated API response
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    count: int | None = None
+    next: str | None = None
+    results: list[T]
+
+
+@lru_cache(maxsize=None)
+def page_adapter(model: type[T]) -> TypeAdapter[Page[T]]:
+    """
+    Returns a cached `TypeAdapter` validating a page of a paginated endpoint straight from the response JSON
+    """
+    return TypeAdapter(Page[model])  # type: ignore[valid-type]
+
+
+@lru_cache(maxsize=None)
+def object_adapter(model: type[T]) -> TypeAdapter[Page[Any] | list[Any] | T]:
+    """
+    Returns a cached `TypeAdapter` validating a single object straight from the response JSON
+
+    Lists and pages of objects are not validated, but returned holding plain dicts. Otherwise, they would be
+    validated into an object holding only default values, as unknown keys are ignored.
+    """
+    return TypeAdapter(Annotated[Union[Page[Any], list[Any], model], Field(union_mode="left_to_right")])  # type: ignore[arg-type]
+
+
+def copy_result(value: Any) -> Any:
+    """
+    Returns a copy of a decoded response, copying all models, lists and dicts it contains. Other values are
+    immutable and shared with the original.
+    """
+    if isinstance(value, BaseModel):
+        copied = value.model_copy()
+        for name, item in copied.__dict__.items():
+            if isinstance(item, (BaseModel, list, dict)):
+                copied.__dict__[name] = copy_result(item)
+        return copied
+    if isinstance(value, list):
+        return [copy_result(item) for item in value]
+    if isinstance(value, dict):
+        return {key: copy_result(item) for key, item in value.items()}
+    return value
 
 
 class BearerToken(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     Bearer: str
@@ -0,0 +1,69 @@
+"""
+Retry policy used by the clients to handle transient errors
+"""
+
+import random
+from dataclasses import dataclass, field
+
+IDEMPOTENT_METHODS = frozenset({"get", "head", "options", "put", "delete"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Describes which failed requests are retried and how long to wait in between.
+
+    Requests answered with `429 Too Many Requests` were not processed by the API and are therefore retried
+    for all methods. Other retryable status codes and connection errors are only retried for the methods
+    in `retry_methods`, which defaults to the idempotent HTTP methods.
+
+    The delay before attempt `n + 1` is `backoff_base * 2 ** (n - 1)`, capped at `backoff_max`. With `jitter`
+    enabled, a random delay between zero and this value is used instead ("full jitter"). If the API sends a
+    `Retry-After` header and `respect_retry_after` is set, its value is used instead.
+    """
+
+    max_attempts: int = 5
+    """Maximum number of attempts, including the first one"""
+    backoff_base: float = 0.5
+    """Delay in seconds before the first retry"""
+    backoff_max: float = 30.0
+    """Upper bound for the computed delay in seconds"""
+    jitter: bool = True
+    """Randomize delays, so concurrent clients don't retry at the same time"""
+    retry_status_codes: frozenset[int] = frozenset({429, 502, 503, 504})
+    """Status codes considered transient"""
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    """Methods (lower case) retried on transient status codes other than 429 and on connection errors"""
+    retry_exceptions: tuple[type[Exception], ...] | None = field(default=None)
+    """Exceptions considered transient. Defaults to connection errors and timeouts of the HTTP library in use"""
+    respect_retry_after: bool = True
+    """Wait for the time indicated by the `Retry-After` header if present"""
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least one")
+
+    def should_retry(self, method: str, attempt: int, status_code: int | None = None) -> bool:
+        """
+        Whether a request that failed on its `attempt`-th try should be retried. A `status_code` of `None`
+        indicates that the request failed with an exception.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code == 429:
+            return 429 in self.retry_status_codes
+        if status_code is not None and status_code not in self.retry_status_codes:
+            return False
+        return method.lower() in self.retry_methods
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Computes the number of seconds to wait after the `attempt`-th try failed
+        """
+        if retry_after is not None and self.respect_retry_after:
+            return retry_after
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
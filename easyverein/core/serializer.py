@@ -0,0 +1,36 @@
+"""
+JSON encoding and decoding used by the clients
+
+Uses `orjson` if it is installed, which is considerably faster for large paginated responses,
+and falls back to the standard library `json` module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+JSON_BACKEND = "orjson" if orjson else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encodes an object as UTF-8 JSON
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, allow_nan=False, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decodes JSON, raises `ValueError` if the data is not valid JSON
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
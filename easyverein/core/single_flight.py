@@ -0,0 +1,91 @@
+"""
+Coalescing of identical concurrent requests
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from .deadline import remaining_time
+from .exceptions import EasyvereinAPITimeoutException
+
+T = TypeVar("T")
+
+
+class _Call:
+    """
+    A call in flight, which other threads can wait for
+    """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Makes sure a function runs only once at a time per key. Callers arriving while a call with the same key is in
+    flight don't run the function themselves, but wait for the running call and share its result or exception.
+
+    Threads and asyncio tasks are tracked separately, so a single instance serves both `do` and `do_async`.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[Hashable, asyncio.Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Returns the result of `func`, or the result of the call with the same key another thread is running.
+
+        Waiting for another thread respects the current deadline.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(remaining_time()):
+                raise EasyvereinAPITimeoutException("Deadline exceeded while waiting for an identical request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns the result of `func`, or the result of the call with the same key another task is running.
+
+        The call runs in its own task, so it is completed for the other callers even if the caller that started it
+        is cancelled.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._task_done(key, done))
+        return await asyncio.shield(task)
+
+    def _task_done(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # Mark the exception as retrieved, in case all callers have been cancelled in the meantime
+        if not task.cancelled():
+            task.exception()
@@ -4,17 +4,133 @@ Custom types used for model validation
 
 import datetime
 import json
-from typing import Annotated, Literal
+import re
+from functools import cached_property
+from typing import Annotated, Any, Literal
 
-from pydantic import Field, PlainSerializer, PlainValidator, UrlConstraints
-from pydantic_core import Url
+from pydantic import Field, GetCoreSchemaHandler, PlainSerializer, PlainValidator, UrlConstraints
+from pydantic_core import CoreSchema, Url, core_schema
+
+from .exceptions import EasyvereinAPIException
 
 AnyHttpURL = Annotated[
     Url,
     UrlConstraints(allowed_schemes=["http", "https"]),
     PlainSerializer(lambda x: str(x), return_type=str),
 ]
-EasyVereinReference = int | AnyHttpURL | None
+
+# Matches the path of a reference URL following the API version, like `member/4/custom-fields/9`
+_REFERENCE_PATH = re.compile(r"/api/v[\d.]+/([^?#]+)/(\d+)/?(?:[?#].*)?$")
+
+# Nested endpoints by the name used in URLs, mapped to the method of the parent endpoint returning them
+_NESTED_ENDPOINTS = {"custom-fields": "custom_field", "groups": "member_group", "select-options": "select_option"}
+
+
+class Ref(str):
+    """
+    A reference to another object as returned by the API, like `https://easyverein.com/api/v2.0/member/123`.
+
+    References are plain strings holding the URL. Only the scheme is checked during validation, which is
+    considerably cheaper than validating a full `Url`. The endpoint and the id are parsed once, when one of them
+    is accessed for the first time. `Url` objects, the type of references in earlier versions, are accepted as well.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        url = core_schema.str_schema(pattern=r"^https?://")
+        from_url = core_schema.chain_schema(
+            [core_schema.is_instance_schema(Url), core_schema.no_info_plain_validator_function(str), url]
+        )
+        return core_schema.no_info_after_validator_function(
+            cls,
+            core_schema.json_or_python_schema(
+                json_schema=url, python_schema=core_schema.union_schema([url, from_url], mode="left_to_right")
+            ),
+        )
+
+    @cached_property
+    def _parts(self) -> tuple[str, int]:
+        match = _REFERENCE_PATH.search(self)
+        if not match:
+            raise ValueError(f"{self} does not reference an object")
+        return match.group(1), int(match.group(2))
+
+    @property
+    def endpoint(self) -> str:
+        """
+        Endpoint of the referenced object, like `member` or `member/4/custom-fields`
+        """
+        return self._parts[0]
+
+    @property
+    def id(self) -> int:
+        """
+        Id of the referenced object
+        """
+        return self._parts[1]
+
+    def resolve(self, api: Any, query: str = "") -> Any:
+        """
+        Fetches the referenced object using the matching endpoint of `api`, which is either an `EasyvereinAPI`
+        or an `AsyncEasyvereinAPI`. With the latter, the result has to be awaited.
+
+        Args:
+            api: API instance used to fetch the object
+            query: Query to use with API, see `get_by_id`
+        """
+        endpoint, obj_id = self._parts
+        name, *nested = endpoint.split("/")
+        mixin = next((m for m in vars(api).values() if getattr(m, "endpoint_name", None) == name), None)
+        if nested:
+            # Nested endpoints like `member/4/custom-fields` are created by a method of the parent endpoint
+            method = _NESTED_ENDPOINTS.get(nested[-1], "")
+            if len(nested) == 2 and nested[0].isdigit() and hasattr(mixin, method):
+                mixin = getattr(mixin, method)(int(nested[0]))
+            else:
+                mixin = None
+        if mixin is None:
+            raise EasyvereinAPIException(f"No endpoint available to resolve {self}")
+        return mixin.get_by_id(obj_id, query=query)
+
+
+EasyVereinReference = int | Ref | None
+
+
+def _is_reference(schema: Any) -> bool:
+    return schema["type"] == "function-after" and schema["function"].get("function") is Ref
+
+
+def route_references(schema: Any) -> CoreSchema:
+    """
+    Rewrites the unions of a field schema containing `EasyVereinReference`, like `ContactDetails | int | Ref`.
+
+    By default pydantic tries every choice of such a union, first strictly and then in lax mode, and picks the
+    best match. Instead, a JSON integer is accepted by the first choice, a URL string by the second and an object
+    by the nested model, so each value is validated once. Integers sent as strings are still accepted last.
+    """
+    schema_type = schema["type"]
+    if schema_type in {"nullable", "default"}:
+        return {**schema, "schema": route_references(schema["schema"])}
+    if schema_type == "list":
+        return {**schema, "items_schema": route_references(schema["items_schema"])}
+    if schema_type != "union" or schema.get("mode", "smart") != "smart":
+        return schema
+
+    choices = [route_references(choice) for choice in schema["choices"] if not isinstance(choice, tuple)]
+    if len(choices) != len(schema["choices"]):
+        return schema
+    integers = [choice for choice in choices if choice["type"] == "int"]
+    references = [choice for choice in choices if _is_reference(choice)]
+    if len(integers) != 1 or len(references) != 1:
+        return {**schema, "choices": choices}
+    others = [choice for choice in choices if choice["type"] != "int" and not _is_reference(choice)]
+    return {
+        **schema,
+        "choices": [{**integers[0], "strict": True}, references[0], *others, integers[0]],
+        "mode": "left_to_right",
+    }
+
+
 PositiveIntWithZero = Annotated[int, Field(ge=0)]
 Date = Annotated[datetime.date, PlainSerializer(lambda x: x.strftime("%Y-%m-%d"), return_type=str)]
 DateTime = Annotated[
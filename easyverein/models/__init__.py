@@ -39,14 +39,5 @@ from .member_member_group import (
     MemberMemberGroupFilter,
     MemberMemberGroupUpdate,
 )
-
-Booking.model_rebuild()
-ContactDetails.model_rebuild()
-CustomField.model_rebuild()
-CustomFieldSelectOption.model_rebuild()
-Invoice.model_rebuild()
-InvoiceItem.model_rebuild()
-Member.model_rebuild()
-MemberGroup.model_rebuild()
-MemberCustomField.model_rebuild()
-MemberMemberGroup.model_rebuild()
+from .query import QueryModel, query_model
+from .slim import SlimModel, slim_type, to_slim
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
 from ..core.types import DateTime, EasyVereinReference
 
@@ -8,6 +8,9 @@ class EasyVereinBase(BaseModel):
     Base class encapsulating common fields for all models
     """
 
+    # Schemas are built on first use instead of at import time, which keeps importing the library cheap
+    model_config = ConfigDict(defer_build=True)
+
     id: PositiveInt | None = None
     org: EasyVereinReference | None = None
     # TODO: Add reference to Organization once implemented
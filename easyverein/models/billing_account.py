@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, PositiveInt
+from pydantic import BaseModel, ConfigDict, PositiveInt
 
 from ..core.types import EasyVereinReference, FilterIntList, FilterStrList, PositiveIntWithZero, Sphere
 from .base import EasyVereinBase
@@ -52,6 +52,8 @@ class BillingAccountFilter(BaseModel):
     Pydantic model used to filter billing accounts
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     name: str | None = None
     skr: str | None = None
@@ -4,7 +4,7 @@ Invoice Item model
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.types import DateTime, EasyVereinReference, FilterIntList, Sphere
 from .base import EasyVereinBase
@@ -65,6 +65,8 @@ class BookingFilter(BaseModel):
     Pydantic model used to filter bookings
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     blocked: bool | None = None
     receiver: str | None = None
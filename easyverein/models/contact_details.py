@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from ..core.types import Date, FilterIntList
 from .base import EasyVereinBase
@@ -146,6 +146,8 @@ class ContactDetailsFilter(BaseModel):
     Pydantic model used to filter contact details
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     country: str | None = None
     isCompany: bool | None = Field(default=None, serialization_alias="_isCompany")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..core.types import EasyVereinReference, FilterIntList, HexColor, PositiveIntWithZero
 from .base import EasyVereinBase
@@ -95,6 +95,8 @@ class CustomFieldFilter(BaseModel):
     Pydantic model used to filter custom fields
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     name: str | None = None
     color: str | None = None
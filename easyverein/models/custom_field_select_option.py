@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.types import FilterIntList, FilterStrList, PositiveIntWithZero
 from .base import EasyVereinBase
@@ -50,6 +50,8 @@ class CustomFieldSelectOptionFilter(BaseModel):
     Pydantic model used to filter custom field select options
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     value: str | None = None
     value__in: FilterStrList | None = None
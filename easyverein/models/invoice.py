@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.types import (
     Date,
@@ -43,7 +43,8 @@ class InvoiceBase(EasyVereinBase):
     taxRate: float | None = None
     taxName: str | None = None
     relatedAddress: ContactDetails | EasyVereinReference | None = None
-    path: EasyVereinReference | None = None
+    # Usually a URL, but may hold a plain file path as well
+    path: EasyVereinReference | str | None = None
     kind: (
         Literal[
             "balance",
@@ -105,6 +106,8 @@ class InvoiceFilter(BaseModel):
     Pydantic model used to filter invoices
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     relatedAddress: int | None = None
     relatedAddress__isnull: bool | None = None
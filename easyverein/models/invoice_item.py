@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
 from ..core.types import EasyVereinReference, FilterIntList, Sphere
 from .base import EasyVereinBase
@@ -68,6 +68,8 @@ class InvoiceItemFilter(BaseModel):
     Pydantic model used to filter invoice items
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     title: str | None = None
     taxName: str | None = None
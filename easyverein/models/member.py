@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
 from ..core.types import (
     AnyHttpURL,
@@ -123,6 +123,8 @@ class MemberFilter(BaseModel):
     Pydantic model used to filter members
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     paymentAmount__gt: float | None = None
     paymentAmount__lt: float | None = None
@@ -197,6 +199,8 @@ class MemberSetLsb(BaseModel):
     Does not match the documentation, but works (with v2.0 in january 2026 at least)
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     lsbSport: list[str]
 
 
@@ -208,6 +212,8 @@ class MemberSetDosb(BaseModel):
     And for some reason, has another format than the set-lsb endpoint
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     dosb_sport: list[str]
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.types import EasyVereinReference, FilterIntList
 from .base import EasyVereinBase
@@ -62,6 +62,8 @@ class MemberCustomFieldFilter(BaseModel):
     Pydantic model used to filter members custom fields
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     paymentActive: bool | None = None
     start__gte: str | None = None
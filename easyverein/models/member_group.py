@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
 
 from ..core.types import (
     EasyVereinReference,
@@ -147,6 +147,8 @@ class MemberGroupUpdate(MemberGroupBase):
 
 
 class MemberGroupFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     name: str | None = None
     paymentAmount: float | None = None
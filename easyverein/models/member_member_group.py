@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..core.types import Date, EasyVereinReference, FilterIntList
 from .base import EasyVereinBase
@@ -51,6 +51,8 @@ class MemberMemberGroupUpdate(MemberMemberGroupBase):
 
 
 class MemberMemberGroupFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id__in: FilterIntList | None = None
     paymentActive: bool | None = None
     start__gte: Date | None = None
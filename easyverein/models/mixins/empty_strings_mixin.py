@@ -3,23 +3,73 @@ This module contains a generic plugin for Pydantic models that removes
 empty strings and converts them to None.
 """
 
+import re
 from typing import Any
 
-from pydantic import model_validator
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
 
+from ...core.types import route_references
 
-class EmptyStringsToNone:
+# Matches the empty string only, so the Python function converting it to None runs for empty strings only
+EMPTY_STRING_SCHEMA = core_schema.no_info_after_validator_function(lambda _: None, core_schema.literal_schema([""]))
+
+
+def _accepts_empty_string(schema: Any) -> bool:
     """
-    Mixin class for Pydantic models
+    Whether a schema might accept an empty string as valid input. Errs on the side of caution.
+    """
+    schema_type = schema["type"]
+    if schema_type == "literal":
+        return "" in schema["expected"]
+    if schema_type == "union":
+        return any(_accepts_empty_string(c[0] if isinstance(c, tuple) else c) for c in schema["choices"])
+    if schema_type in {"int", "float", "decimal", "bool", "date", "datetime", "time", "url", "list", "model"}:
+        return False
+    if schema_type == "str" and "pattern" in schema:
+        try:
+            return re.search(schema["pattern"], "") is not None
+        except re.error:
+            return True
+    if "schema" in schema and schema_type in {"nullable", "function-after", "function-before"}:
+        return _accepts_empty_string(schema["schema"])
+    return True
+
+
+def _allow_empty_string(schema: Any) -> CoreSchema:
+    """
+    Wraps a field schema, so an empty string validates to None instead of being validated by the field type.
+
+    If the field type can't accept an empty string anyway, it is tried first, so no error is raised and discarded
+    for the vast majority of values, which are not empty.
+    """
+    if schema["type"] == "default":
+        return {**schema, "schema": _allow_empty_string(schema["schema"])}
+    if schema["type"] == "union" and any(isinstance(c, tuple) and c[1] == "empty-string" for c in schema["choices"]):
+        # Already wrapped, e.g. when the schema of a model is rebuilt
+        return schema
+    empty_string = (EMPTY_STRING_SCHEMA, "empty-string")
+    if _accepts_empty_string(schema):
+        return core_schema.union_schema([empty_string, schema], mode="left_to_right")
+    return core_schema.union_schema([schema, empty_string], mode="left_to_right")
+
+
+class EmptyStringsToNone(BaseModel):
+    """
+    Mixin class for Pydantic models, converting empty strings of all fields to None.
+
+    Instead of a Python validator looping over every key of every object, each field accepts an empty string
+    as an alternative to its type, so the conversion happens inside pydantic-core.
+
+    As these are the models validating API responses, unions with references are routed by the type of the value
+    as well, see `route_references`.
     """
 
-    @model_validator(mode="before")
-    def empty_string_to_none(cls, data: Any) -> Any:
-        """
-        Pydantic model validator, converting empty strings to None
-        """
-        if isinstance(data, dict):
-            for k, v in data.items():
-                if isinstance(v, str) and v == "":
-                    data[k] = None
-        return data
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: type[BaseModel], handler: GetCoreSchemaHandler) -> CoreSchema:
+        schema = handler(source)
+        if schema["type"] == "model" and schema["schema"]["type"] == "model-fields":
+            fields = schema["schema"]["fields"]
+            for name, field in fields.items():
+                fields[name] = {**field, "schema": _allow_empty_string(route_references(field["schema"]))}
+        return schema
@@ -4,7 +4,7 @@ This module contains a class factory returning a Mixin class
 
 from typing import Self
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
 def required_mixin(required_attributes: list[str | list[str]]):
@@ -31,6 +31,8 @@ def required_mixin(required_attributes: list[str | list[str]]):
         Mixin class for Pydantic models
         """
 
+        model_config = ConfigDict(defer_build=True)
+
         @model_validator(mode="after")
         def required_fields(self) -> Self:
             """
@@ -0,0 +1,101 @@
+"""
+Compact, read-only representations of models
+"""
+
+from collections.abc import Iterable
+from dataclasses import fields, make_dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
+from pydantic import BaseModel
+
+
+class SlimModel:
+    """
+    Base class of all slim types. A slim type is a frozen, slotted dataclass holding a subset of the fields of a
+    model, usually the fields returned for a query. Instances need a fraction of the memory of model instances,
+    which makes them suitable for keeping large numbers of objects in memory.
+
+    Nested models are stored as slim instances and lists as tuples. Fields not held by the slim type can't be
+    accessed. Use `to_slim` to create instances and `to_model` to convert them back.
+    """
+
+    __slots__ = ()
+    __model__: ClassVar[type[BaseModel]]
+
+    if TYPE_CHECKING:
+        # Fields are only known at runtime
+        def __getattr__(self, name: str) -> Any: ...
+
+    def to_model(self) -> BaseModel:
+        """
+        Converts the instance back into an instance of the full model, with all held fields marked as set
+        """
+        values = {f.name: _to_model_value(getattr(self, f.name)) for f in fields(self)}  # type: ignore[arg-type]
+        return self.__model__.model_construct(**values)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slim types are created at runtime and can't be looked up by name when unpickling
+        names = tuple(f.name for f in fields(self))  # type: ignore[arg-type]
+        return _restore, (self.__model__, names, tuple(getattr(self, name) for name in names))
+
+
+@lru_cache(maxsize=None)
+def _slim_type(model: type[BaseModel], names: tuple[str, ...]) -> type[SlimModel]:
+    slim = make_dataclass(
+        f"Slim{model.__name__}",
+        [(name, Any) for name in names],
+        bases=(SlimModel,),
+        namespace={"__model__": model},
+        frozen=True,
+        slots=True,
+        kw_only=True,
+    )
+    slim.__module__ = __name__
+    return cast(type[SlimModel], slim)
+
+
+def slim_type(model: type[BaseModel], field_names: Iterable[str] | None = None) -> type[SlimModel]:
+    """
+    Returns the slim type of `model` holding the given fields, or all fields of the model. Types are cached, so
+    instances holding the same fields share a single type.
+    """
+    if field_names is None:
+        return _slim_type(model, tuple(model.model_fields))
+
+    requested = set(field_names)
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+    return _slim_type(model, tuple(name for name in model.model_fields if name in requested))
+
+
+def _to_slim_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_slim(value)
+    if isinstance(value, list):
+        return tuple(_to_slim_value(v) for v in value)
+    return value
+
+
+def _to_model_value(value: Any) -> Any:
+    if isinstance(value, SlimModel):
+        return value.to_model()
+    if isinstance(value, tuple):
+        return [_to_model_value(v) for v in value]
+    return value
+
+
+def to_slim(instance: BaseModel) -> SlimModel:
+    """
+    Converts a model instance into a slim instance holding only the fields set on the instance. For objects
+    fetched from the API, these are the fields returned for the query.
+    """
+    model = type(instance)
+    slim = slim_type(model, instance.model_fields_set)
+    values = instance.__dict__
+    return slim(**{f.name: _to_slim_value(values[f.name]) for f in fields(slim)})  # type: ignore[arg-type]
+
+
+def _restore(model: type[BaseModel], names: tuple[str, ...], values: tuple[Any, ...]) -> SlimModel:
+    return _slim_type(model, names)(**dict(zip(names, values)))
@@ -4,6 +4,7 @@ All methods related to billing accounts
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models.billing_account import (
     BillingAccount,
@@ -11,6 +12,8 @@ from ..models.billing_account import (
     BillingAccountFilter,
     BillingAccountUpdate,
 )
+from .mixins.async_crud import AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -19,7 +22,19 @@ class BillingAccountMixin(
     CRUDMixin[BillingAccount, BillingAccountCreate, BillingAccountUpdate, BillingAccountFilter],
     RecycleBinMixin[BillingAccount],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        super().__init__()
+        self.endpoint_name = "billing-account"
+        self.return_type = BillingAccount
+        self.c = client
+        self.logger = logger
+
+
+class AsyncBillingAccountMixin(
+    AsyncCRUDMixin[BillingAccount, BillingAccountCreate, BillingAccountUpdate, BillingAccountFilter],
+    AsyncRecycleBinMixin[BillingAccount],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         super().__init__()
         self.endpoint_name = "billing-account"
         self.return_type = BillingAccount
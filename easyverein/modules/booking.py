@@ -4,6 +4,7 @@ All methods related to bookings
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models.booking import (
     Booking,
@@ -11,6 +12,8 @@ from ..models.booking import (
     BookingFilter,
     BookingUpdate,
 )
+from .mixins.async_crud import AsyncBulkUpdateCreateMixin, AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import BulkUpdateCreateMixin, CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -20,7 +23,20 @@ class BookingMixin(
     BulkUpdateCreateMixin[Booking, BookingCreate, BookingUpdate],
     RecycleBinMixin[Booking],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        super().__init__()
+        self.endpoint_name = "booking"
+        self.return_type = Booking
+        self.c = client
+        self.logger = logger
+
+
+class AsyncBookingMixin(
+    AsyncCRUDMixin[Booking, BookingCreate, BookingUpdate, BookingFilter],
+    AsyncBulkUpdateCreateMixin[Booking, BookingCreate, BookingUpdate],
+    AsyncRecycleBinMixin[Booking],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         super().__init__()
         self.endpoint_name = "booking"
         self.return_type = Booking
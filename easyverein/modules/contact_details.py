@@ -4,9 +4,12 @@ All methods related to contact details
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models import ContactDetails, ContactDetailsCreate, ContactDetailsUpdate
 from ..models.contact_details import ContactDetailsFilter
+from .mixins.async_crud import AsyncBulkUpdateCreateMixin, AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import BulkUpdateCreateMixin, CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -16,7 +19,19 @@ class ContactDetailsMixin(
     BulkUpdateCreateMixin[ContactDetails, ContactDetailsCreate, ContactDetailsUpdate],
     RecycleBinMixin[ContactDetails],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        self.endpoint_name = "contact-details"
+        self.return_type = ContactDetails
+        self.c = client
+        self.logger = logger
+
+
+class AsyncContactDetailsMixin(
+    AsyncCRUDMixin[ContactDetails, ContactDetailsCreate, ContactDetailsUpdate, ContactDetailsFilter],
+    AsyncBulkUpdateCreateMixin[ContactDetails, ContactDetailsCreate, ContactDetailsUpdate],
+    AsyncRecycleBinMixin[ContactDetails],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         self.endpoint_name = "contact-details"
         self.return_type = ContactDetails
         self.c = client
@@ -4,6 +4,7 @@ All methods related to custom fields
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models.custom_field import (
     CustomField,
@@ -11,7 +12,9 @@ from ..models.custom_field import (
     CustomFieldFilter,
     CustomFieldUpdate,
 )
-from .custom_field_select_option import CustomFieldSelectOptionMixin
+from .custom_field_select_option import AsyncCustomFieldSelectOptionMixin, CustomFieldSelectOptionMixin
+from .mixins.async_crud import AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -20,7 +23,7 @@ class CustomFieldMixin(
     CRUDMixin[CustomField, CustomFieldCreate, CustomFieldUpdate, CustomFieldFilter],
     RecycleBinMixin[CustomField],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         super().__init__()
         self.endpoint_name = "custom-field"
         self.return_type = CustomField
@@ -29,3 +32,18 @@ class CustomFieldMixin(
 
     def select_option(self, custom_field_id: int) -> CustomFieldSelectOptionMixin:
         return CustomFieldSelectOptionMixin(self.c, self.logger, custom_field_id)
+
+
+class AsyncCustomFieldMixin(
+    AsyncCRUDMixin[CustomField, CustomFieldCreate, CustomFieldUpdate, CustomFieldFilter],
+    AsyncRecycleBinMixin[CustomField],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        super().__init__()
+        self.endpoint_name = "custom-field"
+        self.return_type = CustomField
+        self.c = client
+        self.logger = logger
+
+    def select_option(self, custom_field_id: int) -> AsyncCustomFieldSelectOptionMixin:
+        return AsyncCustomFieldSelectOptionMixin(self.c, self.logger, custom_field_id)
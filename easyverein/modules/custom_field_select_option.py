@@ -1,5 +1,6 @@
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models import (
     CustomField,
@@ -8,6 +9,7 @@ from ..models import (
     CustomFieldSelectOptionFilter,
     CustomFieldSelectOptionUpdate,
 )
+from .mixins.async_crud import AsyncCRUDMixin
 from .mixins.crud import CRUDMixin
 from .mixins.helper import get_id
 
@@ -20,7 +22,33 @@ class CustomFieldSelectOptionMixin(
         CustomFieldSelectOptionFilter,
     ]
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger, custom_field: CustomField | int):
+    def __init__(
+        self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter, custom_field: CustomField | int
+    ):
+        self.return_type = CustomFieldSelectOption
+        self.c = client
+        self.logger = logger
+        self.custom_field_id = get_id(custom_field)
+
+    @property
+    def endpoint_name(self) -> str:
+        return f"custom-field/{self.custom_field_id}/select-options"
+
+
+class AsyncCustomFieldSelectOptionMixin(
+    AsyncCRUDMixin[
+        CustomFieldSelectOption,
+        CustomFieldSelectOptionCreate,
+        CustomFieldSelectOptionUpdate,
+        CustomFieldSelectOptionFilter,
+    ]
+):
+    def __init__(
+        self,
+        client: AsyncEasyvereinClient,
+        logger: logging.Logger | logging.LoggerAdapter,
+        custom_field: CustomField | int,
+    ):
         self.return_type = CustomFieldSelectOption
         self.c = client
         self.logger = logger
@@ -1,16 +1,20 @@
 import logging
 import re
+from collections.abc import Mapping
 from pathlib import Path
 from typing import List
 from urllib import parse
 
-from pydantic_core import Url
 from requests.structures import CaseInsensitiveDict
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..core.exceptions import EasyvereinAPIException
+from ..core.types import Ref
 from ..models.invoice import Invoice, InvoiceCreate, InvoiceFilter, InvoiceUpdate
 from ..models.invoice_item import InvoiceItemCreate
+from .mixins.async_crud import AsyncBulkUpdateCreateMixin, AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import BulkUpdateCreateMixin, CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -20,7 +24,7 @@ class InvoiceMixin(
     BulkUpdateCreateMixin[Invoice, InvoiceCreate, InvoiceUpdate],
     RecycleBinMixin[Invoice],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         super().__init__()
         self.endpoint_name = "invoice"
         self.return_type = Invoice
@@ -165,15 +169,141 @@ class InvoiceMixin(
                 raise EasyvereinAPIException("No path available for given invoice")
             path = fetched_invoice.path
 
-        if not path or not isinstance(path, Url):
-            raise EasyvereinAPIException("Unable to obtain a valid path for given invoice.")
+        return self.c.fetch_file(_attachment_url(path))
 
-        # Fix for unencoded characters - should probably be fixed in easyverein API
-        m = re.fullmatch(r"^(.*\&path=)(.*)(&storedInS3=True)$", path.unicode_string())
-        if not m:
-            raise EasyvereinAPIException("Unable to parse path for attachment download")
-        url_components = list(m.groups())
-        if "%" not in url_components[1]:
-            url_components[1] = parse.quote(url_components[1])
 
-        return self.c.fetch_file("".join(url_components))
+class AsyncInvoiceMixin(
+    AsyncCRUDMixin[Invoice, InvoiceCreate, InvoiceUpdate, InvoiceFilter],
+    AsyncBulkUpdateCreateMixin[Invoice, InvoiceCreate, InvoiceUpdate],
+    AsyncRecycleBinMixin[Invoice],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        super().__init__()
+        self.endpoint_name = "invoice"
+        self.return_type = Invoice
+        self.c = client
+        self.logger = logger
+
+    async def upload_attachment(self, invoice: Invoice | int, file: Path):
+        """
+        Uploads an attachment to an already existing invoice. The invoice must be in draft state, otherwise
+        the upload will fail.
+
+        Args:
+            invoice: The invoice to upload the attachment to. Can be either an `Invoice` object or its ID
+            file: The path to the attachment to be uploaded. Must be a PDF file and a `pathlib.Path` object
+        """
+
+        invoice_id = invoice if isinstance(invoice, int) else invoice.id
+
+        return await self.c.upload(
+            url=self.c.get_url(f"/{self.endpoint_name}/{invoice_id}"), field_name="path", file=file
+        )
+
+    async def create_with_attachment(self, invoice: InvoiceCreate, attachment: Path, set_draft_state: bool = True):
+        """
+        Creates an invoice with an attachment. See `InvoiceMixin.create_with_attachment` for details.
+
+        Args:
+            invoice: The invoice object to be created
+            attachment: The path to the attachment to be uploaded. Must be a PDF file and a `pathlib.Path` object
+            set_draft_state: Whether to set the draft state of the invoice to `False` after uploading the attachment
+        """
+
+        if not set_draft_state and not invoice.isDraft:
+            raise EasyvereinAPIException(
+                "Creating an invoice with isDraft set to false is not supported when "
+                "we're also instructed not to modify the draft state."
+            )
+
+        invoice.isDraft = True
+
+        created_invoice = await self.create(invoice)
+        if not created_invoice or not created_invoice.id:
+            raise EasyvereinAPIException("Failed to create invoice")
+
+        await self.upload_attachment(created_invoice.id, attachment)
+
+        if set_draft_state:
+            await self.update(created_invoice.id, InvoiceUpdate(isDraft=False))
+            created_invoice.isDraft = False
+
+        return created_invoice
+
+    async def create_with_items(
+        self,
+        invoice: InvoiceCreate,
+        items: List[InvoiceItemCreate],
+        set_draft_state: bool = True,
+    ):
+        """
+        Creates an invoice including its items. See `InvoiceMixin.create_with_items` for details.
+
+        Args:
+            invoice: Invoice to create
+            items: List of invoice items to add to the invoice
+            set_draft_state: Whether to convert the invoice from draft state to an actual invoice after adding items
+        """
+
+        if not set_draft_state and not invoice.isDraft:
+            raise EasyvereinAPIException(
+                "Creating an invoice with isDraft set to false is not supported when "
+                "we're also instructed not to modify the draft state."
+            )
+
+        invoice.isDraft = True
+
+        inv = await self.create(invoice)
+        if not inv.id:
+            raise EasyvereinAPIException("Failed to create invoice")
+
+        for item in items:
+            item.relatedInvoice = inv.id
+            await self.c.api_instance.invoice_item.create(item)
+
+        if set_draft_state:
+            await self.update(inv.id, InvoiceUpdate(isDraft=False))
+            inv = await self.get_by_id(inv.id)
+
+        return inv
+
+    async def get_attachment(self, invoice: Invoice | int) -> tuple[bytes, Mapping[str, str]]:
+        """
+        Downloads and returns the invoice attachment if available. See `InvoiceMixin.get_attachment` for details.
+
+        Args:
+            invoice: The invoice object or its id for which the attachment should be retrieved
+        """
+        if isinstance(invoice, Invoice) and invoice.path:
+            self.logger.info("Invoice already has the path attribute set, using that path.")
+            path = invoice.path
+        else:
+            self.logger.info("Invoice is either given by id or doesn't contain the path attribute")
+            invoice_id = invoice.id if isinstance(invoice, Invoice) else invoice
+            if not invoice_id:
+                self.logger.error("No invoice id given to retrieve attachment")
+                raise EasyvereinAPIException("No invoice id given to retrieve attachment")
+            fetched_invoice = await self.get_by_id(invoice_id, query="{id,path}")
+            if not fetched_invoice or not fetched_invoice.path:
+                raise EasyvereinAPIException("No path available for given invoice")
+            path = fetched_invoice.path
+
+        return await self.c.fetch_file(_attachment_url(path))
+
+
+def _attachment_url(path: Ref | int | str | None) -> str:
+    """
+    Computes the download URL of an invoice attachment from the `path` attribute of the invoice
+    """
+    if not path or not isinstance(path, Ref):
+        raise EasyvereinAPIException("Unable to obtain a valid path for given invoice.")
+
+    # Fix for unencoded characters - should probably be fixed in easyverein API
+    m = re.fullmatch(r"^(.*\&path=)(.*)(&storedInS3=True)$", path)
+    if not m:
+        raise EasyvereinAPIException("Unable to parse path for attachment download")
+    url_components = list(m.groups())
+    if "%" not in url_components[1]:
+        url_components[1] = parse.quote(url_components[1])
+
+    return "".join(url_components)
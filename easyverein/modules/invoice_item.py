@@ -4,6 +4,7 @@ All methods related to invoices
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models.invoice_item import (
     InvoiceItem,
@@ -11,11 +12,20 @@ from ..models.invoice_item import (
     InvoiceItemFilter,
     InvoiceItemUpdate,
 )
+from .mixins.async_crud import AsyncCRUDMixin
 from .mixins.crud import CRUDMixin
 
 
 class InvoiceItemMixin(CRUDMixin[InvoiceItem, InvoiceItemCreate, InvoiceItemUpdate, InvoiceItemFilter]):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        self.endpoint_name = "invoice-item"
+        self.return_type = InvoiceItem
+        self.c = client
+        self.logger = logger
+
+
+class AsyncInvoiceItemMixin(AsyncCRUDMixin[InvoiceItem, InvoiceItemCreate, InvoiceItemUpdate, InvoiceItemFilter]):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         self.endpoint_name = "invoice-item"
         self.return_type = InvoiceItem
         self.c = client
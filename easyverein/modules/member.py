@@ -4,12 +4,15 @@ All methods related to invoices
 
 import logging
 
-from easyverein.modules.member_custom_field import MemberCustomFieldMixin
-from easyverein.modules.member_member_group import MemberMemberGroupMixin
+from easyverein.modules.member_custom_field import AsyncMemberCustomFieldMixin, MemberCustomFieldMixin
+from easyverein.modules.member_member_group import AsyncMemberMemberGroupMixin, MemberMemberGroupMixin
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models import Member, MemberCreate, MemberFilter, MemberSetLsb, MemberUpdate
 from ..models.member import MemberSetDosb
+from .mixins.async_crud import AsyncBulkUpdateCreateMixin, AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import BulkUpdateCreateMixin, CRUDMixin
 from .mixins.helper import get_id
 from .mixins.recycle_bin import RecycleBinMixin
@@ -20,7 +23,7 @@ class MemberMixin(
     BulkUpdateCreateMixin[Member, MemberCreate, MemberUpdate],
     RecycleBinMixin[Member],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         self.endpoint_name = "member"
         self.c = client
         self.logger = logger
@@ -35,7 +38,7 @@ class MemberMixin(
     def set_lsb(self, target: Member | int, data: MemberSetLsb) -> None:
         obj_id = get_id(target)
 
-        self.logger.info(f"Setting LSB sports for member {obj_id}")
+        self.logger.info("Setting LSB sports for member %s", obj_id)
 
         url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}/set-lsb")
         self.c.update(url, data, status_code=204)
@@ -43,7 +46,41 @@ class MemberMixin(
     def set_dosb(self, target: Member | int, data: MemberSetDosb) -> None:
         obj_id = get_id(target)
 
-        self.logger.info(f"Setting DOSB sports for member {obj_id}")
+        self.logger.info("Setting DOSB sports for member %s", obj_id)
 
         url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}/set-dosb")
         self.c.update(url, data, status_code=204)
+
+
+class AsyncMemberMixin(
+    AsyncCRUDMixin[Member, MemberCreate, MemberUpdate, MemberFilter],
+    AsyncBulkUpdateCreateMixin[Member, MemberCreate, MemberUpdate],
+    AsyncRecycleBinMixin[Member],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        self.endpoint_name = "member"
+        self.c = client
+        self.logger = logger
+        self.return_type = Member
+
+    def custom_field(self, member_id: int) -> AsyncMemberCustomFieldMixin:
+        return AsyncMemberCustomFieldMixin(self.c, self.logger, member_id)
+
+    def member_group(self, member_id: int) -> AsyncMemberMemberGroupMixin:
+        return AsyncMemberMemberGroupMixin(self.c, self.logger, member_id)
+
+    async def set_lsb(self, target: Member | int, data: MemberSetLsb) -> None:
+        obj_id = get_id(target)
+
+        self.logger.info("Setting LSB sports for member %s", obj_id)
+
+        url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}/set-lsb")
+        await self.c.update(url, data, status_code=204)
+
+    async def set_dosb(self, target: Member | int, data: MemberSetDosb) -> None:
+        obj_id = get_id(target)
+
+        self.logger.info("Setting DOSB sports for member %s", obj_id)
+
+        url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}/set-dosb")
+        await self.c.update(url, data, status_code=204)
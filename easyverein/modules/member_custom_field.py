@@ -4,6 +4,7 @@ All methods related to invoices
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models import (
     CustomField,
@@ -14,14 +15,18 @@ from ..models import (
     MemberCustomFieldFilter,
     MemberCustomFieldUpdate,
 )
+from .mixins.async_crud import AsyncCRUDMixin
 from .mixins.crud import CRUDMixin
 from .mixins.helper import get_id
+from .reference_data import CUSTOM_FIELD_SCOPE
+
+MEMBER_CUSTOM_FIELD_QUERY = "{id,value,customField{id}}"
 
 
 class MemberCustomFieldMixin(
     CRUDMixin[MemberCustomField, MemberCustomFieldCreate, MemberCustomFieldUpdate, MemberCustomFieldFilter]
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger, member: Member | int):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter, member: Member | int):
         self.return_type = MemberCustomField
         self.c = client
         self.logger = logger
@@ -31,7 +36,7 @@ class MemberCustomFieldMixin(
     def endpoint_name(self) -> str:
         return f"member/{self.member_id}/custom-fields"
 
-    def ensure_set(self, custom_field_id: int, value: str | list[str]) -> MemberCustomField:
+    def ensure_set(self, custom_field_id: int | str, value: str | list[str]) -> MemberCustomField:
         """
         Convenience method to set the custom field value on a member, no matter if it was
         set before already (PATCH) or not.
@@ -40,46 +45,31 @@ class MemberCustomFieldMixin(
         Instead of using the value, the method will automatically fetch and select the
         options from selectOptions that have been introduced in January 2026.
 
-        Regarding rate limiting, be aware that this method requires at least two API calls.
+        The custom field and its select options are taken from `reference_data` of the client, which loads all
+        custom fields once instead of fetching the custom field on every call. Regarding rate limiting, be aware
+        that this method requires at least two API calls.
 
         Args:
-            custom_field_id (int): Custom field ID that should be set or changed
+            custom_field_id (int | str): ID or name of the custom field that should be set or changed
             value (str | list[str]): New value the specified custom field should be set to
         """
-        custom_field_query = "{id,settings_type,selectOptions{id,value}}"
-        custom_field = self.c.api_instance.custom_field.get_by_id(custom_field_id, query=custom_field_query)
-        use_selected_options = custom_field.settings_type in ("s", "a")
-
-        if use_selected_options:
-            values_list = [value] if isinstance(value, str) else list(value)
-            value_to_id: dict[str, int] = {}
-            for opt in custom_field.selectOptions or []:
-                if isinstance(opt, CustomFieldSelectOption) and opt.id is not None and opt.value:
-                    value_to_id[opt.value] = opt.id
-            option_ids = [value_to_id[v] for v in values_list if v in value_to_id]
-            missing = [v for v in values_list if v not in value_to_id]
-            if missing:
-                raise ValueError(f"No select option(s) with value(s) {missing!r} for custom field {custom_field_id}")
-            payload_value = None
-            payload_selected_options: list[int] | None = option_ids
-        else:
-            assert isinstance(value, str), "Value must be a string for non-select custom fields"
-            payload_value = value
-            payload_selected_options = None
+        reference_data = self.c.api_instance.reference_data
+        custom_field = reference_data.custom_field(custom_field_id)
+        try:
+            payload_value, payload_selected_options = _custom_field_payload(custom_field, value)
+        except ValueError:
+            # Select options might have been added since the custom fields were loaded
+            if not reference_data.may_reload(CUSTOM_FIELD_SCOPE):
+                raise
+            custom_field = reference_data.custom_field(custom_field_id, refresh=True)
+            payload_value, payload_selected_options = _custom_field_payload(custom_field, value)
+        assert custom_field.id
 
         # Get all custom fields this member has already set, use max limit available
-        query = "{id,value,customField{id}}"
-        all_member_custom_fields = self.get_all(limit_per_page=100, query=query)
+        all_member_custom_fields = self.get_all(limit_per_page=100, query=MEMBER_CUSTOM_FIELD_QUERY)
 
         # Extract custom field from that list if it exists
-        existing_custom_field = next(
-            (
-                mcf
-                for mcf in all_member_custom_fields
-                if isinstance(mcf.customField, CustomField) and mcf.customField.id == custom_field_id
-            ),
-            None,
-        )
+        existing_custom_field = _find_member_custom_field(all_member_custom_fields, custom_field.id)
 
         if existing_custom_field:
             # It's already there, we need to patch the existing field
@@ -89,6 +79,90 @@ class MemberCustomFieldMixin(
         else:
             # It's not there, we need to create it
             create = MemberCustomFieldCreate(
-                customField=custom_field_id, value=payload_value, selectedOptions=payload_selected_options
+                customField=custom_field.id, value=payload_value, selectedOptions=payload_selected_options
             )
             return self.create(create)
+
+
+class AsyncMemberCustomFieldMixin(
+    AsyncCRUDMixin[MemberCustomField, MemberCustomFieldCreate, MemberCustomFieldUpdate, MemberCustomFieldFilter]
+):
+    def __init__(
+        self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter, member: Member | int
+    ):
+        self.return_type = MemberCustomField
+        self.c = client
+        self.logger = logger
+        self.member_id = get_id(member)
+
+    @property
+    def endpoint_name(self) -> str:
+        return f"member/{self.member_id}/custom-fields"
+
+    async def ensure_set(self, custom_field_id: int | str, value: str | list[str]) -> MemberCustomField:
+        """
+        Convenience method to set the custom field value on a member, no matter if it was
+        set before already (PATCH) or not. See `MemberCustomFieldMixin.ensure_set` for details.
+
+        Args:
+            custom_field_id (int | str): ID or name of the custom field that should be set or changed
+            value (str | list[str]): New value the specified custom field should be set to
+        """
+        reference_data = self.c.api_instance.reference_data
+        custom_field = await reference_data.custom_field(custom_field_id)
+        try:
+            payload_value, payload_selected_options = _custom_field_payload(custom_field, value)
+        except ValueError:
+            if not reference_data.may_reload(CUSTOM_FIELD_SCOPE):
+                raise
+            custom_field = await reference_data.custom_field(custom_field_id, refresh=True)
+            payload_value, payload_selected_options = _custom_field_payload(custom_field, value)
+        assert custom_field.id
+
+        all_member_custom_fields = await self.get_all(limit_per_page=100, query=MEMBER_CUSTOM_FIELD_QUERY)
+        existing_custom_field = _find_member_custom_field(all_member_custom_fields, custom_field.id)
+
+        if existing_custom_field:
+            patch = MemberCustomFieldUpdate(value=payload_value, selectedOptions=payload_selected_options)
+            assert existing_custom_field.id
+            return await self.update(existing_custom_field.id, patch)
+        else:
+            create = MemberCustomFieldCreate(
+                customField=custom_field.id, value=payload_value, selectedOptions=payload_selected_options
+            )
+            return await self.create(create)
+
+
+def _custom_field_payload(custom_field: CustomField, value: str | list[str]) -> tuple[str | None, list | None]:
+    """
+    Computes the value and selected options to send, depending on the type of the custom field
+    """
+    use_selected_options = custom_field.settings_type in ("s", "a")
+
+    if use_selected_options:
+        values_list = [value] if isinstance(value, str) else list(value)
+        value_to_id: dict[str, int] = {}
+        for opt in custom_field.selectOptions or []:
+            if isinstance(opt, CustomFieldSelectOption) and opt.id is not None and opt.value:
+                value_to_id[opt.value] = opt.id
+        option_ids = [value_to_id[v] for v in values_list if v in value_to_id]
+        missing = [v for v in values_list if v not in value_to_id]
+        if missing:
+            raise ValueError(f"No select option(s) with value(s) {missing!r} for custom field {custom_field.id}")
+        return None, option_ids
+
+    assert isinstance(value, str), "Value must be a string for non-select custom fields"
+    return value, None
+
+
+def _find_member_custom_field(
+    member_custom_fields: list[MemberCustomField], custom_field_id: int
+) -> MemberCustomField | None:
+    return next(
+        (
+            mcf
+            for mcf in member_custom_fields
+            if isinstance(mcf.customField, CustomField) and mcf.customField.id == custom_field_id
+        ),
+        None,
+    )
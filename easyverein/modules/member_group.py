@@ -4,8 +4,11 @@ All methods related to custom fields
 
 import logging
 
+from ..core.async_client import AsyncEasyvereinClient
 from ..core.client import EasyvereinClient
 from ..models import MemberGroup, MemberGroupCreate, MemberGroupFilter, MemberGroupUpdate
+from .mixins.async_crud import AsyncCRUDMixin
+from .mixins.async_recycle_bin import AsyncRecycleBinMixin
 from .mixins.crud import CRUDMixin
 from .mixins.recycle_bin import RecycleBinMixin
 
@@ -14,7 +17,19 @@ class MemberGroupMixin(
     CRUDMixin[MemberGroup, MemberGroupCreate, MemberGroupUpdate, MemberGroupFilter],
     RecycleBinMixin[MemberGroup],
 ):
-    def __init__(self, client: EasyvereinClient, logger: logging.Logger):
+    def __init__(self, client: EasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
+        super().__init__()
+        self.endpoint_name = "member-group"
+        self.return_type = MemberGroup
+        self.c = client
+        self.logger = logger
+
+
+class AsyncMemberGroupMixin(
+    AsyncCRUDMixin[MemberGroup, MemberGroupCreate, MemberGroupUpdate, MemberGroupFilter],
+    AsyncRecycleBinMixin[MemberGroup],
+):
+    def __init__(self, client: AsyncEasyvereinClient, logger: logging.Logger | logging.LoggerAdapter):
         super().__init__()
         self.endpoint_name = "member-group"
         self.return_type = MemberGroup
@@ -0,0 +1,37 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+from easyverein.core.protocol import AsyncEVClientProtocol
+
+from .helper import get_id, parse_models
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+class AsyncRecycleBinMixin(Generic[ModelType]):
+    async def get_deleted(self: AsyncEVClientProtocol[ModelType]) -> tuple[list[ModelType], int]:
+        """
+        Fetches all deleted resources from the recycle bin and returns a list.
+        """
+        self.logger.info("Fetching all deleted objects of type %s from API", self.endpoint_name)
+        url = self.c.get_url(f"/wastebasket/{self.endpoint_name}/", url_params={"showCount": True})
+        response = await self.c.fetch(url, self.return_type)
+        parsed_objects = parse_models(response.result, self.return_type)
+        assert isinstance(parsed_objects, list)
+        return parsed_objects, response.count or 0
+
+    async def purge(self: AsyncEVClientProtocol[ModelType], item: ModelType | int):
+        """
+        Finally deletes a given item from the recycle bin. This is irreversible and cannot be undone.
+
+        This function can take either an object instance or a numerical id as argument.
+
+        Args:
+            item: The id or object that should be deleted.
+        """
+        item_id = get_id(item)
+
+        self.logger.info("Purging object of type %s and id %s from recycle bin", self.endpoint_name, item_id)
+        url = self.c.get_url(f"/wastebasket/{self.endpoint_name}/{item_id}")
+        return await self.c.delete(url)
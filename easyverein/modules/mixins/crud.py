@@ -2,13 +2,15 @@
 This module provides general CRUD operations for all endpoints.
 """
 
-from typing import Callable, Generic, TypeVar
+from collections.abc import Iterator
+from typing import Any, Callable, Generic, Literal, TypeVar, overload
 
 from pydantic import BaseModel
 
 from easyverein.core.protocol import EVClientProtocol
+from easyverein.models.query import query_model
 
-from .helper import get_id, parse_models
+from .helper import get_id, parse_models, parse_raw
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 CreateModelType = TypeVar("CreateModelType", bound=BaseModel)
@@ -17,13 +19,57 @@ FilterType = TypeVar("FilterType", bound=BaseModel)
 
 
 class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]):
+    @overload
+    def get(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit: int = ...,
+        page: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: Literal[False] = ...,
+        as_columns: Literal[False] = ...,
+        narrow: bool = ...,
+    ) -> tuple[list[ModelType], int]: ...
+    @overload
+    def get(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit: int = ...,
+        page: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: Literal[True],
+        as_columns: Literal[False] = ...,
+        narrow: bool = ...,
+    ) -> tuple[list[dict[str, Any]], int]: ...
+    @overload
+    def get(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit: int = ...,
+        page: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: bool = ...,
+        as_columns: Literal[True],
+        narrow: bool = ...,
+    ) -> tuple[dict[str, list[Any]], int]: ...
     def get(
         self: EVClientProtocol[ModelType],
         query: str = "",
         search: FilterType | None = None,
         limit: int = 10,
         page: int = 1,
-    ) -> tuple[list[ModelType], int]:
+        trusted: bool | None = None,
+        *,
+        raw: bool = False,
+        as_columns: bool = False,
+        narrow: bool = False,
+    ) -> tuple[list[ModelType] | list[dict[str, Any]] | dict[str, list[Any]], int]:
         """
         Fetches a single page of a given page size. The page size is defined by the `limit` parameter
         with an API sided upper limit of 100.
@@ -35,27 +81,86 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
             search: Filter to use with API. Refer to the EV API help for more information on how to use filters
             limit: Defines how many resources to return.
             page: Deinfines which page to return. Defaults to 1, which is the first page.
+            trusted: Build the returned models from the API response without validating them, which is
+                     considerably faster for large result sets. Defaults to the `trusted_reads` setting of the client.
+            raw: Return plain dicts keyed by field name instead of models. Values are not validated or converted,
+                 which is the fastest way to load large result sets into a DataFrame or database.
+            as_columns: Like `raw`, but return a dict mapping every field name to the list of its values.
+            narrow: Validate the objects against a model narrowed to the fields selected by `query`, which is
+                    considerably faster for narrow queries. By default, objects are validated against `return_type`.
         """
-        self.logger.info(f"Fetching selected {self.endpoint_name} objects from API")
+        self.logger.info("Fetching selected %s objects from API", self.endpoint_name)
 
         url_params = {"limit": limit, "query": query, "page": page, "showCount": True}
         if search:
             url_params |= search.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
 
-        self.logger.debug(f"Computed URL params for this request: {url_params}")
+        self.logger.debug("Computed URL params for this request: %s", url_params)
 
         url = self.c.get_url(f"/{self.endpoint_name}", url_params)
-        response = self.c.fetch(url)
-        parsed_objects = parse_models(response.result, self.return_type)
+        if raw or as_columns:
+            response = self.c.fetch(url)
+            assert isinstance(response.result, list)
+            return parse_raw(response.result, self.return_type, as_columns), response.count or 0
+
+        trusted = self.c.trusted_reads if trusted is None else trusted
+        model = self.return_type if trusted or not narrow else query_model(self.return_type, query)
+        response = self.c.fetch(url, None if trusted else model)
+        parsed_objects = parse_models(response.result, model, trusted)
         assert isinstance(parsed_objects, list)
         return parsed_objects, response.count or 0
 
+    @overload
+    def get_all(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit_per_page: int = ...,
+        max_workers: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: Literal[False] = ...,
+        as_columns: Literal[False] = ...,
+        narrow: bool = ...,
+    ) -> list[ModelType]: ...
+    @overload
+    def get_all(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit_per_page: int = ...,
+        max_workers: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: Literal[True],
+        as_columns: Literal[False] = ...,
+        narrow: bool = ...,
+    ) -> list[dict[str, Any]]: ...
+    @overload
+    def get_all(
+        self: EVClientProtocol[ModelType],
+        query: str = ...,
+        search: FilterType | None = ...,
+        limit_per_page: int = ...,
+        max_workers: int = ...,
+        trusted: bool | None = ...,
+        *,
+        raw: bool = ...,
+        as_columns: Literal[True],
+        narrow: bool = ...,
+    ) -> dict[str, list[Any]]: ...
     def get_all(
         self: EVClientProtocol[ModelType],
         query: str = "",
         search: FilterType | None = None,
         limit_per_page: int = 100,
-    ) -> list[ModelType]:
+        max_workers: int = 1,
+        trusted: bool | None = None,
+        *,
+        raw: bool = False,
+        as_columns: bool = False,
+        narrow: bool = False,
+    ) -> list[ModelType] | list[dict[str, Any]] | dict[str, list[Any]]:
         """
         Convenient method that fetches all objects from the EV API, abstracting away the need to handle pagination.
 
@@ -68,20 +173,85 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
             search: Filter to use with API. Refer to the EV API help for more information on how to use filters
             limit_per_page: Defines how many resources to return per page. Defaults to 100, the maximum page size
                             supported by the API.
+            max_workers: Number of pages to fetch concurrently. Defaults to 1, which follows the pages one after
+                         another. Larger values compute the page range from the total count of the first page
+                         and fetch the remaining pages in parallel, while still returning them in order.
+            trusted: Build the returned models from the API response without validating them, which is
+                     considerably faster for large result sets. Defaults to the `trusted_reads` setting of the client.
+            raw: Return plain dicts keyed by field name instead of models. Values are not validated or converted,
+                 which is the fastest way to load large result sets into a DataFrame or database.
+            as_columns: Like `raw`, but return a dict mapping every field name to the list of its values.
+            narrow: Validate the objects against a model narrowed to the fields selected by `query`, which is
+                    considerably faster for narrow queries. By default, objects are validated against `return_type`.
         """
-        self.logger.info(f"Fetching selected {self.endpoint_name} objects from API")
+        self.logger.info("Fetching selected %s objects from API", self.endpoint_name)
 
         url_params = {"limit": limit_per_page, "query": query, "showCount": True}
         if search:
             url_params |= search.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
 
         url = self.c.get_url(f"/{self.endpoint_name}", url_params)
-        response = self.c.fetch_paginated(url)
-        parsed_objects = parse_models(response.result, self.return_type)
+        if raw or as_columns:
+            response = self.c.fetch_paginated(url, max_workers=max_workers)
+            assert isinstance(response.result, list)
+            return parse_raw(response.result, self.return_type, as_columns)
+
+        trusted = self.c.trusted_reads if trusted is None else trusted
+        model = self.return_type if trusted or not narrow else query_model(self.return_type, query)
+        response = self.c.fetch_paginated(url, max_workers=max_workers, model=None if trusted else model)
+        parsed_objects = parse_models(response.result, model, trusted)
         assert isinstance(parsed_objects, list)
         return parsed_objects
 
-    def get_by_id(self: EVClientProtocol[ModelType], obj_id: int, query: str = "") -> ModelType:
+    def iter_all(
+        self: EVClientProtocol[ModelType],
+        query: str = "",
+        search: FilterType | None = None,
+        limit_per_page: int = 100,
+        trusted: bool | None = None,
+        *,
+        narrow: bool = False,
+    ) -> Iterator[ModelType]:
+        """
+        Generator variant of `get_all`, yielding the parsed objects page by page.
+
+        The next page is only fetched once all objects of the previous page have been consumed, so memory usage
+        stays at roughly one page, independent of the total number of objects.
+
+        **Example**:
+
+        ```py
+        for booking in ev_client.booking.iter_all(query="{id,amount}"):
+            print(booking.amount)
+        ```
+
+        Args:
+            query: Query to use with API. Defaults to None. Refer to the EV API help for more
+                                    information on how to use queries
+            search: Filter to use with API. Refer to the EV API help for more information on how to use filters
+            limit_per_page: Defines how many resources to return per page. Defaults to 100, the maximum page size
+                            supported by the API.
+            trusted: Build the returned models from the API response without validating them, which is
+                     considerably faster for large result sets. Defaults to the `trusted_reads` setting of the client.
+            narrow: Validate the objects against a model narrowed to the fields selected by `query`, which is
+                    considerably faster for narrow queries. By default, objects are validated against `return_type`.
+        """
+        self.logger.info("Iterating over selected %s objects from API", self.endpoint_name)
+
+        url_params = {"limit": limit_per_page, "query": query}
+        if search:
+            url_params |= search.model_dump(exclude_unset=True, exclude_defaults=True, by_alias=True)
+
+        url = self.c.get_url(f"/{self.endpoint_name}", url_params)
+        trusted = self.c.trusted_reads if trusted is None else trusted
+        model = self.return_type if trusted or not narrow else query_model(self.return_type, query)
+        # Streamed pages are not remembered for conditional requests, which would undo the memory bound
+        for results in self.c.iter_paginated(url, None if trusted else model, conditional=False):
+            yield from parse_models(results, model, trusted)
+
+    def get_by_id(
+        self: EVClientProtocol[ModelType], obj_id: int, query: str = "", *, narrow: bool = False
+    ) -> ModelType:
         """
         Fetches a single object identified by its primary id.
 
@@ -89,12 +259,15 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
             obj_id: Id of the object to be retrieved
             query: Query to use with API. Defaults to None. Refer to the EV API help for more
                                     information on how to use queries
+            narrow: Validate the object against a model narrowed to the fields selected by `query`, which is
+                    considerably faster for narrow queries. By default, it is validated against `return_type`.
         """
-        self.logger.info(f"Fetching {self.endpoint_name} object with id {obj_id} from API")
+        self.logger.info("Fetching %s object with id %s from API", self.endpoint_name, obj_id)
 
         url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}", {"query": query})
-        response = self.c.fetch_one(url)
-        parsed_object = parse_models(response.result, self.return_type)
+        model = query_model(self.return_type, query) if narrow else self.return_type
+        response = self.c.fetch_one(url, model)
+        parsed_object = parse_models(response.result, model)
         assert isinstance(parsed_object, self.return_type)
         return parsed_object
 
@@ -121,7 +294,7 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
         Args:
             data: Object to be created
         """
-        self.logger.info(f"Creating object of type {self.endpoint_name}")
+        self.logger.info("Creating object of type %s", self.endpoint_name)
 
         url = self.c.get_url(f"/{self.endpoint_name}/")
         response = self.c.create(url, data)
@@ -145,7 +318,7 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
 
         obj_id = get_id(target)
 
-        self.logger.info(f"Updating object of type {self.endpoint_name} with id {obj_id}")
+        self.logger.info("Updating object of type %s with id %s", self.endpoint_name, obj_id)
 
         url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}")
         response = self.c.update(url, data, exclude_none=exclude_none)
@@ -185,14 +358,14 @@ class CRUDMixin(Generic[ModelType, CreateModelType, UpdateModelType, FilterType]
 
         obj_id = get_id(target)
 
-        self.logger.info(f"Deleting object of type {self.endpoint_name} with id {obj_id}")
+        self.logger.info("Deleting object of type %s with id %s", self.endpoint_name, obj_id)
 
         url = self.c.get_url(f"/{self.endpoint_name}/{obj_id}")
 
         self.c.delete(url)
 
         if delete_from_recycle_bin and hasattr(self, "purge"):
-            self.logger.info(f"Deleting object of type {self.endpoint_name} with id {obj_id} from wastebasket")
+            self.logger.info("Deleting object of type %s with id %s from wastebasket", self.endpoint_name, obj_id)
             purge: Callable = getattr(self, "purge")
             purge(obj_id)
 
@@ -227,7 +400,7 @@ class BulkUpdateCreateMixin(Generic[ModelType, CreateModelType, UpdateModelType]
         Args:
             data: List of Pydantic models containing the data for the objects to be created.
         """
-        self.logger.info(f"Creating object of type {self.endpoint_name}")
+        self.logger.info("Creating object of type %s", self.endpoint_name)
 
         url = self.c.get_url(f"/{self.endpoint_name}/bulk-create")
         response = self.c.bulk_create(url, data)
@@ -258,7 +431,7 @@ class BulkUpdateCreateMixin(Generic[ModelType, CreateModelType, UpdateModelType]
             data: List of Pydantic models containing the data to update.
             exclude_none: If True, fields with None values will be excluded from the update.
         """
-        self.logger.info(f"Bulk updating objects of type {self.endpoint_name}")
+        self.logger.info("Bulk updating objects of type %s", self.endpoint_name)
 
         url = self.c.get_url(f"/{self.endpoint_name}/bulk-update")
         response = self.c.bulk_update(url, data, exclude_none=exclude_none)
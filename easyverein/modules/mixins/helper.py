@@ -1,11 +1,17 @@
-from typing import Any, TypeVar, overload
+import datetime
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Annotated, Any, TypeVar, get_args, get_origin, overload
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import Url
 
 from easyverein.core.exceptions import EasyvereinAPIException
+from easyverein.core.types import Ref
+from easyverein.models.mixins.empty_strings_mixin import EmptyStringsToNone
 
 
-def get_id(obj: BaseModel | int) -> int:
+def get_id(obj: BaseModel | Ref | int) -> int:
     if isinstance(obj, int):
         return obj
 
@@ -18,16 +24,229 @@ def get_id(obj: BaseModel | int) -> int:
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """
+    Returns a cached `TypeAdapter` validating a list of `model` instances in a single pydantic-core call
+    """
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def _collect_types(annotation: Any, models: list[type[BaseModel]], scalars: list[type]) -> None:
+    """
+    Collects the model, date, reference, URL and float types anywhere in a (possibly nested) field annotation
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        _collect_types(get_args(annotation)[0], models, scalars)
+    elif origin is not None:
+        for arg in get_args(annotation):
+            _collect_types(arg, models, scalars)
+    elif isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            models.append(annotation)
+        elif issubclass(annotation, datetime.date | Ref | Url | float):
+            scalars.append(annotation)
+
+
+def _value_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """
+    Returns a function converting a raw JSON value into the field type without validating it, or None if the
+    value can be used as it is. Objects become nested models, dates are parsed, reference URLs become `Ref`, other
+    URLs become `Url` and integers in float fields become floats, everything else is kept.
+    """
+    models: list[type[BaseModel]] = []
+    scalars: list[type] = []
+    _collect_types(annotation, models, scalars)
+    if not models and not scalars:
+        return None
+
+    model = models[0] if models else None
+    parse_temporal: Callable[[str], datetime.date] | None = None
+    if datetime.datetime in scalars:
+        parse_temporal = datetime.datetime.fromisoformat
+    elif datetime.date in scalars:
+        parse_temporal = datetime.date.fromisoformat
+    references = Ref in scalars
+    urls = Url in scalars
+    floats = float in scalars
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, dict) and model is not None:
+            return construct_model(value, model)
+        if isinstance(value, list):
+            return [convert(v) for v in value]
+        if isinstance(value, str) and references and value.startswith(("http://", "https://")):
+            return Ref(value)
+        if isinstance(value, str) and urls:
+            try:
+                return Url(value)
+            except ValueError:
+                return value
+        if isinstance(value, int) and floats and not isinstance(value, bool):
+            return float(value)
+        if isinstance(value, str) and parse_temporal is not None:
+            try:
+                return parse_temporal(value)
+            except ValueError:
+                return value
+        return value
+
+    return convert
+
+
+class _ConstructPlan:
+    """
+    Everything `construct_model` needs to know about a model, computed once per model
+    """
+
+    __slots__ = ("fields", "defaults", "empty_strings_to_none", "direct")
+
+    def __init__(self, model: type[BaseModel]):
+        # Schemas are built lazily, which resolves the forward references in the field annotations
+        model.model_rebuild()
+        # Maps the alias and the name of every field to the field name and the converter of its values
+        self.fields: dict[str, tuple[str, Callable[[Any], Any] | None]] = {}
+        self.defaults: dict[str, Any] = {}
+        for name, field in model.model_fields.items():
+            entry = (name, _value_converter(field.annotation))
+            self.fields[name] = entry
+            if field.alias:
+                self.fields[field.alias] = entry
+            if not field.is_required():
+                self.defaults[name] = field.get_default(call_default_factory=False)
+        self.empty_strings_to_none = issubclass(model, EmptyStringsToNone)
+        # Instances are filled in directly unless the model uses features only `model_construct` handles
+        self.direct = (
+            all(field.default_factory is None for field in model.model_fields.values())
+            and model.model_config.get("extra") != "allow"
+            and not model.__pydantic_post_init__
+            and not model.__pydantic_root_model__
+        )
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model: type[BaseModel]) -> _ConstructPlan:
+    return _ConstructPlan(model)
+
+
+def construct_model(data: dict[str, Any], model: type[T]) -> T:
+    """
+    Builds a model instance from trusted API data without validating it.
+
+    Aliases are mapped, empty strings become None for models converting them during validation, nested objects
+    become model instances, dates are parsed, references become `Ref`, other URLs become `Url` and integers in float
+    fields become floats. All other values are used as they are.
+    """
+    plan = _construct_plan(model)
+    values = {}
+    for key, value in data.items():
+        entry = plan.fields.get(key)
+        if entry is None:
+            if not plan.direct:
+                values[key] = value
+            continue
+        name, convert = entry
+        if value == "" and plan.empty_strings_to_none:
+            value = None
+        elif value is not None and convert is not None:
+            value = convert(value)
+        values[name] = value
+
+    if not plan.direct:
+        return model.model_construct(**values)
+
+    # Same as `model_construct`, without resolving aliases and defaults field by field
+    fields_set = set(values)
+    values = plan.defaults | values
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+@lru_cache(maxsize=None)
+def _field_names(model: type[BaseModel]) -> dict[str, tuple[str, type[BaseModel] | None]]:
+    """
+    Maps the alias and the name of every field of `model` to the field name and the model of nested objects
+    """
+    model.model_rebuild()
+    names: dict[str, tuple[str, type[BaseModel] | None]] = {}
+    for name, field in model.model_fields.items():
+        models: list[type[BaseModel]] = []
+        _collect_types(field.annotation, models, [])
+        names[name] = (name, models[0] if models else None)
+        if field.alias:
+            names[field.alias] = names[name]
+    return names
+
+
+def resolve_aliases(data: dict[str, Any], model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Returns a copy of a raw API object using the field names of `model` instead of the API aliases, including
+    nested objects. Values are neither validated nor converted, unknown keys are kept as they are.
+    """
+    names = _field_names(model)
+    resolved = {}
+    for key, value in data.items():
+        name, nested = names.get(key, (key, None))
+        if nested is not None:
+            if isinstance(value, dict):
+                value = resolve_aliases(value, nested)
+            elif isinstance(value, list):
+                value = [resolve_aliases(v, nested) if isinstance(v, dict) else v for v in value]
+        resolved[name] = value
+    return resolved
+
+
+def to_columns(rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    """
+    Converts a list of objects into a dict of equally long lists, one per key. Keys missing in some objects are
+    filled with None.
+    """
+    keys = dict.fromkeys(key for row in rows for key in row)
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def parse_raw(
+    result: list[Any], return_model: type[BaseModel], as_columns: bool = False
+) -> list[dict[str, Any]] | dict[str, list[Any]]:
+    """
+    Returns API results as plain dicts using the field names of `return_model`, or as columns if `as_columns`
+    is set. No model instances are created.
+    """
+    rows = [resolve_aliases(row, return_model) for row in result]
+    return to_columns(rows) if as_columns else rows
+
+
 @overload
-def parse_models(result: dict[str, Any], return_model: type[T]) -> T: ...
+def parse_models(result: dict[str, Any] | BaseModel, return_model: type[T], trusted: bool = False) -> T: ...
 @overload
-def parse_models(result: list[dict[str, Any]], return_model: type[T]) -> list[T]: ...
+def parse_models(
+    result: list[dict[str, Any]] | list[BaseModel], return_model: type[T], trusted: bool = False
+) -> list[T]: ...
 @overload
-def parse_models(result: None, return_model: type[T]) -> None: ...
-def parse_models(result, return_model: type[T]):
+def parse_models(result: None, return_model: type[T], trusted: bool = False) -> None: ...
+def parse_models(result, return_model: type[T], trusted: bool = False):
+    """
+    Validates API results into `return_model` instances. Results the client already validated straight
+    from the raw response are returned as they are.
+
+    With `trusted` set, the results are not validated at all but built using `construct_model`.
+    """
     if result is None:
         return None
+    elif trusted and isinstance(result, list):
+        return [i if isinstance(i, return_model) else construct_model(i, return_model) for i in result]
+    elif trusted and isinstance(result, dict):
+        return construct_model(result, return_model)
     elif isinstance(result, list):
-        return [return_model.model_validate(i) for i in result]
+        if all(isinstance(i, return_model) for i in result):
+            return result
+        return list_adapter(return_model).validate_python(result)
+    elif isinstance(result, return_model):
+        return result
     elif isinstance(result, dict):
         return return_model.model_validate(result)
@@ -14,9 +14,9 @@ class RecycleBinMixin(Generic[ModelType]):
         """
         Fetches all deleted resources from the recycle bin and returns a list.
         """
-        self.logger.info(f"Fetching all deleted objects of type {self.endpoint_name} from API")
+        self.logger.info("Fetching all deleted objects of type %s from API", self.endpoint_name)
         url = self.c.get_url(f"/wastebasket/{self.endpoint_name}/", url_params={"showCount": True})
-        response = self.c.fetch(url)
+        response = self.c.fetch(url, self.return_type)
         parsed_objects = parse_models(response.result, self.return_type)
         assert isinstance(parsed_objects, list)
         return parsed_objects, response.count or 0
@@ -32,6 +32,6 @@ class RecycleBinMixin(Generic[ModelType]):
         """
         item_id = get_id(item)
 
-        self.logger.info(f"Purging object of type {self.endpoint_name} and id {item_id} from recycle bin")
+        self.logger.info("Purging object of type %s and id %s from recycle bin", self.endpoint_name, item_id)
         url = self.c.get_url(f"/wastebasket/{self.endpoint_name}/{item_id}")
         return self.c.delete(url)
@@ -0,0 +1,244 @@
+"""
+Registry of rarely changing reference data, like custom fields and member groups
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from ..core.exceptions import EasyvereinAPINotFoundException
+from ..models import CustomField, MemberGroup
+
+if TYPE_CHECKING:
+    from ..api import EasyvereinAPI
+    from ..async_api import AsyncEasyvereinAPI
+
+T = TypeVar("T", CustomField, MemberGroup)
+
+CUSTOM_FIELD_QUERY = "{id,name,settings_type,selectOptions{id,value}}"
+MEMBER_GROUP_QUERY = "{id,name,short}"
+
+# Scopes of the response cache (see `cache_scope`) the reference data is loaded from
+CUSTOM_FIELD_SCOPE = "custom-field"
+MEMBER_GROUP_SCOPE = "member-group"
+
+DESCRIPTIONS = {CUSTOM_FIELD_SCOPE: "Custom field", MEMBER_GROUP_SCOPE: "Member group"}
+
+
+class ReferenceIndex(Generic[T]):
+    """
+    All objects of an endpoint, indexed by ID and by name. If several objects share a name, the first one returned
+    by the API is found by name.
+    """
+
+    def __init__(self, objects: list[T], loaded_at: float):
+        self.loaded_at = loaded_at
+        self.by_id: dict[int, T] = {obj.id: obj for obj in objects if obj.id is not None}
+        self.by_name: dict[str, T] = {}
+        for obj in objects:
+            if obj.name:
+                self.by_name.setdefault(obj.name, obj)
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def find(self, key: int | str) -> T | None:
+        """
+        Returns the object with the given ID or name, or None if there is none
+        """
+        return self.by_name.get(key) if isinstance(key, str) else self.by_id.get(key)
+
+
+class BaseReferenceData:
+    """
+    Transport independent part of the reference data registries
+    """
+
+    def __init__(self, ttl: float, reload_interval: float):
+        if ttl <= 0:
+            raise ValueError("ttl must be larger than zero")
+        self.ttl = ttl
+        self.reload_interval = reload_interval
+        self._indexes: dict[str, ReferenceIndex] = {}
+        # Number of times the data of each scope has been loaded, to tell whether it was reloaded in the meantime
+        self._loads: dict[str, int] = {}
+
+    def invalidate(self, scope: str | None = None) -> None:
+        """
+        Drops the loaded data of the given scope (`custom-field` or `member-group`), or all of it. The data is
+        loaded again on its next use. Called by the client for every write request.
+        """
+        if scope is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(scope, None)
+
+    def _valid_index(self, scope: str) -> ReferenceIndex | None:
+        index = self._indexes.get(scope)
+        if index is not None and time.monotonic() - index.loaded_at < self.ttl:
+            return index
+        return None
+
+    def may_reload(self, scope: str) -> bool:
+        """
+        Returns whether a lookup that didn't find an object may reload the data of the given scope. The data is
+        reloaded at most once every `reload_interval` seconds, so repeated lookups of missing objects are cheap.
+        """
+        index = self._indexes.get(scope)
+        return index is None or time.monotonic() - index.loaded_at >= self.reload_interval
+
+    def _store(self, scope: str, objects: list) -> ReferenceIndex:
+        index = ReferenceIndex(objects, time.monotonic())
+        self._indexes[scope] = index
+        self._loads[scope] = self._loads.get(scope, 0) + 1
+        return index
+
+    @staticmethod
+    def _not_found(scope: str, key: int | str) -> EasyvereinAPINotFoundException:
+        return EasyvereinAPINotFoundException(f"{DESCRIPTIONS[scope]} {key!r} not found")
+
+
+class ReferenceData(BaseReferenceData):
+    """
+    Loads all custom fields (including their select options) and all member groups in a few paginated calls and
+    keeps them indexed by ID and name, so helpers like `ensure_set` and `add_to_group` don't have to look them
+    up for every call.
+
+    Data is reloaded once it is older than `ttl` seconds, after any write request to its endpoint made by this
+    client, and when a lookup doesn't find an object, as it might have been created in the meantime. Lookups
+    that don't find an object reload the data at most once every `reload_interval` seconds.
+    """
+
+    def __init__(self, api: EasyvereinAPI, ttl: float = 300.0, reload_interval: float = 10.0):
+        super().__init__(ttl, reload_interval)
+        self.api = api
+        self._lock = threading.Lock()
+
+    def custom_fields(self, refresh: bool = False) -> ReferenceIndex[CustomField]:
+        """
+        Returns all custom fields, loading them if required
+
+        Args:
+            refresh: Reload the custom fields even if the loaded ones are still valid
+        """
+        return self._load(CUSTOM_FIELD_SCOPE, refresh)
+
+    def member_groups(self, refresh: bool = False) -> ReferenceIndex[MemberGroup]:
+        """
+        Returns all member groups, loading them if required
+
+        Args:
+            refresh: Reload the member groups even if the loaded ones are still valid
+        """
+        return self._load(MEMBER_GROUP_SCOPE, refresh)
+
+    def custom_field(self, key: int | str, refresh: bool = False) -> CustomField:
+        """
+        Returns the custom field with the given ID or name. Raises `EasyvereinAPINotFoundException` if there is
+        no such custom field.
+        """
+        return self._find(CUSTOM_FIELD_SCOPE, key, refresh)
+
+    def member_group(self, key: int | str, refresh: bool = False) -> MemberGroup:
+        """
+        Returns the member group with the given ID or name. Raises `EasyvereinAPINotFoundException` if there is
+        no such member group.
+        """
+        return self._find(MEMBER_GROUP_SCOPE, key, refresh)
+
+    def refresh(self) -> None:
+        """
+        Loads all reference data right away, e.g. when starting a batch job
+        """
+        self.custom_fields(refresh=True)
+        self.member_groups(refresh=True)
+
+    def _find(self, scope: str, key: int | str, refresh: bool) -> Any:
+        loads = self._loads.get(scope, 0)
+        found = self._load(scope, refresh).find(key)
+        if found is None and self._loads.get(scope, 0) == loads and self.may_reload(scope):
+            # The object might have been created since the data was loaded
+            found = self._load(scope, True).find(key)
+        if found is None:
+            raise self._not_found(scope, key)
+        return found
+
+    def _load(self, scope: str, refresh: bool) -> ReferenceIndex:
+        # Only one thread loads the data, all others wait for it and use the result
+        loads = self._loads.get(scope, 0)
+        with self._lock:
+            index = self._valid_index(scope)
+            if index is not None and (not refresh or self._loads[scope] != loads):
+                return index
+            if scope == CUSTOM_FIELD_SCOPE:
+                objects: list = self.api.custom_field.get_all(query=CUSTOM_FIELD_QUERY, limit_per_page=100)
+            else:
+                objects = self.api.member_group.get_all(query=MEMBER_GROUP_QUERY, limit_per_page=100)
+            return self._store(scope, objects)
+
+
+class AsyncReferenceData(BaseReferenceData):
+    """
+    Asynchronous version of `ReferenceData`
+    """
+
+    def __init__(self, api: AsyncEasyvereinAPI, ttl: float = 300.0, reload_interval: float = 10.0):
+        super().__init__(ttl, reload_interval)
+        self.api = api
+        self._lock = asyncio.Lock()
+
+    async def custom_fields(self, refresh: bool = False) -> ReferenceIndex[CustomField]:
+        """
+        Returns all custom fields, loading them if required. See `ReferenceData.custom_fields`.
+        """
+        return await self._load(CUSTOM_FIELD_SCOPE, refresh)
+
+    async def member_groups(self, refresh: bool = False) -> ReferenceIndex[MemberGroup]:
+        """
+        Returns all member groups, loading them if required. See `ReferenceData.member_groups`.
+        """
+        return await self._load(MEMBER_GROUP_SCOPE, refresh)
+
+    async def custom_field(self, key: int | str, refresh: bool = False) -> CustomField:
+        """
+        Returns the custom field with the given ID or name. See `ReferenceData.custom_field`.
+        """
+        return await self._find(CUSTOM_FIELD_SCOPE, key, refresh)
+
+    async def member_group(self, key: int | str, refresh: bool = False) -> MemberGroup:
+        """
+        Returns the member group with the given ID or name. See `ReferenceData.member_group`.
+        """
+        return await self._find(MEMBER_GROUP_SCOPE, key, refresh)
+
+    async def refresh(self) -> None:
+        """
+        Loads all reference data right away, e.g. when starting a batch job
+        """
+        await self.custom_fields(refresh=True)
+        await self.member_groups(refresh=True)
+
+    async def _find(self, scope: str, key: int | str, refresh: bool) -> Any:
+        loads = self._loads.get(scope, 0)
+        found = (await self._load(scope, refresh)).find(key)
+        if found is None and self._loads.get(scope, 0) == loads and self.may_reload(scope):
+            # The object might have been created since the data was loaded
+            found = (await self._load(scope, True)).find(key)
+        if found is None:
+            raise self._not_found(scope, key)
+        return found
+
+    async def _load(self, scope: str, refresh: bool) -> ReferenceIndex:
+        loads = self._loads.get(scope, 0)
+        async with self._lock:
+            index = self._valid_index(scope)
+            if index is not None and (not refresh or self._loads[scope] != loads):
+                return index
+            if scope == CUSTOM_FIELD_SCOPE:
+                objects: list = await self.api.custom_field.get_all(query=CUSTOM_FIELD_QUERY, limit_per_page=100)
+            else:
+                objects = await self.api.member_group.get_all(query=MEMBER_GROUP_QUERY, limit_per_page=100)
+            return self._store(scope, objects)
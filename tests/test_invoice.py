@@ -3,12 +3,11 @@ from typing import Generator
 
 import pytest
 from _pytest.fixtures import FixtureRequest
-from easyverein import EasyvereinAPI
+from easyverein import EasyvereinAPI, Ref
 from easyverein.core.exceptions import EasyvereinAPIException
 from easyverein.models.invoice import Invoice, InvoiceCreate, InvoiceUpdate
 from easyverein.models.invoice_item import InvoiceItem, InvoiceItemCreate
 from easyverein.models.member import Member
-from pydantic_core import Url
 from requests.structures import CaseInsensitiveDict
 
 
@@ -213,7 +212,7 @@ class TestInvoices:
         assert isinstance(invoice, Invoice)
         assert invoice.invNumber == invoice_model.invNumber
         assert invoice.isDraft is False
-        assert isinstance(invoice.path, Url)
+        assert isinstance(invoice.path, Ref)
 
         # Delete invoice again
         ev_connection.invoice.delete(invoice, delete_from_recycle_bin=True)
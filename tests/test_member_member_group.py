@@ -1,7 +1,6 @@
 import pytest
-from easyverein import EasyvereinAPI, EasyvereinAPIException
+from easyverein import EasyvereinAPI, EasyvereinAPIException, Ref
 from easyverein.models import Member, MemberGroup, MemberGroupCreate, MemberMemberGroup
-from pydantic_core import Url
 
 
 @pytest.fixture(scope="class")
@@ -37,10 +36,12 @@ class TestMemberMemberGroup:
         # Add them to the group
         group_membership = ev_connection.member.member_group(example_member.id).add_to_group(group)
         assert isinstance(group_membership, MemberMemberGroup)
-        assert isinstance(group_membership.userObject, Url)
-        assert isinstance(group_membership.memberGroup, Url)
-        assert str(group_membership.userObject).endswith(str(example_member.id))
-        assert str(group_membership.memberGroup).endswith(str(group.id))
+        assert isinstance(group_membership.userObject, Ref)
+        assert isinstance(group_membership.memberGroup, Ref)
+        assert group_membership.userObject.endpoint == "member"
+        assert group_membership.userObject.id == example_member.id
+        assert group_membership.memberGroup.endpoint == "member-group"
+        assert group_membership.memberGroup.id == group.id
         assert group_membership.id
 
         # Billing is not active by default
@@ -52,10 +53,12 @@ class TestMemberMemberGroup:
         # Fetch the group membership again
         group_membership = ev_connection.member.member_group(example_member.id).get_group_membership(group)
         assert group_membership is not None
-        assert isinstance(group_membership.userObject, Url)
-        assert isinstance(group_membership.memberGroup, Url)
-        assert str(group_membership.userObject).endswith(str(example_member.id))
-        assert str(group_membership.memberGroup).endswith(str(group.id))
+        assert isinstance(group_membership.userObject, Ref)
+        assert isinstance(group_membership.memberGroup, Ref)
+        assert group_membership.userObject.endpoint == "member"
+        assert group_membership.userObject.id == example_member.id
+        assert group_membership.memberGroup.endpoint == "member-group"
+        assert group_membership.memberGroup.id == group.id
         assert group_membership.id
         assert group_membership.paymentActive
 
@@ -71,10 +74,12 @@ class TestMemberMemberGroup:
             MemberMemberGroup(userObject=example_member.id, memberGroup=group.id)
         )
         assert isinstance(group_membership, MemberMemberGroup)
-        assert isinstance(group_membership.userObject, Url)
-        assert isinstance(group_membership.memberGroup, Url)
-        assert str(group_membership.userObject).endswith(str(example_member.id))
-        assert str(group_membership.memberGroup).endswith(str(group.id))
+        assert isinstance(group_membership.userObject, Ref)
+        assert isinstance(group_membership.memberGroup, Ref)
+        assert group_membership.userObject.endpoint == "member"
+        assert group_membership.userObject.id == example_member.id
+        assert group_membership.memberGroup.endpoint == "member-group"
+        assert group_membership.memberGroup.id == group.id
         assert group_membership.id
 
         # Check that the member now is in the group
@@ -93,10 +98,12 @@ class TestMemberMemberGroup:
         # Add the member to the group
         group_membership = ev_connection.member.member_group(example_member.id).add_to_group(group)
         assert isinstance(group_membership, MemberMemberGroup)
-        assert isinstance(group_membership.userObject, Url)
-        assert isinstance(group_membership.memberGroup, Url)
-        assert str(group_membership.userObject).endswith(str(example_member.id))
-        assert str(group_membership.memberGroup).endswith(str(group.id))
+        assert isinstance(group_membership.userObject, Ref)
+        assert isinstance(group_membership.memberGroup, Ref)
+        assert group_membership.userObject.endpoint == "member"
+        assert group_membership.userObject.id == example_member.id
+        assert group_membership.memberGroup.endpoint == "member-group"
+        assert group_membership.memberGroup.id == group.id
         assert group_membership.id
 
         # Add the member to the group again
@@ -1,9 +1,81 @@
 """Conftest for unit tests - no API connection required."""
 
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import pytest
+import requests
+from easyverein import EasyvereinAPI
+from requests.adapters import BaseAdapter
+
+BASE_URL = "https://easyverein.test/api/"
+
+
+class MockAdapter(BaseAdapter):
+    """
+    Transport adapter returning queued responses instead of talking to the network.
+
+    Responses are matched in the order they were added, every sent request is recorded in `requests`
+    and its timeout in `timeouts`.
+    Alternatively, a `handler` can be set that computes the response for each request.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.responses: list[tuple[int, Any, dict[str, str]]] = []
+        self.requests: list[requests.PreparedRequest] = []
+        self.timeouts: list[Any] = []
+        self.handler: Callable[[requests.PreparedRequest], tuple[int, Any, dict[str, str]]] | None = None
+
+    def add(self, body: Any = None, status_code: int = 200, headers: dict[str, str] | None = None):
+        self.responses.append((status_code, body, headers or {}))
+
+    def json(self, index: int = -1) -> Any:
+        """Returns the decoded JSON body of a sent request, the last one by default"""
+        body = self.requests[index].body
+        assert body is not None
+        return json.loads(body)
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        self.timeouts.append(kwargs.get("timeout"))
+        status_code, body, headers = self.handler(request) if self.handler else self.responses.pop(0)
+        if isinstance(body, Exception):
+            raise body
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.request = request
+        response.url = request.url
+        response.headers.update(headers)
+        if body is None:
+            response._content = b""
+        elif isinstance(body, bytes):
+            response._content = body
+        else:
+            response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
 
 
 @pytest.fixture(scope="module", autouse=True)
 def _clear_wastebaskets():
     """Override parent conftest fixture - no-op for unit tests."""
     pass
+
+
+@pytest.fixture
+def mock_adapter() -> MockAdapter:
+    return MockAdapter()
+
+
+@pytest.fixture
+def ev_mock(mock_adapter: MockAdapter) -> Iterator[EasyvereinAPI]:
+    """EasyvereinAPI instance whose session is served by the mock adapter"""
+    session = requests.Session()
+    session.mount("https://", mock_adapter)
+    with EasyvereinAPI("test-token", base_url=BASE_URL, session=session) as api:
+        yield api
@@ -0,0 +1,147 @@
+"""Unit tests for the asynchronous client (no API connection required)."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+from easyverein import AsyncEasyvereinAPI, EasyvereinAPINotFoundException
+from easyverein.core.client import BaseEasyvereinClient
+from easyverein.models import Member, MemberGroupCreate
+
+from .conftest import BASE_URL
+
+
+def make_api(handler) -> AsyncEasyvereinAPI:
+    return AsyncEasyvereinAPI(
+        "test-token", base_url=BASE_URL, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+class TestAsyncClient:
+    def test_get_by_id(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"id": 42, "membershipNumber": "M42"})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.member.get_by_id(42)
+
+        member = asyncio.run(run())
+        assert isinstance(member, Member)
+        assert member.membershipNumber == "M42"
+        assert seen[0].headers["Authorization"] == "Bearer test-token"
+        assert str(seen[0].url) == f"{BASE_URL}v2.0/member/42"
+
+    def test_get_by_id_reduces_pages(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"count": 1, "next": None, "results": [{"id": 42, "membershipNumber": "M42"}]}
+            )
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.member.get_by_id(42)
+
+        member = asyncio.run(run())
+        assert isinstance(member, Member)
+        assert member.membershipNumber == "M42"
+
+    def test_get_all_follows_pages(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params.get("page") == "2":
+                return httpx.Response(200, json={"count": 2, "next": None, "results": [{"id": 2}]})
+            return httpx.Response(200, json={"count": 2, "next": f"{request.url}&page=2", "results": [{"id": 1}]})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.member.get_all(limit_per_page=1)
+
+        assert [m.id for m in asyncio.run(run())] == [1, 2]
+
+    def test_concurrent_requests(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            member_id = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"id": member_id})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await asyncio.gather(*(api.member.get_by_id(i) for i in range(1, 51)))
+
+        assert [m.id for m in asyncio.run(run())] == list(range(1, 51))
+
+    def test_create_sends_json(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "POST"
+            return httpx.Response(201, json={"id": 7, **json.loads(request.content)})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.member_group.create(MemberGroupCreate(name="Group", short="G", color="#ffffff"))
+
+        group = asyncio.run(run())
+        assert group.id == 7
+        assert group.short == "G"
+
+    def test_not_found(self):
+        async def run():
+            async with make_api(lambda request: httpx.Response(404)) as api:
+                await api.member.get_by_id(1)
+
+        with pytest.raises(EasyvereinAPINotFoundException):
+            asyncio.run(run())
+
+    def test_async_token_refresh_callback(self):
+        refreshed = []
+
+        async def callback():
+            refreshed.append(True)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": 1}, headers={"tokenRefreshNeeded": "True"})
+
+        async def run():
+            api = AsyncEasyvereinAPI(
+                "test-token",
+                base_url=BASE_URL,
+                token_refresh_callback=callback,
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            async with api:
+                await api.member.get_by_id(1)
+
+        asyncio.run(run())
+        assert refreshed == [True]
+
+    def test_get_all_parallel(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            ids = list(range((page - 1) * 10 + 1, min(page * 10, 45) + 1))
+            next_url = f"{BASE_URL}v2.0/member?limit=10&page={page + 1}" if page * 10 < 45 else None
+            return httpx.Response(200, json={"count": 45, "next": next_url, "results": [{"id": i} for i in ids]})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.member.get_all(limit_per_page=10, max_workers=3)
+
+        assert [m.id for m in asyncio.run(run())] == list(range(1, 46))
+
+    def test_iter_all(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("page", "1"))
+            next_url = f"{BASE_URL}v2.0/member?limit=1&page={page + 1}" if page < 3 else None
+            return httpx.Response(200, json={"count": 3, "next": next_url, "results": [{"id": page}]})
+
+        async def run():
+            async with make_api(handler) as api:
+                return [m.id async for m in api.member.iter_all(limit_per_page=1)]
+
+        assert asyncio.run(run()) == [1, 2, 3]
+
+    def test_base_client_is_abstract(self):
+        with pytest.raises(TypeError):
+            BaseEasyvereinClient("test-token", "v2.0", BASE_URL, logging.getLogger("easyverein"))  # type: ignore[abstract]
@@ -0,0 +1,422 @@
+"""Unit tests for the response cache (no API connection required)."""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+from easyverein import AsyncEasyvereinAPI, EasyvereinAPI, EasyvereinAPIException, MemoryCache, SQLiteCache
+from easyverein.core.cache import ResponseCache, ValidatorStore, cache_scope
+from easyverein.models import MemberUpdate
+
+from .conftest import BASE_URL, MockAdapter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("easyverein.core.cache.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("easyverein.core.cache.time.time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def cache() -> MemoryCache:
+    return MemoryCache(max_entries=10, ttl=30)
+
+
+@pytest.fixture
+def ev_cached(mock_adapter: MockAdapter, cache: MemoryCache):
+    session = requests.Session()
+    session.mount("https://", mock_adapter)
+    with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, cache=cache) as api:
+        yield api
+
+
+class TestMemoryCache:
+    def test_entries_expire(self, clock: FakeClock, cache: MemoryCache):
+        cache.set("a", b"1", "member")
+
+        clock.now = 29
+        assert cache.get("a") == b"1"
+        clock.now = 30
+        assert cache.get("a") is None
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
+
+    def test_least_recently_used_entries_are_evicted(self, clock: FakeClock):
+        cache = MemoryCache(max_entries=2, ttl=30)
+        cache.set("a", b"1", "member")
+        cache.set("b", b"2", "member")
+        cache.get("a")
+        cache.set("c", b"3", "member")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+        assert len(cache) == 2
+
+    def test_invalidate_scope(self, cache: MemoryCache):
+        cache.set("a", b"1", "member")
+        cache.set("b", b"2", "member-group")
+
+        cache.invalidate("member")
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"2"
+        assert cache.stats.invalidations == 1
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            MemoryCache(max_entries=0)
+        with pytest.raises(ValueError):
+            MemoryCache(ttl=0)
+
+    def test_scope(self):
+        assert cache_scope(f"{BASE_URL}v2.0/member/1?query={{id}}") == "member"
+        assert cache_scope(f"{BASE_URL}v2.0/member/1/custom-fields/2") == "member"
+        assert cache_scope(f"{BASE_URL}v2.0/wastebasket/member/1") == "member"
+        assert cache_scope(f"{BASE_URL}v2.0/member-group?limit=10") == "member-group"
+
+    def test_base_class_is_abstract(self):
+        with pytest.raises(TypeError):
+            ResponseCache()  # type: ignore[abstract]
+
+
+class TestSQLiteCache:
+    @pytest.fixture
+    def sqlite_cache(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db", max_entries=10, ttl=30)
+        yield cache
+        cache.close()
+
+    def test_entries_expire(self, clock: FakeClock, sqlite_cache: SQLiteCache):
+        sqlite_cache.set("a", b"1", "member")
+
+        clock.now = 29
+        assert sqlite_cache.get("a") == b"1"
+        clock.now = 30
+        assert sqlite_cache.get("a") is None
+        assert len(sqlite_cache) == 0
+        assert (sqlite_cache.stats.hits, sqlite_cache.stats.misses, sqlite_cache.stats.evictions) == (1, 1, 1)
+
+    def test_least_recently_used_entries_are_evicted(self, clock: FakeClock, tmp_path):
+        cache = SQLiteCache(tmp_path / "cache.db", max_entries=2, ttl=30)
+        cache.set("a", b"1", "member")
+        clock.now = 1
+        cache.set("b", b"2", "member")
+        clock.now = 2
+        cache.get("a")
+        clock.now = 3
+        cache.set("c", b"3", "member")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+        assert len(cache) == 2
+        cache.close()
+
+    def test_shared_between_instances(self, tmp_path):
+        first = SQLiteCache(tmp_path / "cache.db")
+        second = SQLiteCache(tmp_path / "cache.db")
+        body = b'{"results": []}' * 100
+
+        first.set("a", body, "custom-field")
+        first.set("b", b"2", "member-group")
+        assert second.get("a") == body
+        second.invalidate("member-group")
+        assert first.get("b") is None
+
+        first.close()
+        second.close()
+
+    def test_bodies_are_compressed(self, sqlite_cache: SQLiteCache):
+        body = b'{"id": 1, "name": "Group"}' * 100
+        sqlite_cache.set("a", body, "member-group")
+
+        stored = sqlite_cache._connection.execute("SELECT content FROM responses").fetchone()[0]
+        assert len(stored) < len(body) / 10
+        assert sqlite_cache.get("a") == body
+
+    def test_persisted_across_clients(self, tmp_path, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1, "name": "Group"})
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+
+        for _ in range(2):
+            cache = SQLiteCache(tmp_path / "cache.db")
+            with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, cache=cache) as api:
+                assert api.member_group.get_by_id(1).name == "Group"
+            cache.close()
+
+        assert len(mock_adapter.requests) == 1
+
+
+class TestCachedClient:
+    def test_get_by_id_is_served_from_cache(self, ev_cached: EasyvereinAPI, mock_adapter: MockAdapter, cache):
+        mock_adapter.add({"id": 1, "membershipNumber": "M1"})
+
+        first = ev_cached.member.get_by_id(1, query="{id,membershipNumber}")
+        second = ev_cached.member.get_by_id(1, query="{id,membershipNumber}")
+
+        assert len(mock_adapter.requests) == 1
+        assert first == second
+        assert first is not second
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_key_includes_query_and_filters(self, ev_cached: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = lambda request: (200, {"count": 1, "next": None, "results": [{"id": 1}]}, {})
+
+        ev_cached.member.get(query="{id}")
+        ev_cached.member.get(query="{id,membershipNumber}")
+        ev_cached.member.get(query="{id}", limit=5)
+        ev_cached.member.get(query="{id}")
+
+        assert len(mock_adapter.requests) == 3
+
+    def test_writes_invalidate_endpoint(self, ev_cached: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1, "membershipNumber": "M1"})
+        mock_adapter.add({"id": 2, "name": "Group"})
+        mock_adapter.add({"id": 1, "membershipNumber": "M2"})
+        mock_adapter.add({"id": 1, "membershipNumber": "M2"})
+
+        ev_cached.member.get_by_id(1)
+        ev_cached.member_group.get_by_id(2)
+        ev_cached.member.update(1, MemberUpdate(membershipNumber="M2"))
+
+        assert ev_cached.member.get_by_id(1).membershipNumber == "M2"
+        ev_cached.member_group.get_by_id(2)
+        assert len(mock_adapter.requests) == 4
+
+    def test_failed_writes_invalidate_endpoint(
+        self, ev_cached: EasyvereinAPI, mock_adapter: MockAdapter, cache: MemoryCache
+    ):
+        mock_adapter.add({"id": 1})
+        mock_adapter.add(requests.ConnectionError("connection reset"))
+
+        ev_cached.member.get_by_id(1)
+        with pytest.raises(requests.ConnectionError):
+            ev_cached.member.delete(1)
+
+        assert len(cache) == 0
+
+    def test_errors_are_not_cached(self, ev_cached: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"detail": "error"}, status_code=500)
+        mock_adapter.add({"count": 0, "next": None, "results": []})
+
+        with pytest.raises(EasyvereinAPIException):
+            ev_cached.member.get()
+        ev_cached.member.get()
+
+        assert len(mock_adapter.requests) == 2
+
+    def test_async_client(self, cache: MemoryCache):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.method == "PATCH":
+                return httpx.Response(200, json={"id": 1})
+            return httpx.Response(200, json={"id": 1, "membershipNumber": f"M{len(seen)}"})
+
+        async def run():
+            transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncEasyvereinAPI("test-token", base_url=BASE_URL, http_client=transport, cache=cache) as api:
+                first = await api.member.get_by_id(1)
+                second = await api.member.get_by_id(1)
+                await api.member.update(1, MemberUpdate(membershipNumber="M3"))
+                third = await api.member.get_by_id(1)
+                return first, second, third
+
+        first, second, third = asyncio.run(run())
+        assert first.membershipNumber == second.membershipNumber == "M1"
+        assert third.membershipNumber == "M3"
+        assert len(seen) == 3
+
+    def test_refresh_token_is_not_cached(self, mock_adapter: MockAdapter, cache: MemoryCache):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        tokens: list[str] = []
+
+        def handler(request: requests.PreparedRequest):
+            tokens.append(f"token-{len(tokens) + 1}")
+            return 200, {"Bearer": tokens[-1]}, {"ETag": '"v1"'}
+
+        mock_adapter.handler = handler
+        with EasyvereinAPI(
+            "test-token", base_url=BASE_URL, session=session, cache=cache, conditional_requests=True
+        ) as api:
+            first = api.refresh_token()
+            second = api.refresh_token()
+
+        assert first.Bearer == "token-1"
+        assert second.Bearer == api.c.api_key == "token-2"
+        assert "If-None-Match" not in mock_adapter.requests[1].headers
+        assert len(cache) == 0
+
+    def test_async_refresh_token_is_not_cached(self, cache: MemoryCache):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"Bearer": f"token-{len(seen)}"}, headers={"ETag": '"v1"'})
+
+        async def run():
+            transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncEasyvereinAPI(
+                "test-token",
+                base_url=BASE_URL,
+                http_client=transport,
+                cache=cache,
+                conditional_requests=True,
+                coalesce_reads=True,
+            ) as api:
+                return await asyncio.gather(api.refresh_token(), api.refresh_token())
+
+        first, second = asyncio.run(run())
+        assert {first.Bearer, second.Bearer} == {"token-1", "token-2"}
+        assert len(seen) == 2
+
+
+class TestConditionalRequests:
+    @pytest.fixture
+    def ev_conditional(self, mock_adapter: MockAdapter):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, conditional_requests=True) as api:
+            yield api
+
+    @staticmethod
+    def etag_handler(request: requests.PreparedRequest):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        page = {"count": 1, "next": None, "results": [{"id": 1, "membershipNumber": "M1"}]}
+        return 200, page, {"ETag": '"v1"', "Last-Modified": "Sun, 18 Oct 2026 10:00:00 GMT"}
+
+    def test_not_modified(self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = self.etag_handler
+
+        first = ev_conditional.member.get_all(query="{id,membershipNumber}")
+        second = ev_conditional.member.get_all(query="{id,membershipNumber}")
+
+        assert "If-None-Match" not in mock_adapter.requests[0].headers
+        assert mock_adapter.requests[1].headers["If-None-Match"] == '"v1"'
+        assert mock_adapter.requests[1].headers["If-Modified-Since"] == "Sun, 18 Oct 2026 10:00:00 GMT"
+        assert second == first
+
+    def test_unchanged_results_are_copies(self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = self.etag_handler
+
+        first = ev_conditional.member.get_all()
+        first[0].membershipNumber = "changed"
+        first.clear()
+        second = ev_conditional.member.get_all()
+        second[0].membershipNumber = "changed"
+        third = ev_conditional.member.get_all()
+
+        assert third[0].membershipNumber == "M1"
+        assert third[0] is not second[0]
+
+    def test_unchanged_body_is_not_decoded_again(
+        self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter, monkeypatch
+    ):
+        page = {"count": 1, "next": None, "results": [{"id": 1, "membershipNumber": "M1"}]}
+        mock_adapter.add(page)
+        mock_adapter.add(page)
+        mock_adapter.add({**page, "results": [{"id": 1, "membershipNumber": "M2"}]})
+        validated = []
+        original = ev_conditional.c._validate_json
+
+        def validate_json(*args):
+            validated.append(1)
+            return original(*args)
+
+        monkeypatch.setattr(ev_conditional.c, "_validate_json", validate_json)
+
+        first = ev_conditional.member.get_all()
+        second = ev_conditional.member.get_all()
+        third = ev_conditional.member.get_all()
+
+        assert "If-None-Match" not in mock_adapter.requests[1].headers
+        assert len(validated) == 2
+        assert second == first
+        assert third[0].membershipNumber == "M2"
+
+    def test_write_responses_are_not_remembered(self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1, "membershipNumber": "M2"}, headers={"ETag": '"v2"'})
+        mock_adapter.add({"id": 1, "membershipNumber": "M2"})
+
+        ev_conditional.member.update(1, MemberUpdate(membershipNumber="M2"))
+        ev_conditional.member.get_by_id(1)
+
+        assert "If-None-Match" not in mock_adapter.requests[-1].headers
+
+    def test_writes_invalidate(self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = self.etag_handler
+        ev_conditional.member.get_all()
+        mock_adapter.handler = None
+        mock_adapter.add({"id": 1})
+        mock_adapter.add({"count": 0, "next": None, "results": []})
+
+        ev_conditional.member.update(1, MemberUpdate(membershipNumber="M2"))
+        ev_conditional.member.get_all()
+
+        assert "If-None-Match" not in mock_adapter.requests[-1].headers
+
+    def test_streamed_pages_are_not_remembered(self, ev_conditional: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = self.etag_handler
+
+        list(ev_conditional.member.iter_all())
+
+        assert ev_conditional.c.validators is not None
+        assert len(ev_conditional.c.validators) == 0
+
+    def test_store_is_bounded_by_size(self):
+        store = ValidatorStore(max_bytes=10)
+
+        store.store(f"{BASE_URL}v2.0/member/1", {}, b"12345")
+        store.store(f"{BASE_URL}v2.0/member/2", {}, b"12345")
+        store.store(f"{BASE_URL}v2.0/member/2", {}, b"123456")
+
+        assert store.get(f"{BASE_URL}v2.0/member/1") is None
+        assert store.get(f"{BASE_URL}v2.0/member/2") is not None
+        store.store(f"{BASE_URL}v2.0/member/3", {}, b"12345678901")
+        assert len(store) == 0
+
+    def test_disabled_by_default(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = self.etag_handler
+        ev_mock.member.get_all()
+        ev_mock.member.get_all()
+
+        assert "If-None-Match" not in mock_adapter.requests[1].headers
+
+    def test_async_client(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json={"id": 1, "membershipNumber": "M1"}, headers={"ETag": '"v1"'})
+
+        async def run():
+            transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncEasyvereinAPI(
+                "test-token", base_url=BASE_URL, http_client=transport, conditional_requests=True
+            ) as api:
+                return await api.member.get_by_id(1), await api.member.get_by_id(1)
+
+        first, second = asyncio.run(run())
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert second == first
+        assert second is not first
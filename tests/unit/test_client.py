@@ -0,0 +1,332 @@
+"""Unit tests for the HTTP client (no API connection required)."""
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from easyverein import EasyvereinAPI, EasyvereinAPIException, Ref
+from easyverein.models import Member, QueryModel
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+
+from .conftest import BASE_URL, MockAdapter
+
+
+class TestSession:
+    def test_session_is_reused(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1})
+        mock_adapter.add({"id": 2})
+
+        ev_mock.member.get_by_id(1)
+        ev_mock.member.get_by_id(2)
+
+        assert len(mock_adapter.requests) == 2
+        assert all(r.headers["Authorization"] == "Bearer test-token" for r in mock_adapter.requests)
+        assert mock_adapter.requests[0].url == f"{BASE_URL}v2.0/member/1"
+
+    def test_api_key_change_updates_session_header(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1})
+
+        ev_mock.c.api_key = "new-token"
+        ev_mock.member.get_by_id(1)
+
+        assert mock_adapter.requests[0].headers["Authorization"] == "Bearer new-token"
+
+    def test_custom_headers_are_merged(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1})
+
+        ev_mock.c._do_request("get", f"{BASE_URL}v2.0/member/1", headers={"X-Test": "1"})
+
+        assert mock_adapter.requests[0].headers["X-Test"] == "1"
+        assert mock_adapter.requests[0].headers["Authorization"] == "Bearer test-token"
+
+    def test_pool_settings_are_mounted(self):
+        api = EasyvereinAPI("test-token", pool_connections=3, pool_maxsize=7)
+
+        adapter = api.c.session.get_adapter("https://easyverein.com/api/")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 7
+
+    def test_context_manager_closes_owned_session(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+        with EasyvereinAPI("test-token") as api:
+            session = api.c.session
+
+        assert closed == [session]
+
+    def test_external_session_is_left_open(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+        with EasyvereinAPI("test-token", session=requests.Session()):
+            pass
+
+        assert closed == []
+
+
+def query_params(request: requests.PreparedRequest) -> dict[str, list[str]]:
+    assert request.url is not None
+    return parse_qs(urlsplit(request.url).query)
+
+
+def paginated_handler(total: int):
+    """Returns a mock handler serving `total` members, paginated according to the limit and page parameters"""
+
+    def handler(request: requests.PreparedRequest):
+        params = query_params(request)
+        limit = int(params["limit"][0])
+        page = int(params.get("page", ["1"])[0])
+        ids = list(range((page - 1) * limit + 1, min(page * limit, total) + 1))
+        has_next = page * limit < total
+        next_url = f"{BASE_URL}v2.0/member?limit={limit}&showCount=True&page={page + 1}" if has_next else None
+        return 200, {"count": total, "next": next_url, "results": [{"id": i} for i in ids]}, {}
+
+    return handler
+
+
+class TestPagination:
+    def test_sequential(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = paginated_handler(25)
+
+        members = ev_mock.member.get_all(limit_per_page=10)
+
+        assert [m.id for m in members] == list(range(1, 26))
+        assert len(mock_adapter.requests) == 3
+
+    def test_parallel_returns_pages_in_order(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = paginated_handler(95)
+
+        members = ev_mock.member.get_all(limit_per_page=10, max_workers=4)
+
+        assert [m.id for m in members] == list(range(1, 96))
+        assert len(mock_adapter.requests) == 10
+        pages = sorted(int(query_params(r).get("page", ["1"])[0]) for r in mock_adapter.requests)
+        assert pages == list(range(1, 11))
+
+    def test_parallel_single_page(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = paginated_handler(5)
+
+        members = ev_mock.member.get_all(limit_per_page=10, max_workers=4)
+
+        assert [m.id for m in members] == list(range(1, 6))
+        assert len(mock_adapter.requests) == 1
+
+    def test_iter_all_fetches_pages_lazily(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.handler = paginated_handler(25)
+
+        iterator = ev_mock.member.iter_all(limit_per_page=10)
+        assert len(mock_adapter.requests) == 0
+
+        first = next(iterator)
+        assert first.id == 1
+        assert len(mock_adapter.requests) == 1
+
+        rest = list(iterator)
+        assert [m.id for m in rest] == list(range(2, 26))
+        assert len(mock_adapter.requests) == 3
+
+
+class TestHandleResponse:
+    def test_results_are_passed_through(self, ev_mock: EasyvereinAPI):
+        results = [{"id": i} for i in range(3)]
+
+        reply = ev_mock.c._handle_response((200, results))
+
+        assert reply.result is results
+        assert reply.count == 3
+        assert reply.response_code == 200
+
+    def test_paginated_dict(self, ev_mock: EasyvereinAPI):
+        reply = ev_mock.c._handle_response((200, {"count": 42, "next": None, "results": [{"id": 1}]}))
+
+        assert reply.result == [{"id": 1}]
+        assert reply.count == 42
+
+
+class TestRawValidation:
+    @pytest.fixture
+    def no_json_decoding(self, monkeypatch):
+        def loads(data):
+            raise AssertionError("Response must be validated from the raw bytes")
+
+        monkeypatch.setattr("easyverein.core.client.loads", loads)
+
+    def test_get_by_id(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_json_decoding):
+        mock_adapter.add({"id": 1, "membershipNumber": ""})
+
+        member = ev_mock.member.get_by_id(1)
+
+        assert isinstance(member, Member)
+        assert member.membershipNumber is None
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            [{"id": 1, "membershipNumber": "7"}],
+            {"count": 1, "next": None, "results": [{"id": 1, "membershipNumber": "7"}]},
+        ],
+    )
+    def test_get_by_id_reduces_lists_and_pages(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, body):
+        mock_adapter.add(body)
+
+        member = ev_mock.member.get_by_id(1)
+
+        assert isinstance(member, Member)
+        assert member.id == 1
+        assert member.membershipNumber == "7"
+
+    def test_get_all(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_json_decoding):
+        mock_adapter.handler = paginated_handler(25)
+
+        members = ev_mock.member.get_all(limit_per_page=10, max_workers=2)
+
+        assert [m.id for m in members] == list(range(1, 26))
+        assert all(isinstance(m, Member) for m in members)
+
+    def test_get_returns_count(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_json_decoding):
+        mock_adapter.add({"count": 42, "next": None, "results": [{"id": 1}]})
+
+        members, count = ev_mock.member.get()
+
+        assert count == 42
+        assert members[0].id == 1
+
+    def test_invalid_row_still_raises_validation_error(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"count": 2, "next": None, "results": [{"id": 1}, {"id": -5}]})
+
+        with pytest.raises(ValidationError):
+            ev_mock.member.get()
+
+    def test_query_narrows_validation(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_json_decoding):
+        mock_adapter.add({"count": 1, "next": None, "results": [{"id": 1, "membershipNumber": "7"}]})
+
+        members = ev_mock.member.get_all(query="{id,membershipNumber}", narrow=True)
+
+        assert isinstance(members[0], Member)
+        assert isinstance(members[0], QueryModel)
+        assert members[0].membershipNumber == "7"
+
+    def test_query_is_not_narrowed_by_default(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"count": 1, "next": None, "results": [{"id": 1, "membershipNumber": "7"}]})
+        mock_adapter.add({"id": 1, "membershipNumber": "7"})
+
+        members = ev_mock.member.get_all(query="{id,membershipNumber}")
+        member = ev_mock.member.get_by_id(1, query="{id,membershipNumber}")
+
+        assert type(members[0]) is Member
+        assert type(member) is Member
+        assert member == Member(id=1, membershipNumber="7")
+
+    def test_error_response_is_not_validated(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"detail": "Invalid query"}, status_code=400)
+
+        with pytest.raises(EasyvereinAPIException, match="Invalid query"):
+            ev_mock.member.get_all()
+
+
+class TestTrustedReads:
+    @pytest.fixture
+    def no_validation(self, monkeypatch):
+        def validate(*args, **kwargs):
+            raise AssertionError("Trusted reads must not be validated")
+
+        monkeypatch.setattr("easyverein.modules.mixins.helper.list_adapter", validate)
+        monkeypatch.setattr("easyverein.core.client.page_adapter", validate)
+
+    def test_per_call(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_validation):
+        mock_adapter.add({"count": 2, "next": None, "results": [{"id": 1}, {"id": -5, "membershipNumber": ""}]})
+
+        members, count = ev_mock.member.get(trusted=True)
+
+        assert count == 2
+        assert [m.id for m in members] == [1, -5]
+        assert all(isinstance(m, Member) for m in members)
+        assert members[1].membershipNumber is None
+
+    def test_client_default(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, no_validation):
+        ev_mock.c.trusted_reads = True
+        mock_adapter.handler = paginated_handler(25)
+
+        assert [m.id for m in ev_mock.member.get_all(limit_per_page=10, max_workers=2)] == list(range(1, 26))
+        assert [m.id for m in ev_mock.member.iter_all(limit_per_page=10)] == list(range(1, 26))
+
+    def test_call_overrides_client_default(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        ev_mock.c.trusted_reads = True
+        mock_adapter.add({"count": 1, "next": None, "results": [{"id": -5}]})
+
+        with pytest.raises(ValidationError):
+            ev_mock.member.get(trusted=False)
+
+
+class TestRawReads:
+    @pytest.fixture
+    def members_page(self, mock_adapter: MockAdapter):
+        mock_adapter.add(
+            {
+                "count": 2,
+                "next": None,
+                "results": [
+                    {"id": 1, "_isChairman": True, "contactDetails": {"id": 3, "_isCompany": False}},
+                    {"id": 2, "membershipNumber": ""},
+                ],
+            }
+        )
+
+    def test_raw(self, ev_mock: EasyvereinAPI, members_page):
+        members = ev_mock.member.get_all(raw=True)
+
+        assert members == [
+            {"id": 1, "isChairman": True, "contactDetails": {"id": 3, "isCompany": False}},
+            {"id": 2, "membershipNumber": ""},
+        ]
+
+    def test_as_columns(self, ev_mock: EasyvereinAPI, members_page):
+        columns, count = ev_mock.member.get(as_columns=True)
+
+        assert count == 2
+        assert columns == {
+            "id": [1, 2],
+            "isChairman": [True, None],
+            "contactDetails": [{"id": 3, "isCompany": False}, None],
+            "membershipNumber": [None, ""],
+        }
+
+    def test_invalid_data_is_returned(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"count": 1, "next": None, "results": [{"id": -5, "unknown": 1}]})
+
+        assert ev_mock.member.get_all(raw=True) == [{"id": -5, "unknown": 1}]
+
+
+class TestReferences:
+    def test_resolve(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1, "contactDetails": f"{BASE_URL}v2.0/contact-details/3"})
+        mock_adapter.add({"id": 3, "familyName": "Doe"})
+
+        member = ev_mock.member.get_by_id(1)
+        assert isinstance(member.contactDetails, Ref)
+        contact_details = member.contactDetails.resolve(ev_mock, query="{id,familyName}")
+
+        assert contact_details.familyName == "Doe"
+        assert mock_adapter.requests[1].url == f"{BASE_URL}v2.0/contact-details/3?query=%7Bid,familyName%7D"
+
+    def test_resolve_nested_endpoint(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 9, "value": "x"})
+
+        Ref(f"{BASE_URL}v2.0/member/4/custom-fields/9").resolve(ev_mock)
+
+        assert mock_adapter.requests[0].url == f"{BASE_URL}v2.0/member/4/custom-fields/9"
+
+    def test_unknown_endpoint(self, ev_mock: EasyvereinAPI):
+        with pytest.raises(EasyvereinAPIException):
+            Ref(f"{BASE_URL}v2.0/organization/1").resolve(ev_mock)
+
+    def test_trusted_reads(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"count": 1, "next": None, "results": [{"id": 1, "org": f"{BASE_URL}v2.0/organization/2"}]})
+
+        members, _ = ev_mock.member.get(trusted=True)
+
+        assert isinstance(members[0].org, Ref)
+        assert members[0].org.id == 2
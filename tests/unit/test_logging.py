@@ -0,0 +1,89 @@
+"""Unit tests for the request logging (no API connection required)."""
+
+import logging
+
+import pytest
+import requests
+from easyverein import EasyvereinAPI, EasyvereinAPINotFoundException
+from easyverein.core.client import MAX_LOGGED_PAYLOAD, LazyPayload
+
+from .conftest import BASE_URL, MockAdapter
+
+
+class ExplodingPayload:
+    def __str__(self):
+        raise AssertionError("Payload must not be rendered")
+
+
+class TestLazyPayload:
+    def test_short_payload(self):
+        assert str(LazyPayload({"id": 1})) == "{'id': 1}"
+
+    def test_long_payload_is_truncated(self):
+        text = str(LazyPayload("x" * (MAX_LOGGED_PAYLOAD * 2)))
+
+        assert text.startswith("x" * MAX_LOGGED_PAYLOAD + "...")
+        assert text.endswith(f"({MAX_LOGGED_PAYLOAD * 2} characters in total)")
+
+    def test_not_rendered_if_debug_disabled(self):
+        logger = logging.getLogger("easyverein.test")
+        logger.setLevel(logging.INFO)
+
+        logger.debug("Payload: %s", LazyPayload(ExplodingPayload()))
+
+
+class TestLogRequests:
+    def test_disabled_request_logging(self, mock_adapter: MockAdapter, caplog):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        mock_adapter.add({"id": 1})
+        mock_adapter.add(None, status_code=404)
+
+        with caplog.at_level(logging.DEBUG, logger="easyverein"):
+            with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, log_requests=False) as api:
+                api.member.get_by_id(1)
+                with pytest.raises(EasyvereinAPINotFoundException):
+                    api.member.get_by_id(2)
+
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+
+    def test_enabled_request_logging(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, caplog):
+        mock_adapter.add({"id": 1})
+
+        with caplog.at_level(logging.DEBUG, logger="easyverein"):
+            ev_mock.member.get_by_id(1)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert "Fetching member object with id 1 from API" in messages
+        assert any(m.startswith("Received raw data: ") for m in messages)
+
+    def test_logger_configuration_applies(self, mock_adapter: MockAdapter, caplog):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        logger = logging.getLogger("easyverein")
+        dropped = logging.Filter("other")
+
+        def get_missing():
+            mock_adapter.add(None, status_code=404)
+            with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, log_requests=False) as api:
+                with pytest.raises(EasyvereinAPINotFoundException):
+                    api.member.get_by_id(2)
+
+        # The handler captures everything, so only the level of the given logger drops the warning
+        caplog.set_level(logging.DEBUG)
+        logger.setLevel(logging.ERROR)
+        get_missing()
+        assert caplog.records == []
+
+        # Filters of the given logger apply as well
+        logger.setLevel(logging.DEBUG)
+        logger.addFilter(dropped)
+        try:
+            get_missing()
+        finally:
+            logger.removeFilter(dropped)
+            logger.setLevel(logging.NOTSET)
+        assert caplog.records == []
+
+        get_missing()
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
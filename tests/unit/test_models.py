@@ -1,8 +1,32 @@
 """Unit tests for Pydantic model validation (no API connection required)."""
 
+import datetime
+import pickle
+import subprocess
+import sys
+import warnings
+
 import pytest
+from easyverein import Ref
+from easyverein.models import (
+    Booking,
+    BookingUpdate,
+    ContactDetails,
+    CustomFieldSelectOption,
+    Invoice,
+    Member,
+    MemberGroupCreate,
+    QueryModel,
+    SlimModel,
+    query_model,
+    slim_type,
+    to_slim,
+)
 from easyverein.models.member_group import MemberGroup
+from easyverein.models.query import parse_query
+from easyverein.modules.mixins.helper import construct_model, list_adapter, parse_models
 from pydantic import ValidationError
+from pydantic_core import Url
 
 
 class TestMemberGroupModel:
@@ -33,3 +57,342 @@ class TestMemberGroupModel:
         """Test that paymentInterval rejects zero."""
         with pytest.raises(ValidationError):
             MemberGroup(paymentInterval=0)
+
+
+class TestParseModels:
+    def test_list_is_validated_in_one_call(self):
+        members = parse_models([{"id": 1}, {"id": 2, "short": ""}], MemberGroup)
+
+        assert [m.id for m in members] == [1, 2]
+        assert all(isinstance(m, MemberGroup) for m in members)
+        assert list_adapter(MemberGroup) is list_adapter(MemberGroup)
+
+    def test_single_object_and_none(self):
+        assert parse_models({"id": 1}, MemberGroup).id == 1
+        assert parse_models(None, MemberGroup) is None
+
+
+class TestConstructModel:
+    def test_aliases_nested_models_and_dates(self):
+        data = {
+            "id": 1,
+            "joinDate": "2020-01-01",
+            "_isChairman": True,
+            "membershipNumber": "",
+            "contactDetails": {"firstName": "Jane", "dateOfBirth": "1990-01-31", "companyName": ""},
+            "memberGroups": ["https://easyverein.com/api/v2.0/member-group/1"],
+        }
+
+        member = construct_model(data, Member)
+
+        assert member.id == 1
+        assert member.joinDate == datetime.date(2020, 1, 1)
+        assert member.isChairman is True
+        assert member.membershipNumber is None
+        assert isinstance(member.contactDetails, ContactDetails)
+        assert member.contactDetails.firstName == "Jane"
+        assert member.contactDetails.dateOfBirth == datetime.date(1990, 1, 31)
+        assert member.contactDetails.companyName is None
+        assert member.memberGroups == ["https://easyverein.com/api/v2.0/member-group/1"]
+        assert member.model_fields_set == {
+            "id",
+            "joinDate",
+            "isChairman",
+            "membershipNumber",
+            "contactDetails",
+            "memberGroups",
+        }
+
+    def test_invalid_data_is_not_validated(self):
+        member = construct_model({"id": -5, "joinDate": "not a date"}, Member)
+
+        assert member.id == -5
+        assert member.joinDate == "not a date"
+
+    @pytest.mark.parametrize(
+        ("model", "data"),
+        [
+            (
+                Member,
+                {
+                    "id": 1,
+                    "_profilePicture": "https://easyverein.com/media/picture.png",
+                    "joinDate": "2020-01-01",
+                    "paymentAmount": 12,
+                    "contactDetails": {"id": 2, "balance": 0, "privateEmail": "jane@example.com"},
+                    "memberGroups": ["https://easyverein.com/api/v2.0/member-group/1"],
+                },
+            ),
+            (
+                Invoice,
+                {
+                    "id": 3,
+                    "date": "2024-05-01",
+                    "totalPrice": 100,
+                    "taxRate": 19.5,
+                    "path": "https://easyverein.com/api/v2.0/invoice/3/file",
+                    "relatedBookings": ["https://easyverein.com/api/v2.0/booking/4"],
+                },
+            ),
+            (Booking, {"id": 4, "amount": -20, "date": "2024-05-01T12:30:00+02:00", "paymentDifference": 0}),
+        ],
+    )
+    def test_same_types_as_validation(self, model, data):
+        trusted = construct_model(data, model)
+        validated = model.model_validate(data)
+
+        assert trusted == validated
+        for name in validated.model_fields_set:
+            assert type(getattr(trusted, name)) is type(getattr(validated, name)), name
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert trusted.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+    def test_trusted_parse_models(self):
+        members = parse_models([{"id": 1}, {"id": 2}], MemberGroup, trusted=True)
+
+        assert [m.id for m in members] == [1, 2]
+        assert all(isinstance(m, MemberGroup) for m in members)
+        assert parse_models({"id": 1}, MemberGroup, trusted=True).id == 1
+
+
+class TestSlimModels:
+    def test_holds_only_set_fields(self):
+        member = Member.model_validate(
+            {"id": 1, "_isChairman": True, "contactDetails": {"id": 2, "firstName": "Jane"}, "memberGroups": []}
+        )
+
+        slim = to_slim(member)
+
+        assert isinstance(slim, SlimModel)
+        assert type(slim) is slim_type(Member, ["id", "isChairman", "contactDetails", "memberGroups"])
+        assert slim.isChairman is True
+        assert slim.contactDetails.firstName == "Jane"
+        assert slim.memberGroups == ()
+        assert not hasattr(slim, "__dict__")
+        with pytest.raises(AttributeError):
+            slim.membershipNumber
+        with pytest.raises(AttributeError):
+            slim.id = 3
+
+    def test_round_trip(self):
+        member = Member.model_validate({"id": 1, "joinDate": "2020-01-01", "contactDetails": {"id": 2}})
+
+        restored = to_slim(member).to_model()
+
+        assert restored == member
+        assert isinstance(restored.contactDetails, ContactDetails)
+        assert restored.model_fields_set == {"id", "joinDate", "contactDetails"}
+
+    def test_pickle(self):
+        slim = to_slim(Member.model_validate({"id": 1, "contactDetails": {"id": 2}}))
+
+        assert pickle.loads(pickle.dumps(slim)) == slim
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="no fields"):
+            slim_type(Member, ["id", "unknown"])
+
+
+class TestQueryModel:
+    def test_parse_query(self):
+        assert parse_query("{id, _isChairman, contactDetails{id,familyName}}") == (
+            ("id", None),
+            ("_isChairman", None),
+            ("contactDetails", (("id", None), ("familyName", None))),
+        )
+
+    @pytest.mark.parametrize("query", ["", "id", "{}", "{id", "{*}", "{id,-membershipNumber}", "{id,unknown}"])
+    def test_unsupported_queries_use_full_model(self, query):
+        assert query_model(Member, query) is Member
+
+    def test_only_selected_fields_are_validated(self):
+        model = query_model(Member, "{id,_isChairman,membershipNumber,contactDetails{id,dateOfBirth}}")
+
+        member = model.model_validate(
+            {
+                "id": 1,
+                "_isChairman": True,
+                "membershipNumber": "",
+                "joinDate": "invalid",
+                "contactDetails": {"id": 2, "dateOfBirth": "1990-01-31", "privateEmail": "invalid"},
+            }
+        )
+
+        assert isinstance(member, Member)
+        assert isinstance(member, QueryModel)
+        assert isinstance(member.contactDetails, ContactDetails)
+        assert member.isChairman is True
+        assert member.membershipNumber is None
+        assert member.joinDate is None
+        assert member.contactDetails.dateOfBirth == datetime.date(1990, 1, 31)
+        assert member.contactDetails.privateEmail is None
+        assert member.model_fields_set == {"id", "isChairman", "membershipNumber", "contactDetails"}
+
+    def test_selected_fields_are_still_validated(self):
+        model = query_model(Member, "{id,contactDetails{id}}")
+
+        with pytest.raises(ValidationError):
+            model.model_validate({"id": -1})
+        assert model.model_validate({"contactDetails": "https://easyverein.com/api/v2.0/contact-details/1"})
+
+    def test_unselected_required_fields_are_missing(self):
+        option = query_model(CustomFieldSelectOption, "{id}").model_validate({"id": 1})
+
+        assert not hasattr(option, "value")
+        with pytest.raises(AttributeError, match="not queried"):
+            _ = option.value
+
+    def test_assigned_fields_are_dumped(self):
+        model = query_model(Member, "{id,contactDetails{id,firstName}}")
+        member = model.model_validate({"id": 1, "contactDetails": {"id": 2, "firstName": "Jane"}})
+
+        member.isChairman = True
+        member.joinDate = datetime.date(2020, 1, 31)
+        member.contactDetails.familyName = "Doe"
+
+        assert member.model_dump(exclude_unset=True, by_alias=True) == {
+            "id": 1,
+            "contactDetails": {"id": 2, "firstName": "Jane", "familyName": "Doe"},
+            "joinDate": "2020-01-31",
+            "_isChairman": True,
+        }
+        assert member.model_dump(include={"id", "isChairman"}) == {"id": 1, "isChairman": True}
+        assert '"isChairman":true' in member.model_dump_json()
+
+    def test_models_are_cached(self):
+        assert query_model(Member, "{id,membershipNumber}") is query_model(Member, "{ id, membershipNumber }")
+
+    def test_pickle(self):
+        member = query_model(Member, "{id,membershipNumber}").model_validate({"id": 1, "membershipNumber": "1"})
+
+        restored = pickle.loads(pickle.dumps(member))
+
+        assert type(restored) is Member
+        assert restored.membershipNumber == "1"
+        assert restored.model_fields_set == {"id", "membershipNumber"}
+
+
+class TestEmptyStringsToNone:
+    def test_empty_strings_become_none(self):
+        data = {
+            "id": 1,
+            "membershipNumber": "",
+            "paymentAmount": "",
+            "joinDate": "",
+            "profilePicture": "",
+            "contactDetails": {"firstName": "", "salutation": "", "dateOfBirth": "", "privateEmail": ""},
+        }
+
+        member = Member.model_validate(data)
+
+        assert member.membershipNumber is None
+        assert member.paymentAmount is None
+        assert member.joinDate is None
+        assert member.profilePicture is None
+        assert isinstance(member.contactDetails, ContactDetails)
+        assert member.contactDetails.firstName is None
+        assert member.contactDetails.salutation is None
+        assert member.contactDetails.privateEmail is None
+
+    def test_input_is_not_modified(self):
+        data = {"membershipNumber": ""}
+
+        Member.model_validate(data)
+
+        assert data == {"membershipNumber": ""}
+
+    def test_from_json(self):
+        member = Member.model_validate_json(b'{"id": 1, "membershipNumber": "", "joinDate": "2024-01-31"}')
+
+        assert member.membershipNumber is None
+        assert member.joinDate == datetime.date(2024, 1, 31)
+
+    def test_other_values_are_validated(self):
+        assert Member(membershipNumber="M1").membershipNumber == "M1"
+        with pytest.raises(ValidationError):
+            Member.model_validate({"paymentAmount": "abc"})
+
+    def test_create_models_keep_empty_strings(self):
+        assert MemberGroupCreate(name="", short="", color="#ffffff").name == ""
+
+
+class TestReferences:
+    def test_values_are_routed_by_type(self):
+        member = Member.model_validate_json(
+            b'{"org": 1, "contactDetails": "https://easyverein.com/api/v2.0/contact-details/2",'
+            b' "relatedMembers": [3, "https://easyverein.com/api/v2.0/member/4", {"id": 5}]}'
+        )
+
+        assert member.org == 1
+        assert isinstance(member.contactDetails, Ref)
+        assert member.contactDetails == "https://easyverein.com/api/v2.0/contact-details/2"
+        assert member.relatedMembers[0] == 3
+        assert member.relatedMembers[1] == "https://easyverein.com/api/v2.0/member/4"
+        assert isinstance(member.relatedMembers[2], Member)
+        assert member.relatedMembers[2].id == 5
+
+    def test_nested_objects_and_lax_integers(self):
+        member = Member.model_validate({"org": "7", "contactDetails": {"id": 2, "firstName": ""}})
+
+        assert member.org == 7
+        assert isinstance(member.contactDetails, ContactDetails)
+        assert member.contactDetails.firstName is None
+
+    def test_ref_is_parsed_on_access(self):
+        ref = Ref("https://easyverein.com/api/v2.0/member/4/custom-fields/9")
+
+        assert ref.id == 9
+        assert ref.endpoint == "member/4/custom-fields"
+        assert Ref("https://easyverein.com/api/v1.7/contact-details/12/").id == 12
+        with pytest.raises(ValueError):
+            Ref("https://easyverein.com/app/file?path=invoice.pdf").id
+
+    def test_refs_are_serialized_as_strings(self):
+        member = Member.model_validate({"org": "https://easyverein.com/api/v2.0/organization/1"})
+
+        assert member.model_dump_json(include={"org"}) == '{"org":"https://easyverein.com/api/v2.0/organization/1"}'
+        assert pickle.loads(pickle.dumps(member)).org.id == 1
+
+    def test_ref_is_parsed_once(self):
+        ref = Ref("https://easyverein.com/api/v2.0/member/4")
+
+        assert ref.id == 4
+        assert "_parts" in ref.__dict__
+        assert ref.endpoint == "member"
+
+    def test_urls_are_accepted(self):
+        booking = BookingUpdate(bankAccount=Url("https://easyverein.com/api/v2.0/bank-account/3"))
+
+        assert isinstance(booking.bankAccount, Ref)
+        assert booking.bankAccount.id == 3
+        with pytest.raises(ValidationError):
+            BookingUpdate(bankAccount=Url("ftp://easyverein.com/api/v2.0/bank-account/3"))
+
+    def test_paths_may_be_plain_strings(self):
+        assert Invoice(path="/invoices/3.pdf").path == "/invoices/3.pdf"
+        assert isinstance(Invoice(path="https://easyverein.com/api/v2.0/invoice/3/file").path, Ref)
+
+    def test_invalid_references_are_rejected(self):
+        with pytest.raises(ValidationError):
+            Member.model_validate({"contactDetails": "not a reference"})
+
+    def test_rebuilding_keeps_schema(self):
+        schema = ContactDetails.__pydantic_core_schema__["schema"]["fields"]["org"]
+        ContactDetails.model_rebuild(force=True)
+
+        assert ContactDetails.__pydantic_core_schema__["schema"]["fields"]["org"] == schema
+
+
+class TestLazySchemas:
+    def test_import_builds_no_schemas(self):
+        # Runs in a fresh interpreter, as the models used by other tests are already built
+        code = (
+            "import sys, easyverein\n"
+            "from easyverein import models\n"
+            "assert not models.Member.__pydantic_complete__\n"
+            "assert not models.MemberFilter.__pydantic_complete__\n"
+            "assert 'httpx' not in sys.modules\n"
+            "assert models.Member.model_validate({'contactDetails': {'id': 1}}).contactDetails.id == 1\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,121 @@
+"""Unit tests for the client side rate limiter (no API connection required)."""
+
+import threading
+
+import pytest
+from easyverein import EasyvereinAPI, TokenBucket
+
+from .conftest import MockAdapter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr("easyverein.core.rate_limit.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("easyverein.core.rate_limit.time.sleep", clock.sleep)
+    return clock
+
+
+class TestTokenBucket:
+    def test_burst_is_not_delayed(self, clock: FakeClock):
+        bucket = TokenBucket(rate=2, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_requests_are_spaced_after_burst(self, clock: FakeClock):
+        bucket = TokenBucket(rate=2, burst=1)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_bucket_refills(self, clock: FakeClock):
+        bucket = TokenBucket(rate=10, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 0.2
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+
+    def test_pause(self, clock: FakeClock):
+        bucket = TokenBucket(rate=1, burst=5)
+
+        bucket.pause(10)
+
+        assert bucket.reserve() == pytest.approx(11)
+
+    def test_pause_after_idle_time(self, clock: FakeClock):
+        bucket = TokenBucket(rate=1, burst=5)
+        bucket.reserve()
+
+        # The request answered with 429 took a while, which must not shorten the pause
+        clock.now += 3
+        bucket.pause(10)
+
+        assert bucket.reserve() == pytest.approx(11)
+
+    def test_thread_safety(self):
+        bucket = TokenBucket(rate=1000, burst=1)
+        waits: list[float] = []
+
+        def reserve():
+            for _ in range(100):
+                waits.append(bucket.reserve())
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Every reservation got its own slot, so the longest wait covers all 400 requests
+        assert max(waits) == pytest.approx(0.399, abs=0.05)
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestClientRateLimit:
+    def test_limiter_is_shared_by_all_endpoints(self, clock: FakeClock, ev_mock: EasyvereinAPI, mock_adapter):
+        ev_mock.c.rate_limiter = TokenBucket(rate=1, burst=1)
+        mock_adapter.add({"id": 1})
+        mock_adapter.add({"id": 2})
+
+        ev_mock.member.get_by_id(1)
+        ev_mock.invoice.get_by_id(2)
+
+        assert clock.now == pytest.approx(1)
+
+    def test_rate_limit_parameter(self):
+        api = EasyvereinAPI("test-token", rate_limit=5, rate_limit_burst=10)
+
+        assert isinstance(api.c.rate_limiter, TokenBucket)
+        assert api.c.rate_limiter.rate == 5
+        assert api.c.rate_limiter.burst == 10
+
+    def test_429_pauses_limiter(self, clock: FakeClock, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, monkeypatch):
+        monkeypatch.setattr("easyverein.core.client.sleep", clock.sleep)
+        ev_mock.c.rate_limiter = TokenBucket(rate=1, burst=5)
+        ev_mock.c.auto_retry = True
+        mock_adapter.add(None, status_code=429, headers={"Retry-After": "3"})
+        mock_adapter.add({"id": 1})
+
+        ev_mock.member.get_by_id(1)
+
+        assert ev_mock.c.rate_limiter.reserve() > 0
@@ -0,0 +1,163 @@
+"""Unit tests for the reference data registry (no API connection required)."""
+
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+import requests
+from easyverein import AsyncEasyvereinAPI, EasyvereinAPI, EasyvereinAPINotFoundException
+from easyverein.core.types import Ref
+from easyverein.models import CustomFieldUpdate
+
+from .conftest import BASE_URL, MockAdapter
+
+CUSTOM_FIELDS = [
+    {"id": 1, "name": "Shirt size", "settings_type": "s", "selectOptions": [{"id": 11, "value": "M"}]},
+    {"id": 2, "name": "Nickname", "settings_type": "t", "selectOptions": []},
+]
+MEMBER_GROUPS = [{"id": 5, "name": "Board", "short": "BRD"}]
+
+
+class FakeApi:
+    """Serves custom fields, member groups and member sub-resources, recording every request by method and path"""
+
+    def __init__(self):
+        self.custom_fields = [dict(field) for field in CUSTOM_FIELDS]
+        self.calls: list[tuple[str, str]] = []
+
+    def page(self, results: list) -> dict:
+        return {"count": len(results), "next": None, "results": results}
+
+    def respond(self, method: str, path: str, body: bytes | None) -> tuple[int, dict | None]:
+        path = path.rstrip("/")
+        self.calls.append((method, path))
+        if path.endswith("/custom-field") and method == "GET":
+            return 200, self.page(self.custom_fields)
+        if path.endswith("/member-group") and method == "GET":
+            return 200, self.page(MEMBER_GROUPS)
+        if path.endswith("/custom-fields") or path.endswith("/groups"):
+            if method == "GET":
+                return 200, self.page([])
+            return 201, {"id": 100, **json.loads(body or b"{}")}
+        return 200, {"id": 1}
+
+    def handler(self, request: requests.PreparedRequest) -> tuple[int, dict | None, dict[str, str]]:
+        status_code, body = self.respond(request.method or "", urlsplit(request.url).path, request.body)  # type: ignore[arg-type]
+        return status_code, body, {}
+
+    def count(self, method: str, suffix: str) -> int:
+        return sum(1 for call in self.calls if call[0] == method and call[1].endswith(suffix))
+
+
+@pytest.fixture
+def fake_api(mock_adapter: MockAdapter) -> FakeApi:
+    fake_api = FakeApi()
+    mock_adapter.handler = fake_api.handler
+    return fake_api
+
+
+@pytest.fixture
+def now(monkeypatch) -> list[float]:
+    now = [0.0]
+    monkeypatch.setattr("easyverein.modules.reference_data.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestReferenceData:
+    def test_ensure_set_loads_custom_fields_once(self, ev_mock: EasyvereinAPI, fake_api: FakeApi):
+        for member_id in range(5):
+            ev_mock.member.custom_field(member_id).ensure_set(2, "Jay")
+
+        assert fake_api.count("GET", "/custom-field") == 1
+        assert fake_api.count("POST", "/custom-fields") == 5
+
+    def test_ensure_set_by_name(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, mock_adapter: MockAdapter):
+        ev_mock.member.custom_field(1).ensure_set("Shirt size", "M")
+
+        assert mock_adapter.json() == {"customField": 1, "selectedOptions": [11]}
+
+    def test_new_select_options_are_loaded(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, now: list[float]):
+        ev_mock.member.custom_field(1).ensure_set(1, "M")
+        fake_api.custom_fields[0]["selectOptions"].append({"id": 12, "value": "L"})
+        now[0] = 10
+
+        ev_mock.member.custom_field(1).ensure_set(1, "L")
+        with pytest.raises(ValueError):
+            ev_mock.member.custom_field(1).ensure_set(1, "XL")
+        assert fake_api.count("GET", "/custom-field") == 2
+
+    def test_unknown_custom_field(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, now: list[float]):
+        ev_mock.reference_data.custom_fields()
+        fake_api.custom_fields.append({"id": 3, "name": "New", "settings_type": "t"})
+        now[0] = 10
+
+        # Reloaded, as the custom field might have been created since the custom fields were loaded
+        ev_mock.member.custom_field(1).ensure_set(3, "value")
+        assert fake_api.count("GET", "/custom-field") == 2
+
+        # Reloaded at most once every reload_interval seconds
+        for _ in range(3):
+            with pytest.raises(EasyvereinAPINotFoundException):
+                ev_mock.member.custom_field(1).ensure_set(4, "value")
+        assert fake_api.count("GET", "/custom-field") == 2
+        now[0] = 20
+        with pytest.raises(EasyvereinAPINotFoundException):
+            ev_mock.member.custom_field(1).ensure_set(4, "value")
+        assert fake_api.count("GET", "/custom-field") == 3
+
+    def test_add_to_group(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, mock_adapter: MockAdapter):
+        ev_mock.member.member_group(1).add_to_group("Board")
+        assert mock_adapter.json()["memberGroup"] == 5
+
+        with pytest.raises(EasyvereinAPINotFoundException):
+            ev_mock.member.member_group(1).add_to_group("Unknown")
+        assert fake_api.count("GET", "/member-group") == 1
+        assert fake_api.count("POST", "/groups") == 1
+
+    def test_add_to_group_by_id(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, mock_adapter: MockAdapter):
+        # IDs and references are sent as they are, without loading the member groups
+        ev_mock.member.member_group(1).add_to_group(6)
+        assert mock_adapter.json()["memberGroup"] == 6
+        ev_mock.member.member_group(1).add_to_group(Ref(f"{BASE_URL}v2.0/member-group/7"))
+        assert mock_adapter.json()["memberGroup"] == 7
+
+        assert fake_api.count("GET", "/member-group") == 0
+        assert fake_api.count("POST", "/groups") == 2
+
+    def test_writes_invalidate(self, ev_mock: EasyvereinAPI, fake_api: FakeApi):
+        ev_mock.reference_data.refresh()
+        ev_mock.custom_field.update(2, CustomFieldUpdate(name="Alias"))
+        fake_api.custom_fields[1]["name"] = "Alias"
+
+        assert ev_mock.reference_data.custom_field("Alias").id == 2
+        assert ev_mock.reference_data.member_group("Board").id == 5
+        assert fake_api.count("GET", "/custom-field") == 2
+        assert fake_api.count("GET", "/member-group") == 1
+
+    def test_ttl(self, ev_mock: EasyvereinAPI, fake_api: FakeApi, now: list[float]):
+        ev_mock.reference_data.custom_fields()
+        now[0] = 299
+        ev_mock.reference_data.custom_fields()
+        now[0] = 300
+        assert len(ev_mock.reference_data.custom_fields()) == 2
+        assert fake_api.count("GET", "/custom-field") == 2
+
+    def test_async_ensure_set(self):
+        fake_api = FakeApi()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status_code, body = fake_api.respond(request.method, request.url.path, request.content)
+            return httpx.Response(status_code, json=body)
+
+        async def run():
+            transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncEasyvereinAPI("test-token", base_url=BASE_URL, http_client=transport) as api:
+                await asyncio.gather(*(api.member.custom_field(i).ensure_set("Shirt size", "M") for i in range(5)))
+                await api.member.member_group(1).add_to_group("Board")
+
+        asyncio.run(run())
+        assert fake_api.count("GET", "/custom-field") == 1
+        assert fake_api.count("POST", "/custom-fields") == 5
+        assert fake_api.count("POST", "/groups") == 1
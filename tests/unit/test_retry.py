@@ -0,0 +1,122 @@
+"""Unit tests for the retry policy (no API connection required)."""
+
+import io
+
+import pytest
+import requests
+from easyverein import EasyvereinAPI, EasyvereinAPIException, EasyvereinAPITooManyRetriesException, RetryPolicy
+
+from .conftest import BASE_URL, MockAdapter
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setattr("easyverein.core.client.sleep", sleeps.append)
+    return sleeps
+
+
+class TestRetryPolicy:
+    def test_backoff_without_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+        assert all(0 <= policy.delay(3) <= 4 for _ in range(100))
+
+    def test_retry_after_is_respected(self):
+        assert RetryPolicy().delay(1, retry_after=42) == 42
+        assert RetryPolicy(respect_retry_after=False, jitter=False).delay(1, retry_after=42) == 0.5
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.should_retry("get", 1, 503)
+        assert policy.should_retry("post", 1, 429)
+        assert not policy.should_retry("post", 1, 503)
+        assert not policy.should_retry("post", 1, None)
+        assert not policy.should_retry("get", 1, 500)
+        assert not policy.should_retry("get", 3, 503)
+
+
+class TestClientRetries:
+    def test_no_retry_by_default(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        mock_adapter.add(None, status_code=429, headers={"Retry-After": "5"})
+
+        with pytest.raises(EasyvereinAPITooManyRetriesException) as e:
+            ev_mock.member.get_by_id(1)
+
+        assert e.value.retry_after == 5
+        assert sleeps == []
+
+    def test_auto_retry_honours_retry_after(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.auto_retry = True
+        mock_adapter.add(None, status_code=429, headers={"Retry-After": "5"})
+        mock_adapter.add({"id": 1})
+
+        assert ev_mock.member.get_by_id(1).id == 1
+        assert sleeps == [5]
+
+    def test_gives_up_after_max_attempts(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.retry_policy = RetryPolicy(max_attempts=3, jitter=False)
+        for _ in range(3):
+            mock_adapter.add(None, status_code=429, headers={"Retry-After": "1"})
+
+        with pytest.raises(EasyvereinAPITooManyRetriesException):
+            ev_mock.member.get_by_id(1)
+
+        assert len(mock_adapter.requests) == 3
+        assert sleeps == [1, 1]
+
+    def test_server_errors_are_retried_with_backoff(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.retry_policy = RetryPolicy(backoff_base=1, jitter=False)
+        mock_adapter.add(None, status_code=503)
+        mock_adapter.add(None, status_code=502)
+        mock_adapter.add({"id": 1})
+
+        assert ev_mock.member.get_by_id(1).id == 1
+        assert sleeps == [1, 2]
+
+    def test_server_errors_are_returned_once_exhausted(self, ev_mock: EasyvereinAPI, mock_adapter, sleeps):
+        ev_mock.c.retry_policy = RetryPolicy(max_attempts=2, jitter=False)
+        mock_adapter.add(None, status_code=503)
+        mock_adapter.add({"detail": "unavailable"}, status_code=503)
+
+        with pytest.raises(EasyvereinAPIException, match="503"):
+            ev_mock.member.get_by_id(1)
+
+    def test_post_is_not_retried_on_server_error(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.auto_retry = True
+        mock_adapter.add({"detail": "unavailable"}, status_code=503)
+
+        with pytest.raises(EasyvereinAPIException):
+            ev_mock.c._handle_response(ev_mock.c._do_request("post", f"{BASE_URL}v2.0/member", data={"a": 1}), 201)
+
+        assert len(mock_adapter.requests) == 1
+
+    def test_connection_errors_are_retried(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.auto_retry = True
+        mock_adapter.add(requests.ConnectionError("connection reset"))
+        mock_adapter.add({"id": 1})
+
+        assert ev_mock.member.get_by_id(1).id == 1
+        assert len(sleeps) == 1
+
+    def test_connection_errors_are_raised_without_policy(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add(requests.ConnectionError("connection reset"))
+
+        with pytest.raises(requests.ConnectionError):
+            ev_mock.member.get_by_id(1)
+
+    def test_files_are_rewound(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, sleeps):
+        ev_mock.c.auto_retry = True
+        mock_adapter.add(None, status_code=429, headers={"Retry-After": "0"})
+        mock_adapter.add({"id": 1})
+        file = io.BytesIO(b"content")
+
+        ev_mock.c._do_request("patch", f"{BASE_URL}v2.0/invoice/1", files={"path": file})  # type: ignore
+
+        assert all(isinstance(r.body, bytes) and b"content" in r.body for r in mock_adapter.requests)
@@ -0,0 +1,41 @@
+"""Unit tests for the JSON serializer (no API connection required)."""
+
+import json
+
+import pytest
+from easyverein import EasyvereinAPI
+from easyverein.core import serializer
+from easyverein.models import MemberGroupCreate
+
+from .conftest import MockAdapter
+
+DATA = {"name": "Gruppe Ä", "ids": [1, 2, 3], "nested": {"flag": True, "value": None, "price": 1.5}}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(serializer, "orjson", None)
+    return request.param
+
+
+class TestSerializer:
+    def test_round_trip(self, backend):
+        encoded = serializer.dumps(DATA)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == DATA
+        assert serializer.loads(encoded) == DATA
+
+    def test_invalid_json_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            serializer.loads(b"<html>")
+
+    def test_client_encodes_body(self, backend, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1, "name": "Gruppe Ä"}, status_code=201)
+
+        group = ev_mock.member_group.create(MemberGroupCreate(name="Gruppe Ä", short="GA", color="#ffffff"))
+
+        assert group.id == 1
+        assert mock_adapter.requests[0].headers["Content-Type"] == "application/json"
+        assert mock_adapter.json(0) == {"name": "Gruppe Ä", "short": "GA", "color": "#ffffff"}
@@ -0,0 +1,149 @@
+"""Unit tests for the coalescing of identical concurrent requests (no API connection required)."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests
+from easyverein import AsyncEasyvereinAPI, EasyvereinAPI, EasyvereinAPITimeoutException
+from easyverein.core.single_flight import SingleFlight
+
+from .conftest import BASE_URL, MockAdapter
+
+
+def run_concurrently(leader, follower, followers: int = 4) -> list:
+    """
+    Runs `leader` in a thread and, once it signalled that it is running by setting the `started` event passed to
+    it, runs `followers` calls of `follower` in other threads. The leader should then wait for the `release` event.
+    Returns all results, the leader's first.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=followers + 1) as executor:
+        first = executor.submit(leader, started, release)
+        assert started.wait(5)
+        others = [executor.submit(follower) for _ in range(followers)]
+        # Give the followers time to join the call in flight
+        time.sleep(0.1)
+        release.set()
+        return [first.result(), *(other.result() for other in others)]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        calls = []
+
+        def leader(started: threading.Event, release: threading.Event):
+            def func():
+                calls.append(1)
+                started.set()
+                release.wait(5)
+                return object()
+
+            return flight.do("key", func)
+
+        results = run_concurrently(leader, lambda: flight.do("key", lambda: calls.append(2)))
+
+        assert calls == [1]
+        assert all(result is results[0] for result in results)
+        # Once the call is done, the next one runs again
+        assert flight.do("key", lambda: 3) == 3
+
+    def test_concurrent_calls_share_exception(self):
+        flight = SingleFlight()
+
+        def leader(started: threading.Event, release: threading.Event):
+            def func():
+                started.set()
+                release.wait(5)
+                raise ValueError("failed")
+
+            try:
+                return flight.do("key", func)
+            except ValueError as e:
+                return e
+
+        def follower():
+            try:
+                return flight.do("key", lambda: None)
+            except ValueError as e:
+                return e
+
+        results = run_concurrently(leader, follower)
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_waiting_respects_deadline(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(flight.do, "key", func)
+            assert started.wait(5)
+            with pytest.raises(EasyvereinAPITimeoutException), EasyvereinAPI.deadline(0.05):
+                flight.do("key", lambda: None)
+            release.set()
+
+
+class TestCoalescedClient:
+    def test_concurrent_get_by_id(self, mock_adapter: MockAdapter):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        api = EasyvereinAPI("test-token", base_url=BASE_URL, session=session, coalesce_reads=True)
+        started = threading.Event()
+        release = threading.Event()
+
+        def handler(request: requests.PreparedRequest):
+            started.set()
+            release.wait(5)
+            return 200, {"id": 42, "membershipNumber": "M42"}, {}
+
+        mock_adapter.handler = handler
+
+        def get_member():
+            return api.member.get_by_id(42, query="{id,membershipNumber}")
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            first = executor.submit(get_member)
+            assert started.wait(5)
+            others = [executor.submit(get_member) for _ in range(4)]
+            time.sleep(0.1)
+            release.set()
+            results = [first.result(), *(other.result() for other in others)]
+
+        assert len(mock_adapter.requests) == 1
+        assert all(result is results[0] for result in results)
+        assert results[0].membershipNumber == "M42"
+
+        # Requests that don't overlap are sent separately
+        api.member.get_by_id(42, query="{id,membershipNumber}")
+        assert len(mock_adapter.requests) == 2
+
+    def test_async_client(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"id": 42, "membershipNumber": "M42"})
+
+        async def run():
+            transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncEasyvereinAPI(
+                "test-token", base_url=BASE_URL, http_client=transport, coalesce_reads=True
+            ) as api:
+                members = await asyncio.gather(*(api.member.get_by_id(42) for _ in range(5)))
+                await api.member.get_by_id(42)
+                return members
+
+        members = asyncio.run(run())
+        assert len(seen) == 2
+        assert all(member is members[0] for member in members)
@@ -0,0 +1,127 @@
+"""Unit tests for request timeouts and deadlines (no API connection required)."""
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+from easyverein import AsyncEasyvereinAPI, EasyvereinAPI, EasyvereinAPITimeoutException, RetryPolicy
+from easyverein.models import InvoiceCreate, InvoiceItemCreate
+
+from .conftest import BASE_URL, MockAdapter
+from .test_client import paginated_handler
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """Fake monotonic clock, advance it by changing the only list element"""
+    now = [1000.0]
+    monkeypatch.setattr("easyverein.core.deadline.monotonic", lambda: now[0])
+    return now
+
+
+class TestTimeouts:
+    def test_default_timeout(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add({"id": 1})
+
+        ev_mock.member.get_by_id(1)
+
+        assert mock_adapter.timeouts == [(10.0, 60.0)]
+
+    def test_custom_timeout(self, mock_adapter: MockAdapter):
+        session = requests.Session()
+        session.mount("https://", mock_adapter)
+        mock_adapter.add({"id": 1})
+
+        with EasyvereinAPI("test-token", base_url=BASE_URL, session=session, timeout=3) as api:
+            api.member.get_by_id(1)
+
+        assert mock_adapter.timeouts == [3]
+
+    def test_transport_timeout_is_wrapped(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        mock_adapter.add(requests.ReadTimeout("read timed out"))
+
+        with pytest.raises(EasyvereinAPITimeoutException) as e:
+            ev_mock.member.get_by_id(1)
+
+        assert isinstance(e.value.__cause__, requests.ReadTimeout)
+        assert isinstance(e.value, TimeoutError)
+
+
+class TestDeadline:
+    def test_deadline_shortens_timeout(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, clock):
+        mock_adapter.add({"id": 1})
+
+        with ev_mock.deadline(5):
+            ev_mock.member.get_by_id(1)
+
+        assert mock_adapter.timeouts == [(5, 5)]
+
+    def test_nested_deadline_cannot_extend(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, clock):
+        mock_adapter.add({"id": 1})
+
+        with ev_mock.deadline(5), ev_mock.deadline(30):
+            ev_mock.member.get_by_id(1)
+
+        assert mock_adapter.timeouts == [(5, 5)]
+
+    def test_expired_deadline_fails_fast(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter):
+        with pytest.raises(EasyvereinAPITimeoutException), ev_mock.deadline(0):
+            ev_mock.member.get_by_id(1)
+
+        assert mock_adapter.requests == []
+
+    def test_deadline_covers_multi_step_helpers(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, clock):
+        def handler(request: requests.PreparedRequest):
+            clock[0] += 2
+            return 201, {"id": len(mock_adapter.requests)}, {}
+
+        mock_adapter.handler = handler
+        items = [InvoiceItemCreate(title=f"Item {i}", quantity=1, unitPrice=1) for i in range(5)]
+
+        with pytest.raises(EasyvereinAPITimeoutException), ev_mock.deadline(5):
+            ev_mock.invoice.create_with_items(InvoiceCreate(invNumber="1", totalPrice=5, receiver="Jane Doe"), items)
+
+        assert len(mock_adapter.requests) == 3
+
+    def test_deadline_stops_retries(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, clock, monkeypatch):
+        monkeypatch.setattr("easyverein.core.client.sleep", lambda _: None)
+        ev_mock.c.retry_policy = RetryPolicy(backoff_base=10, jitter=False)
+        mock_adapter.add(None, status_code=503)
+        mock_adapter.add(None, status_code=503)
+
+        with pytest.raises(EasyvereinAPITimeoutException), ev_mock.deadline(5):
+            ev_mock.member.get_by_id(1)
+
+        assert len(mock_adapter.requests) == 1
+
+    def test_deadline_applies_to_parallel_pages(self, ev_mock: EasyvereinAPI, mock_adapter: MockAdapter, clock):
+        mock_adapter.handler = paginated_handler(95)
+
+        with ev_mock.deadline(20):
+            ev_mock.member.get_all(limit_per_page=10, max_workers=4)
+
+        assert len(mock_adapter.timeouts) == 10
+        assert all(timeout == (10.0, 20) for timeout in mock_adapter.timeouts)
+
+    def test_async_deadline(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            raise httpx.ReadTimeout("read timed out", request=request)
+
+        async def run():
+            api = AsyncEasyvereinAPI(
+                "test-token", base_url=BASE_URL, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+            async with api:
+                with pytest.raises(EasyvereinAPITimeoutException), api.deadline(0):
+                    await api.member.get_by_id(1)
+                assert seen == []
+
+                with pytest.raises(EasyvereinAPITimeoutException):
+                    await api.member.get_by_id(1)
+                assert len(seen) == 1
+
+        asyncio.run(run())